@@ -0,0 +1,141 @@
+"""Fork server running a prepared command once per connection.
+
+The server process imports the modules and prepares the command once, for example validating the optima
+and building the problem. Then it forks a child per connection on a Unix socket, which sees the connection as
+its stdin and stdout, so the command runs as if it was started with the request piped in, with the isolation
+of a process but without the startup of the interpreter and the imports.
+
+A request is sent by writing it to the socket and shutting down the writing side, then reading the response
+until EOF, for example with `socat - UNIX-CONNECT:<path>`, `request` or `python -m opthub_common.forkserver`.
+"""
+
+import logging
+import os
+import signal
+import socket
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from traceback import format_exc
+from types import FrameType
+
+LOGGER = logging.getLogger(__name__)
+
+# Environment variable giving the socket of the fork server
+FORK_SERVER_ENVVAR = "OPTHUB_FORK_SERVER"
+
+# Number of pending connections queued by the server
+BACKLOG = 64
+
+# Size of the chunks of the responses read by the client
+RECV_SIZE = 64 * 1024
+
+
+def _reap_children() -> None:
+    """Wait for the finished children without blocking."""
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        LOGGER.debug("Child %d exited with status %d.", pid, os.waitstatus_to_exitcode(status))
+
+
+def _run_child(connection: socket.socket, handle: Callable[[], None]) -> int:
+    """Run the command in a forked child with the connection as its stdin and stdout.
+
+    Args:
+        connection (socket.socket): accepted connection
+        handle (Callable[[], None]): prepared command
+
+    Returns:
+        int: exit code of the child
+    """
+    os.dup2(connection.fileno(), sys.stdin.fileno())
+    os.dup2(connection.fileno(), sys.stdout.fileno())
+    connection.close()
+    try:
+        handle()
+    except Exception:
+        LOGGER.exception(format_exc())
+        return 1
+    finally:
+        sys.stdout.flush()
+    return 0
+
+
+def serve_fork(path: str | Path, handle: Callable[[], None]) -> None:
+    """Run a prepared command in a forked child for each connection to a Unix socket until SIGTERM or SIGINT.
+
+    The command reads the request from stdin and writes the response to stdout. The children exit
+    without running the cleanup of the server, so anything they change in memory, such as the in-memory
+    entries of an evaluation cache, is dropped with them.
+
+    Args:
+        path (str | Path): Unix socket to listen on, replaced if it exists
+        handle (Callable[[], None]): prepared command
+    """
+    path = Path(path)
+    path.unlink(missing_ok=True)
+
+    def stop(signum: int, frame: FrameType | None) -> None:  # noqa: ARG001
+        raise SystemExit(0)
+
+    previous_handler = signal.signal(signal.SIGTERM, stop)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        server.listen(BACKLOG)
+        LOGGER.info("Serving on %s.", path)
+        try:
+            while True:
+                connection, _ = server.accept()
+                # Nothing buffered before the fork must be written again by the child
+                sys.stdout.flush()
+                sys.stderr.flush()
+                pid = os.fork()
+                if pid == 0:
+                    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                    server.close()
+                    exit_code = 1
+                    try:
+                        exit_code = _run_child(connection, handle)
+                    finally:
+                        os._exit(exit_code)
+                connection.close()
+                _reap_children()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            path.unlink(missing_ok=True)
+            LOGGER.info("Stopped serving on %s.", path)
+
+
+def request(path: str | Path, data: bytes, timeout: float | None = None) -> bytes:
+    """Send a request to a fork server and read its response.
+
+    Args:
+        path (str | Path): Unix socket of the fork server
+        data (bytes): request written to the stdin of the command
+        timeout (float | None): timeout of each operation on the socket in seconds, or None to wait forever
+
+    Returns:
+        bytes: response written to the stdout of the command
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(path))
+        client.sendall(data)
+        client.shutdown(socket.SHUT_WR)
+        chunks = []
+        while chunk := client.recv(RECV_SIZE):
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+if __name__ == "__main__":
+    # The client only uses the standard library, so it starts much faster than the commands it replaces
+    socket_path = sys.argv[1] if len(sys.argv) > 1 else os.environ[FORK_SERVER_ENVVAR]
+    sys.stdout.buffer.write(request(socket_path, sys.stdin.buffer.read()))
@@ -0,0 +1,60 @@
+"""JSON schemas compiled once into cached validators."""
+
+import functools
+import json
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from jsonschema import Draft7Validator, ValidationError
+from jsonschema.exceptions import best_match
+
+
+@functools.cache
+def compile_schema(schema: str) -> Draft7Validator:
+    """Compile a JSON schema into a validator, once per schema.
+
+    Args:
+        schema (str): JSON encoded Draft 7 schema
+
+    Raises:
+        jsonschema.exceptions.SchemaError: if the schema is invalid
+
+    Returns:
+        Draft7Validator: validator of the schema
+    """
+    schema_dict = json.loads(schema)
+    Draft7Validator.check_schema(schema_dict)
+    return Draft7Validator(schema_dict)
+
+
+def validate_schema(instance: Any, schema: str) -> None:  # noqa: ANN401
+    """Validate an instance against a JSON schema with its cached validator.
+
+    The error raised is the same as `jsonschema.validate`, which compiles the schema on each call.
+
+    Args:
+        instance (Any): instance to validate
+        schema (str): JSON encoded Draft 7 schema
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the instance is invalid
+    """
+    error = best_match(compile_schema(schema).iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+def validate_finite(arr: npt.NDArray[Any], name: str) -> None:
+    """Validate the values of a numeric array are finite.
+
+    Args:
+        arr (npt.NDArray[Any]): numeric array
+        name (str): name of the array in the error message
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if a value is NaN or infinite
+    """
+    if not np.all(np.isfinite(arr)):
+        msg = f"The {name} must be finite, but got a non-finite value at index {np.argmin(np.isfinite(arr))}."
+        raise ValidationError(msg)
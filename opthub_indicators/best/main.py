@@ -4,10 +4,12 @@ import json
 import logging
 import math
 import sys
+from functools import partial
 from traceback import format_exc
 
 import click
 
+from opthub_common.forkserver import FORK_SERVER_ENVVAR, serve_fork
 from opthub_indicators.best.scorer import calculate_score
 from opthub_indicators.best.validator import validate_trial_to_score, validate_trials_scored
 
@@ -18,24 +20,23 @@ LOGGER = logging.getLogger(__name__)
 DYNAMODB_NUMBER_MAX = 1e126 - math.ulp(1e126)
 
 
-@click.command(help="The indicator to calculate the best fitness value.")
-@click.option(
-    "-m",
-    "--float-max",
-    type=float,
-    default=DYNAMODB_NUMBER_MAX,
-    envvar="BEST_FLOAT_MAX",
-    help="Worst value.",
-)
-@click.option(
-    "--log-level",
-    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
-    default="INFO",
-    help="Log level.",
-)
-def main(float_max: float, log_level: str) -> None:
-    """Calculate the best fitness value."""
-    logging.basicConfig(level=log_level)
+def write_error(message: str) -> None:
+    """Output an error message as the score.
+
+    Args:
+        message (str): error message
+    """
+    LOGGER.info("Outputting the result...")
+    sys.stdout.write(json.dumps({"score": None, "error": message}))
+    LOGGER.info("...Outputted.")
+
+
+def respond(float_max: float) -> None:
+    """Calculate the best fitness value of the trials given on stdin and output the score to stdout.
+
+    Args:
+        float_max (float): worst value
+    """
     try:
         # Validate the input
         LOGGER.info("Validating the input...")
@@ -60,9 +61,38 @@ def main(float_max: float, log_level: str) -> None:
 
     except Exception as e:
         LOGGER.exception(format_exc())
-        LOGGER.info("Outputting the result...")
-        sys.stdout.write(json.dumps({"score": None, "error": str(e)}))
-        LOGGER.info("...Outputted.")
+        write_error(str(e))
+
+
+@click.command(help="The indicator to calculate the best fitness value.")
+@click.option(
+    "-m",
+    "--float-max",
+    type=float,
+    default=DYNAMODB_NUMBER_MAX,
+    envvar="BEST_FLOAT_MAX",
+    help="Worst value.",
+)
+@click.option(
+    "--fork-server",
+    type=click.Path(dir_okay=False),
+    envvar=FORK_SERVER_ENVVAR,
+    default=None,
+    help="Unix socket to serve on, forking a child to answer each connection like a run of this command.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
+    default="INFO",
+    help="Log level.",
+)
+def main(float_max: float, fork_server: str | None, log_level: str) -> None:
+    """Calculate the best fitness value."""
+    logging.basicConfig(level=log_level)
+    if fork_server is not None:
+        serve_fork(fork_server, partial(respond, float_max))
+    else:
+        respond(float_max)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 """This file defines the schema for the input to the indicator best."""
 
-import json
 from typing import Any, TypedDict
 
 import numpy as np
-from jsonschema import validate
+
+from opthub_common.schema import validate_schema
 
 # Schema to validate the evaluation of the trial to score (used in "current")
 SOLUTION_TO_SCORE_JSONSCHEMA = """{
@@ -67,7 +67,7 @@ def validate_trial_to_score(trial: dict[str, Any]) -> TrialToScore:
     Returns:
         TrialToScore: validated trial to score
     """
-    validate(instance=trial, schema=json.loads(SOLUTION_TO_SCORE_JSONSCHEMA))
+    validate_schema(trial, SOLUTION_TO_SCORE_JSONSCHEMA)
     feasible = trial["feasible"] if trial["feasible"] is not None else is_feasible(trial)
 
     if feasible and trial["objective"] is None:
@@ -85,7 +85,7 @@ def validate_trials_scored(trials: list[dict[str, Any]]) -> list[TrialScored]:
     Returns:
         list[TrialScored]: validated trials scored
     """
-    validate(instance=trials, schema=json.loads(SOLUTIONS_SCORED_JSONSCHEMA))
+    validate_schema(trials, SOLUTIONS_SCORED_JSONSCHEMA)
     return [{"score": trial["score"]} for trial in trials]
 
 
@@ -3,10 +3,12 @@
 import json
 import logging
 import sys
+from functools import partial
 from traceback import format_exc
 
 import click
 
+from opthub_common.forkserver import FORK_SERVER_ENVVAR, serve_fork
 from opthub_indicators.hypervolume.scorer import calculate_score
 from opthub_indicators.hypervolume.validator import (
     validate_ref_point,
@@ -17,43 +19,40 @@ from opthub_indicators.hypervolume.validator import (
 LOGGER = logging.getLogger(__name__)
 
 
-@click.command(help="The indicator to calculate the hyper volume.")
-@click.option(
-    "-r",
-    "--ref-point",
-    type=str,
-    default=None,
-    envvar="HV_REF_POINT",
-    help="Reference point.",
-)
-@click.option(
-    "--log-level",
-    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
-    default="INFO",
-    help="Log level.",
-)
-def main(ref_point: str, log_level: str) -> None:
-    """Calculate the hyper volume."""
-    logging.basicConfig(level=log_level)
-    LOGGER.info(("ref_point: ", ref_point))
+def write_error(message: str) -> None:
+    """Output an error message as the score.
+
+    Args:
+        message (str): error message
+    """
+    LOGGER.info("Outputting the result...")
+    sys.stdout.write(json.dumps({"score": None, "error": message}))
+    LOGGER.info("...Outputted.")
+
+
+def respond(ref_point: list[float] | None) -> None:
+    """Calculate the hyper volume of the trials given on stdin and output the score to stdout.
+
+    Args:
+        ref_point (list[float] | None): validated reference point
+    """
     try:
         # Validate the input
         LOGGER.info("Validating the input...")
 
         trial_to_score = json.loads(input())
         trials_scored = json.loads(input())
-        validated_ref_point = validate_ref_point(json.loads(ref_point) if ref_point is not None else None)
         validated_trial_to_score = validate_trial_to_score(trial_to_score)
 
         validated_trials_scored = validate_trials_scored(trials_scored)
         LOGGER.info("...Validated.")
-        LOGGER.debug("ref_point: %s", validated_ref_point)
+        LOGGER.debug("ref_point: %s", ref_point)
         LOGGER.debug("trial_to_score: %s", validated_trial_to_score)
         LOGGER.debug("trials_scored: %s", validated_trials_scored)
 
         # Calculate the score
         LOGGER.info("Calculating the score...")
-        score = calculate_score(validated_ref_point, validated_trial_to_score, validated_trials_scored)
+        score = calculate_score(ref_point, validated_trial_to_score, validated_trials_scored)
         LOGGER.info("...Calculated.")
         LOGGER.debug("score: %s", score)
 
@@ -64,9 +63,46 @@ def main(ref_point: str, log_level: str) -> None:
 
     except Exception as e:
         LOGGER.exception(format_exc())
-        LOGGER.info("Outputting the result...")
-        sys.stdout.write(json.dumps({"score": None, "error": str(e)}))
-        LOGGER.info("...Outputted.")
+        write_error(str(e))
+
+
+@click.command(help="The indicator to calculate the hyper volume.")
+@click.option(
+    "-r",
+    "--ref-point",
+    type=str,
+    default=None,
+    envvar="HV_REF_POINT",
+    help="Reference point.",
+)
+@click.option(
+    "--fork-server",
+    type=click.Path(dir_okay=False),
+    envvar=FORK_SERVER_ENVVAR,
+    default=None,
+    help="Unix socket to serve on, forking a child to answer each connection like a run of this command.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
+    default="INFO",
+    help="Log level.",
+)
+def main(ref_point: str, fork_server: str | None, log_level: str) -> None:
+    """Calculate the hyper volume."""
+    logging.basicConfig(level=log_level)
+    LOGGER.info(("ref_point: ", ref_point))
+    try:
+        validated_ref_point = validate_ref_point(json.loads(ref_point) if ref_point is not None else None)
+    except Exception as e:
+        LOGGER.exception(format_exc())
+        write_error(str(e))
+        return
+
+    if fork_server is not None:
+        serve_fork(fork_server, partial(respond, validated_ref_point))
+    else:
+        respond(validated_ref_point)
 
 
 if __name__ == "__main__":
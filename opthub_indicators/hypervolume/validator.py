@@ -1,12 +1,12 @@
 """This file defines the schema for the input to the indicator hyper volume."""
 
-import json
 from typing import Any, TypedDict
 
 import numpy as np
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
+from opthub_common.schema import validate_schema
+
 # Schema to validate the evaluation of the trial to score (used in "current")
 SOLUTION_TO_SCORE_JSONSCHEMA = """{
     "$schema": "http://json-schema.org/draft-07/schema#",
@@ -96,7 +96,7 @@ def validate_trial_to_score(trial: dict[str, Any]) -> TrialToScore:
     Returns:
         TrialToScore: validated trial to score
     """
-    validate(instance=trial, schema=json.loads(SOLUTION_TO_SCORE_JSONSCHEMA))
+    validate_schema(trial, SOLUTION_TO_SCORE_JSONSCHEMA)
     feasible = trial["feasible"] if trial["feasible"] is not None else is_feasible(trial)
 
     if feasible and trial["objective"] is None:
@@ -119,7 +119,7 @@ def validate_trials_scored(trials: list[dict[str, Any]]) -> list[TrialScored]:
     Returns:
         list[TrialScored]: validated trials scored
     """
-    validate(instance=trials, schema=json.loads(SOLUTIONS_SCORED_JSONSCHEMA))
+    validate_schema(trials, SOLUTIONS_SCORED_JSONSCHEMA)
     trials_scored: list[TrialScored] = [
         {
             "objective": trial["objective"],
@@ -157,6 +157,6 @@ def validate_ref_point(ref_point: object | None) -> list[float] | None:
         msg = "The reference point must be a list of numbers or None."
         raise ValidationError(msg)
 
-    validate(instance=ref_point, schema=json.loads(REF_POINT_JSONSCHEMA))
+    validate_schema(ref_point, REF_POINT_JSONSCHEMA)
 
     return ref_point
@@ -0,0 +1,11 @@
+"""Out-of-core batch evaluation of the elliptic function."""
+
+from opthub_problems.elliptic import validator
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.utils.cli import batch_command
+
+main = batch_command(EllipticProblem, validator, "ELLIPTIC")
+
+
+if __name__ == "__main__":
+    main()
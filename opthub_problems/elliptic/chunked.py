@@ -0,0 +1,11 @@
+"""Chunked evaluation of a single decision variable of the elliptic function too large for the memory."""
+
+from opthub_problems.elliptic import validator
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.utils.cli import chunked_command
+
+main = chunked_command(EllipticProblem, validator, "ELLIPTIC")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,188 @@
 """Elliptic function evaluator."""
 
 import logging
-from typing import TypedDict, cast
+from typing import Any
 
 import numpy as np
+import numpy.typing as npt
+
+from opthub_problems.utils.cache import EvaluationCache
+from opthub_problems.utils.problem import REDUCTIONS, Evaluation, MinEvaluation, Problem, readonly
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Evaluation(TypedDict):
-    """The type of the solution."""
+def loop_kernel(  # noqa: PLR0913, PLR0917
+    var_arr: npt.NDArray[np.floating[Any]],
+    start: int,
+    stop: int,
+    obj_arr: npt.NDArray[np.floating[Any]],
+    opt: npt.NDArray[np.floating[Any]],
+    weights: npt.NDArray[np.floating[Any]],
+) -> None:
+    """Calculate the partial objective values of the elliptic function in plain loops compiled by Numba.
+
+    Args:
+        var_arr (npt.NDArray[np.floating[Any]]): decision variables of shape (n, d)
+        start (int): first decision dimension
+        stop (int): decision dimension after the last one
+        obj_arr (npt.NDArray[np.floating[Any]]): output of shape (n, m)
+        opt (npt.NDArray[np.floating[Any]]): optima of shape (m, d)
+        weights (npt.NDArray[np.floating[Any]]): weights of the decision dimensions of shape (d,)
+    """
+    for row in range(var_arr.shape[0]):
+        for optimum in range(opt.shape[0]):
+            total = 0.0
+            for i in range(start, stop):
+                diff = var_arr[row, i] - opt[optimum, i]
+                total += weights[i] * diff * diff
+            obj_arr[row, optimum] = total
+
+
+class EllipticProblem(Problem):
+    """Elliptic function built once from its optima."""
+
+    name = "elliptic"
+    loop_kernel = staticmethod(loop_kernel)
+    kernel_constants = ("opt", "weights")
+
+    def _precompute(self) -> None:
+        exp_arr = 6 * np.arange(self.dim) / (self.dim - 1)
+        self.weights = readonly(10**exp_arr, self.dtype)
+
+    def embed(self, points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Scale the points by the square roots of the weights, where the objective value is the squared distance."""
+        return points * np.sqrt(self.weights.astype(np.float64))
+
+    def _partial(
+        self,
+        var_arr: npt.NDArray[np.floating[Any]],
+        start: int,
+        stop: int,
+    ) -> npt.NDArray[np.floating[Any]]:
+        # Fused in a single buffer with in-place ufuncs, computing the same operations as the plain expression
+        buffer = np.subtract(var_arr[:, np.newaxis, start:stop], self.opt[:, start:stop])
+        np.square(buffer, out=buffer)
+        np.multiply(self.weights[start:stop], buffer, out=buffer)
+        return np.sum(buffer, axis=2)
 
-    objective: list[float] | float
+    @classmethod
+    def chunk_partial(
+        cls,
+        var_chunk: npt.NDArray[np.float64],
+        opt_chunk: npt.NDArray[np.float64],
+        start: int,
+        dim: int,
+    ) -> npt.NDArray[np.float64]:
+        """Sum the squared differences of a chunk, weighted by their decision dimensions in the whole variable."""
+        weights = 10 ** (6 * np.arange(start, start + len(var_chunk)) / (dim - 1))
+        buffer = np.subtract(var_chunk, opt_chunk)
+        np.square(buffer, out=buffer)
+        np.multiply(weights, buffer, out=buffer)
+        return np.sum(buffer, axis=1)
 
+    def _gradient(self, var_arr: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.floating[Any]]:
+        grad_arr: npt.NDArray[np.floating[Any]] = 2 * self.weights * (var_arr[:, np.newaxis, :] - self.opt)
+        return grad_arr
 
-def evaluate(var: list[float] | float, opt: list[list[float]]) -> Evaluation:
+    def _hvp(
+        self,
+        var_arr: npt.NDArray[np.floating[Any]],
+        vec_arr: npt.NDArray[np.floating[Any]],
+    ) -> npt.NDArray[np.floating[Any]]:
+        # The Hessian is the diagonal 2 w for every optimum
+        hvp_arr = 2 * self.weights * vec_arr[:, np.newaxis, :]
+        return np.broadcast_to(hvp_arr, (len(var_arr), self.n_optima, self.dim)).copy()
+
+
+def evaluate(  # noqa: PLR0913, PLR0917
+    var: list[float] | float,
+    opt: list[list[float]],
+    precision: str = "float64",
+    cache: EvaluationCache | None = None,
+    reduce: str = "none",
+    rotation_seed: int | None = None,
+) -> Evaluation | MinEvaluation:
     """Calculate the objective value of the elliptic function.
 
     Args:
         var (list[float]): decision variable
         opt (list[list[float]]): optima of the elliptic function
+        precision (str): float64, or float32 to evaluate in single precision
+        cache (EvaluationCache | None): cache to look the evaluation up in and store it to
+        reduce (str): none for the objective values of all the optima,
+            or min for the best one and the index of its optimum
+        rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
 
     Returns:
         list[float]: objective value
     """
-    var_arr = np.array(var, dtype=float)
-    opt_arr = np.array(opt, dtype=float)
-    decision_dim = len(var) if isinstance(var, list) else 1
-    exp_arr = 6 * np.arange(decision_dim) / (decision_dim - 1)
-    obj_arr = np.sum(10**exp_arr * (var_arr - opt_arr) ** 2, axis=1)
-    objective = cast(list[float], obj_arr.tolist())
-    return {"objective": objective[0] if len(objective) == 1 else objective}
+    if reduce not in REDUCTIONS:
+        msg = f"The reduction must be one of {REDUCTIONS}, but got {reduce}."
+        raise ValueError(msg)
+    problem = EllipticProblem(opt, precision=precision, cache=cache, rotation_seed=rotation_seed)
+    return problem.evaluate_min(var) if reduce == "min" else problem.evaluate(var)
+
+
+def evaluate_batch(
+    var_batch: npt.ArrayLike,
+    opt: list[list[float]],
+    precision: str = "float64",
+    rotation_seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Calculate the objective values of the elliptic function for a batch of decision variables.
+
+    The result of each row is identical to the one of `evaluate` for the same decision variable.
+
+    Args:
+        var_batch (npt.ArrayLike): decision variables of shape (n, d)
+        opt (list[list[float]]): optima of the elliptic function
+        precision (str): float64, or float32 to evaluate in single precision
+        rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
+
+    Returns:
+        npt.NDArray[np.float64]: objective values of shape (n, m)
+    """
+    return EllipticProblem(opt, precision=precision, rotation_seed=rotation_seed).evaluate_batch(var_batch)
+
+
+def gradient_batch(
+    var_batch: npt.ArrayLike,
+    opt: list[list[float]],
+    precision: str = "float64",
+    rotation_seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Calculate the gradients of the elliptic function for a batch of decision variables in closed form.
+
+    Args:
+        var_batch (npt.ArrayLike): decision variables of shape (n, d)
+        opt (list[list[float]]): optima of the elliptic function
+        precision (str): float64, or float32 to evaluate in single precision
+        rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
+
+    Returns:
+        npt.NDArray[np.float64]: gradients of shape (n, m, d)
+    """
+    return EllipticProblem(opt, precision=precision, rotation_seed=rotation_seed).gradient_batch(var_batch)
+
+
+def hvp_batch(
+    var_batch: npt.ArrayLike,
+    vec_batch: npt.ArrayLike,
+    opt: list[list[float]],
+    precision: str = "float64",
+    rotation_seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Calculate the Hessian-vector products of the elliptic function for a batch of decision variables.
+
+    Args:
+        var_batch (npt.ArrayLike): decision variables of shape (n, d)
+        vec_batch (npt.ArrayLike): vectors of shape (n, d), one per decision variable
+        opt (list[list[float]]): optima of the elliptic function
+        precision (str): float64, or float32 to evaluate in single precision
+        rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
+
+    Returns:
+        npt.NDArray[np.float64]: Hessian-vector products of shape (n, m, d)
+    """
+    return EllipticProblem(opt, precision=precision, rotation_seed=rotation_seed).hvp_batch(var_batch, vec_batch)
@@ -0,0 +1,11 @@
+"""Micro-batching evaluation server of the elliptic function."""
+
+from opthub_problems.elliptic import validator
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.utils.cli import server_command
+
+main = server_command(EllipticProblem, validator, "ELLIPTIC")
+
+
+if __name__ == "__main__":
+    main()
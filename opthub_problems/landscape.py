@@ -0,0 +1,326 @@
+"""Analyze the fitness landscapes of the problems from streams of samples.
+
+The samples are drawn in chunks of a fixed size, evaluated in a batch and merged into online accumulators,
+so the memory does not grow with the number of samples:
+
+    python -m opthub_problems.landscape --problem rastrigin --optima '[[0, 0, 0, 0]]' --samples 100000000
+
+The metrics are printed as JSON. The fitness-distance correlation and the density of the local optima are
+estimated from any sampler, and the autocorrelation and the ruggedness from a random walk only, since they
+measure how the objective value changes along a path.
+"""
+
+import json
+import logging
+import math
+from collections.abc import Iterator
+from typing import Any
+
+import click
+import numpy as np
+import numpy.typing as npt
+from scipy.spatial import cKDTree  # type: ignore[import-untyped]
+from scipy.stats import qmc  # type: ignore[import-untyped]
+
+from opthub_problems.utils.online import OnlineAutocorrelation, OnlineCorrelation, OnlineInformationContent
+from opthub_problems.utils.problem import Problem
+from opthub_problems.visualizer import PROBLEMS
+
+LOGGER = logging.getLogger(__name__)
+
+# Samplers of the decision space
+SAMPLERS = ("sobol", "lhs", "walk")
+
+
+def sample_chunks(  # noqa: PLR0913
+    sampler: str,
+    dim: int,
+    n_samples: int,
+    chunk_size: int,
+    bounds: tuple[float, float],
+    *,
+    step: float = 0.01,
+    seed: int | None = None,
+) -> Iterator[npt.NDArray[np.float64]]:
+    """Draw samples of the decision space in chunks.
+
+    The Sobol points are drawn by whole chunks and the last one is truncated, which keeps their balance.
+    Each chunk of the Latin hypercube sampler is a Latin hypercube of its own, since stratifying the whole
+    stream would take memory in proportion to its length. The random walk takes Gaussian steps, reflected
+    at the bounds, and carries its position from one chunk to the next.
+
+    Args:
+        sampler (str): sobol, lhs or walk
+        dim (int): number of decision dimensions
+        n_samples (int): number of samples
+        chunk_size (int): number of samples of a chunk
+        bounds (tuple[float, float]): lower and upper bounds of all the decision dimensions
+        step (float): standard deviation of a step of the random walk relative to the bounds
+        seed (int | None): seed of the random numbers
+
+    Yields:
+        npt.NDArray[np.float64]: samples of shape (c, d)
+
+    Raises:
+        ValueError: if the sampler is unknown
+    """
+    rng = np.random.default_rng(seed)
+    low, high = bounds
+    width = high - low
+    if sampler == "sobol":
+        engine: Any = qmc.Sobol(dim, seed=rng)
+    elif sampler == "lhs":
+        engine = qmc.LatinHypercube(dim, seed=rng)
+    elif sampler == "walk":
+        position = rng.random(dim)
+    else:
+        msg = f"The sampler must be one of {SAMPLERS}, but got {sampler}."
+        raise ValueError(msg)
+
+    for start in range(0, n_samples, chunk_size):
+        size = min(chunk_size, n_samples - start)
+        if sampler == "walk":
+            walk = position + np.cumsum(rng.normal(0.0, step, (size, dim)), axis=0)
+            position = walk[-1]
+            # The unbounded walk is folded into [0, 1] as if it bounced off the bounds
+            unit = 1 - np.abs(np.mod(walk, 2) - 1)
+        elif sampler == "sobol":
+            unit = engine.random(chunk_size)[:size]
+        else:
+            unit = engine.random(size)
+        yield low + width * unit
+
+
+def local_optimum_mask(
+    problem: Problem,
+    points: npt.NDArray[np.float64],
+    values: npt.NDArray[np.float64],
+    radius: float,
+) -> npt.NDArray[np.bool_]:
+    """Find the samples that are not worse than their neighbors one radius away along each decision dimension.
+
+    Args:
+        problem (Problem): problem to evaluate
+        points (npt.NDArray[np.float64]): samples of shape (n, d)
+        values (npt.NDArray[np.float64]): best objective values of the samples of shape (n,)
+        radius (float): distance to the neighbors
+
+    Returns:
+        npt.NDArray[np.bool_]: mask of the local optima of shape (n,)
+    """
+    n, dim = points.shape
+    offsets = np.concatenate([np.eye(dim), -np.eye(dim)]) * radius
+    neighbors = (points[:, np.newaxis, :] + offsets).reshape(n * 2 * dim, dim)
+    neighbor_values = problem.evaluate_batch(neighbors).min(axis=1).reshape(n, 2 * dim)
+    return np.all(values[:, np.newaxis] <= neighbor_values, axis=1)
+
+
+def analyze(  # noqa: PLR0913
+    problem: Problem,
+    sampler: str,
+    n_samples: int,
+    *,
+    chunk_size: int = 2**14,
+    bounds: tuple[float, float] = (-5.0, 5.0),
+    step: float = 0.01,
+    max_lag: int = 10,
+    epsilon: float = 0.0,
+    radius: float | None = None,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """Calculate the metrics of the landscape of a problem from a stream of samples.
+
+    Args:
+        problem (Problem): problem to analyze
+        sampler (str): sobol, lhs or walk
+        n_samples (int): number of samples
+        chunk_size (int): number of samples of a chunk
+        bounds (tuple[float, float]): lower and upper bounds of all the decision dimensions
+        step (float): standard deviation of a step of the random walk relative to the bounds
+        max_lag (int): highest lag of the autocorrelation of the random walk
+        epsilon (float): highest absolute difference of a flat slope of the random walk
+        radius (float | None): distance to the neighbors of the local optima, 1% of the bounds if None,
+            or 0 not to search for local optima
+        seed (int | None): seed of the random numbers
+
+    Returns:
+        dict[str, Any]: metrics of the landscape
+    """
+    if radius is None:
+        radius = (bounds[1] - bounds[0]) / 100
+    # The distances are taken in the space of the optima, where the rotation keeps them unchanged
+    tree = cKDTree(problem.opt.astype(np.float64))
+    fitness_distance = OnlineCorrelation()
+    autocorrelation = OnlineAutocorrelation(max_lag)
+    information = OnlineInformationContent(epsilon)
+    n_local_optima = 0
+    neighbor_rows = max(1, chunk_size // (2 * problem.dim))
+
+    for points in sample_chunks(sampler, problem.dim, n_samples, chunk_size, bounds, step=step, seed=seed):
+        values = problem.evaluate_batch(points).min(axis=1)
+        distances, _ = tree.query(problem.rotate(points).astype(np.float64))
+        fitness_distance.update(values, np.asarray(distances, dtype=np.float64))
+        if sampler == "walk":
+            autocorrelation.update(values)
+            information.update(values)
+        # The 2d neighbors of each sample are evaluated in batches no larger than a chunk
+        for start in range(0, len(points) if radius > 0 else 0, neighbor_rows):
+            rows = slice(start, start + neighbor_rows)
+            n_local_optima += int(np.count_nonzero(local_optimum_mask(problem, points[rows], values[rows], radius)))
+        LOGGER.debug("Analyzed %d samples.", fitness_distance.count)
+
+    walk = sampler == "walk"
+    return {
+        "problem": problem.name,
+        "dim": problem.dim,
+        "sampler": sampler,
+        "samples": fitness_distance.count,
+        "objective": {
+            "mean": fitness_distance.mean_x,
+            "std": fitness_distance.std_x,
+            "min": fitness_distance.min_x,
+            "max": fitness_distance.max_x,
+        },
+        "fitness_distance_correlation": fitness_distance.correlation,
+        "local_optima_density": n_local_optima / fitness_distance.count if radius > 0 else None,
+        "autocorrelation": autocorrelation.autocorrelations if walk else None,
+        "correlation_length": autocorrelation.correlation_length if walk else None,
+        "information_content": information.information_content if walk else None,
+        "partial_information_content": information.partial_information_content if walk else None,
+    }
+
+
+def to_json(metrics: Any) -> Any:  # noqa: ANN401
+    """Replace the non-finite numbers of the metrics by null, which JSON has no literal for.
+
+    Args:
+        metrics (Any): metrics or one of their values
+
+    Returns:
+        Any: metrics with null for the non-finite numbers
+    """
+    if isinstance(metrics, dict):
+        return {key: to_json(value) for key, value in metrics.items()}
+    if isinstance(metrics, list):
+        return [to_json(value) for value in metrics]
+    if isinstance(metrics, float) and not math.isfinite(metrics):
+        return None
+    return metrics
+
+
+@click.command(help="Analyze the fitness landscape of a problem from a stream of samples.")
+@click.option(
+    "--problem",
+    type=click.Choice(list(PROBLEMS)),
+    required=True,
+    help="Problem to analyze.",
+)
+@click.option(
+    "--optima",
+    type=str,
+    default=None,
+    help="Optima of the problem, the ones of the thumbnails by default.",
+)
+@click.option(
+    "--rotation-seed",
+    type=int,
+    default=None,
+    help="Seed of the rotation matrix of the problem, not rotated by default.",
+)
+@click.option(
+    "--sampler",
+    type=click.Choice(SAMPLERS),
+    default="sobol",
+    help="Sampler of the decision space.",
+)
+@click.option(
+    "--samples",
+    type=click.IntRange(min=1),
+    default=2**20,
+    help="Number of samples.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=2**14,
+    help="Number of samples evaluated at once, which bounds the memory.",
+)
+@click.option(
+    "--bounds",
+    type=(float, float),
+    default=(-5.0, 5.0),
+    help="Lower and upper bounds of all the decision dimensions.",
+)
+@click.option(
+    "--step",
+    type=click.FloatRange(min=0, min_open=True),
+    default=0.01,
+    help="Standard deviation of a step of the random walk relative to the bounds.",
+)
+@click.option(
+    "--max-lag",
+    type=click.IntRange(min=1),
+    default=10,
+    help="Highest lag of the autocorrelation of the random walk.",
+)
+@click.option(
+    "--epsilon",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    help="Highest absolute difference of a flat slope of the random walk.",
+)
+@click.option(
+    "--radius",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Distance to the neighbors of the local optima, 1%% of the bounds by default, 0 to skip them.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=None,
+    help="Seed of the random numbers.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
+    default="INFO",
+    help="Log level.",
+)
+def main(  # noqa: PLR0913, PLR0917
+    problem: str,
+    optima: str | None,
+    rotation_seed: int | None,
+    sampler: str,
+    samples: int,
+    chunk_size: int,
+    bounds: tuple[float, float],
+    step: float,
+    max_lag: int,
+    epsilon: float,
+    radius: float | None,
+    seed: int | None,
+    log_level: str,
+) -> None:
+    """Print the metrics of the landscape of a problem."""
+    logging.basicConfig(level=log_level)
+
+    problem_class, default_optima = PROBLEMS[problem]
+    instance = problem_class(json.loads(optima) if optima is not None else default_optima, rotation_seed=rotation_seed)
+    metrics = analyze(
+        instance,
+        sampler,
+        samples,
+        chunk_size=chunk_size,
+        bounds=bounds,
+        step=step,
+        max_lag=max_lag,
+        epsilon=epsilon,
+        radius=radius,
+        seed=seed,
+    )
+    click.echo(json.dumps(to_json(metrics)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Out-of-core batch evaluation of the rastrigin function."""
+
+from opthub_problems.rastrigin import validator
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.utils.cli import batch_command
+
+main = batch_command(RastriginProblem, validator, "Rastrigin")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Chunked evaluation of a single decision variable of the rastrigin function too large for the memory."""
+
+from opthub_problems.rastrigin import validator
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.utils.cli import chunked_command
+
+main = chunked_command(RastriginProblem, validator, "Rastrigin")
+
+
+if __name__ == "__main__":
+    main()
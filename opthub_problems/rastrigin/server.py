@@ -0,0 +1,11 @@
+"""Micro-batching evaluation server of the rastrigin function."""
+
+from opthub_problems.rastrigin import validator
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.utils.cli import server_command
+
+main = server_command(RastriginProblem, validator, "Rastrigin")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Out-of-core batch evaluation of the rosenbrock function."""
+
+from opthub_problems.rosenbrock import validator
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.utils.cli import batch_command
+
+main = batch_command(RosenbrockProblem, validator, "Rosenbrock")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Chunked evaluation of a single decision variable of the rosenbrock function too large for the memory."""
+
+from opthub_problems.rosenbrock import validator
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.utils.cli import chunked_command
+
+main = chunked_command(RosenbrockProblem, validator, "Rosenbrock")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,219 @@
 """Rosenbrock function evaluator."""
 
 import logging
-from typing import TypedDict, cast
+from typing import Any
 
 import numpy as np
+import numpy.typing as npt
+
+from opthub_problems.utils.cache import EvaluationCache
+from opthub_problems.utils.problem import REDUCTIONS, Evaluation, MinEvaluation, Problem, readonly
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Evaluation(TypedDict):
-    """The type of the solution."""
+def loop_kernel(
+    var_arr: npt.NDArray[np.floating[Any]],
+    start: int,
+    stop: int,
+    obj_arr: npt.NDArray[np.floating[Any]],
+    diff: npt.NDArray[np.floating[Any]],
+) -> None:
+    """Calculate the partial objective values of the rosenbrock function in plain loops compiled by Numba.
+
+    Args:
+        var_arr (npt.NDArray[np.floating[Any]]): decision variables of shape (n, d)
+        start (int): first decision dimension
+        stop (int): decision dimension after the last one
+        obj_arr (npt.NDArray[np.floating[Any]]): output of shape (n, m)
+        diff (npt.NDArray[np.floating[Any]]): optima minus one of shape (m, d)
+    """
+    # The term of the last decision dimension of a block reads the first one of the next block
+    stop = min(stop, var_arr.shape[1] - 1)
+    for row in range(var_arr.shape[0]):
+        for optimum in range(diff.shape[0]):
+            total = 0.0
+            for i in range(start, stop):
+                shifted = var_arr[row, i] - diff[optimum, i]
+                residual = shifted * shifted - (var_arr[row, i + 1] - diff[optimum, i + 1])
+                total += 100 * residual * residual + (shifted - 1) * (shifted - 1)
+            obj_arr[row, optimum] = total
+
+
+class RosenbrockProblem(Problem):
+    """Rosenbrock function built once from its optima."""
+
+    name = "rosenbrock"
+    loop_kernel = staticmethod(loop_kernel)
+    kernel_constants = ("diff",)
+    optimum_constants = ("opt", "diff")
+    chunk_overlap = 1
+
+    def _precompute(self) -> None:
+        self.diff = readonly(self.opt - 1, self.dtype)
+
+    def embed(self, points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Drop the last dimension, since the objective value is at least the sum of the other (x_i - o_i)**2."""
+        return points[:, :-1]
+
+    def _partial(
+        self,
+        var_arr: npt.NDArray[np.floating[Any]],
+        start: int,
+        stop: int,
+    ) -> npt.NDArray[np.floating[Any]]:
+        # Each term couples a decision dimension with the next one, which may belong to the next block
+        stop = min(stop + 1, self.dim)
+        # Fused in two buffers with in-place ufuncs, computing the same operations in the same order
+        # as the plain expression of 100 (y_i^2 - y_{i+1})^2 + (y_i - 1)^2
+        buffer = np.subtract(var_arr[:, np.newaxis, start:stop], self.diff[:, start:stop])
+        head, tail = buffer[:, :, :-1], buffer[:, :, 1:]
+        term_buffer = np.square(head)
+        np.subtract(term_buffer, tail, out=term_buffer)
+        np.square(term_buffer, out=term_buffer)
+        np.multiply(100, term_buffer, out=term_buffer)
+        # The tail is not read anymore, so the head is overwritten in place
+        np.subtract(head, 1, out=head)
+        np.square(head, out=head)
+        np.add(term_buffer, head, out=term_buffer)
+        return np.sum(term_buffer, axis=2)
 
-    objective: list[float] | float
+    @classmethod
+    def chunk_partial(
+        cls,
+        var_chunk: npt.NDArray[np.float64],
+        opt_chunk: npt.NDArray[np.float64],
+        start: int,  # noqa: ARG003
+        dim: int,  # noqa: ARG003
+    ) -> npt.NDArray[np.float64]:
+        """Sum the terms of a chunk but the last one, which couples its decision dimension with the next chunk."""
+        # The last decision dimension of the chunk only has its term once the next chunk is read
+        buffer = np.subtract(var_chunk, opt_chunk - 1)
+        head, tail = buffer[:, :-1], buffer[:, 1:]
+        term_buffer = np.square(head)
+        np.subtract(term_buffer, tail, out=term_buffer)
+        np.square(term_buffer, out=term_buffer)
+        np.multiply(100, term_buffer, out=term_buffer)
+        np.subtract(head, 1, out=head)
+        np.square(head, out=head)
+        np.add(term_buffer, head, out=term_buffer)
+        return np.sum(term_buffer, axis=1)
 
+    def _gradient(self, var_arr: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.floating[Any]]:
+        var_arr = var_arr[:, np.newaxis, :] - self.diff
+        grad_arr = np.zeros_like(var_arr)
+        # Each term 100 (y_i**2 - y_i+1)**2 + (y_i - 1)**2 contributes to the dimensions i and i + 1
+        residual = var_arr[:, :, :-1] ** 2 - var_arr[:, :, 1:]
+        grad_arr[:, :, :-1] = 400 * var_arr[:, :, :-1] * residual + 2 * (var_arr[:, :, :-1] - 1)
+        grad_arr[:, :, 1:] -= 200 * residual
+        return grad_arr
 
-def evaluate(var: list[float] | float, opt: list[list[float]]) -> Evaluation:
+    def _hvp(
+        self,
+        var_arr: npt.NDArray[np.floating[Any]],
+        vec_arr: npt.NDArray[np.floating[Any]],
+    ) -> npt.NDArray[np.floating[Any]]:
+        # The Hessian is tridiagonal
+        var_arr = var_arr[:, np.newaxis, :] - self.diff
+        vec_arr = vec_arr[:, np.newaxis, :]
+        diagonal = np.zeros_like(var_arr)
+        diagonal[:, :, :-1] = 1200 * var_arr[:, :, :-1] ** 2 - 400 * var_arr[:, :, 1:] + 2
+        diagonal[:, :, 1:] += 200
+        off_diagonal = -400 * var_arr[:, :, :-1]
+        hvp_arr: npt.NDArray[np.floating[Any]] = diagonal * vec_arr
+        hvp_arr[:, :, :-1] += off_diagonal * vec_arr[:, :, 1:]
+        hvp_arr[:, :, 1:] += off_diagonal * vec_arr[:, :, :-1]
+        return hvp_arr
+
+
+def evaluate(  # noqa: PLR0913, PLR0917
+    var: list[float] | float,
+    opt: list[list[float]],
+    precision: str = "float64",
+    cache: EvaluationCache | None = None,
+    reduce: str = "none",
+    rotation_seed: int | None = None,
+) -> Evaluation | MinEvaluation:
     """Calculate the objective value of the rosenbrock function.
 
     Args:
         var (list[float]): decision variable
         opt (list[list[float]]): optima of the rosenbrock function
+        precision (str): float64, or float32 to evaluate in single precision
+        cache (EvaluationCache | None): cache to look the evaluation up in and store it to
+        reduce (str): none for the objective values of all the optima,
+            or min for the best one and the index of its optimum
+        rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
 
     Returns:
         list[float]: objective value
     """
-    var_arr = np.array(var, dtype=float)
-    opt_arr = np.array(opt, dtype=float)
-    diff_arr = opt_arr - 1
-    var_arr = var_arr[np.newaxis, :] - diff_arr
-    obj_arr = np.sum(
-        100 * (var_arr[:, :-1] ** 2 - var_arr[:, 1:]) ** 2 + (var_arr[:, :-1] - 1) ** 2,
-        axis=1,
-    )
-    objective = cast(list[float], obj_arr.tolist())
-    return {"objective": objective[0] if len(objective) == 1 else objective}
+    if reduce not in REDUCTIONS:
+        msg = f"The reduction must be one of {REDUCTIONS}, but got {reduce}."
+        raise ValueError(msg)
+    problem = RosenbrockProblem(opt, precision=precision, cache=cache, rotation_seed=rotation_seed)
+    return problem.evaluate_min(var) if reduce == "min" else problem.evaluate(var)
+
+
+def evaluate_batch(
+    var_batch: npt.ArrayLike,
+    opt: list[list[float]],
+    precision: str = "float64",
+    rotation_seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Calculate the objective values of the rosenbrock function for a batch of decision variables.
+
+    The result of each row is identical to the one of `evaluate` for the same decision variable.
+
+    Args:
+        var_batch (npt.ArrayLike): decision variables of shape (n, d)
+        opt (list[list[float]]): optima of the rosenbrock function
+        precision (str): float64, or float32 to evaluate in single precision
+        rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
+
+    Returns:
+        npt.NDArray[np.float64]: objective values of shape (n, m)
+    """
+    return RosenbrockProblem(opt, precision=precision, rotation_seed=rotation_seed).evaluate_batch(var_batch)
+
+
+def gradient_batch(
+    var_batch: npt.ArrayLike,
+    opt: list[list[float]],
+    precision: str = "float64",
+    rotation_seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Calculate the gradients of the rosenbrock function for a batch of decision variables in closed form.
+
+    Args:
+        var_batch (npt.ArrayLike): decision variables of shape (n, d)
+        opt (list[list[float]]): optima of the rosenbrock function
+        precision (str): float64, or float32 to evaluate in single precision
+        rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
+
+    Returns:
+        npt.NDArray[np.float64]: gradients of shape (n, m, d)
+    """
+    return RosenbrockProblem(opt, precision=precision, rotation_seed=rotation_seed).gradient_batch(var_batch)
+
+
+def hvp_batch(
+    var_batch: npt.ArrayLike,
+    vec_batch: npt.ArrayLike,
+    opt: list[list[float]],
+    precision: str = "float64",
+    rotation_seed: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Calculate the Hessian-vector products of the rosenbrock function for a batch of decision variables.
+
+    Args:
+        var_batch (npt.ArrayLike): decision variables of shape (n, d)
+        vec_batch (npt.ArrayLike): vectors of shape (n, d), one per decision variable
+        opt (list[list[float]]): optima of the rosenbrock function
+        precision (str): float64, or float32 to evaluate in single precision
+        rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
+
+    Returns:
+        npt.NDArray[np.float64]: Hessian-vector products of shape (n, m, d)
+    """
+    return RosenbrockProblem(opt, precision=precision, rotation_seed=rotation_seed).hvp_batch(var_batch, vec_batch)
@@ -3,16 +3,138 @@
 import json
 import logging
 import sys
+from functools import partial
 from traceback import format_exc
+from typing import Any
 
 import click
+import numpy as np
+import numpy.typing as npt
 
-from opthub_problems.rosenbrock.evaluator import evaluate
-from opthub_problems.rosenbrock.validator import validate_optima, validate_variable
+from opthub_common.forkserver import FORK_SERVER_ENVVAR, serve_fork
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.rosenbrock.validator import (
+    parse_optima,
+    parse_variable,
+    validate_optima_file,
+    validate_variable_array,
+)
+from opthub_problems.utils.backend import BACKEND_ENVVAR, backend_names
+from opthub_problems.utils.batch import parse_size
+from opthub_problems.utils.binary import DATA_FORMATS, serve_binary, write_error_frame
+from opthub_problems.utils.cache import EvaluationCache
+from opthub_problems.utils.problem import PRECISIONS, REDUCTIONS, Evaluation, MinEvaluation
+from opthub_problems.utils.stream import serve_stream
 
 LOGGER = logging.getLogger(__name__)
 
 
+def evaluate_line(line: str, problem: RosenbrockProblem, reduce: str = "none") -> Evaluation | MinEvaluation:
+    """Validate and evaluate the solution variable given as a JSON line.
+
+    Args:
+        line (str): JSON encoded solution variable
+        problem (RosenbrockProblem): rosenbrock function built from the validated optima
+        reduce (str): none for the objective values of all the optima, or min for the best one
+
+    Returns:
+        Evaluation: evaluation of the solution variable
+    """
+    LOGGER.info("Validating the solution variable.")
+    validated_variable = parse_variable(line, problem.dim)
+    LOGGER.info("Validated.")
+    LOGGER.debug("variable: %s", validated_variable)
+
+    # Evaluate variable
+    LOGGER.info("Evaluating the variable...")
+    result = problem.evaluate_min(validated_variable) if reduce == "min" else problem.evaluate(validated_variable)
+    LOGGER.info("...Evaluated.")
+
+    LOGGER.debug("result: %s", result)
+    return result
+
+
+def evaluate_array(
+    variable: npt.NDArray[Any],
+    problem: RosenbrockProblem,
+    reduce: str = "none",
+) -> npt.NDArray[np.float64]:
+    """Validate and evaluate the solution variable given as an array.
+
+    Args:
+        variable (npt.NDArray[Any]): solution variable
+        problem (RosenbrockProblem): rosenbrock function built from the validated optima
+        reduce (str): none for the objective values of all the optima, or min for the best one
+
+    Returns:
+        npt.NDArray[np.float64]: objective values for each optimum, or the best one and the index of its optimum
+    """
+    LOGGER.info("Validating the solution variable.")
+    validated_variable = validate_variable_array(variable, problem.dim)
+    LOGGER.info("Validated.")
+
+    LOGGER.info("Evaluating the variable...")
+    if reduce == "min":
+        evaluation = problem.evaluate_min(validated_variable)
+        result = np.array([evaluation["objective"], evaluation["optimum"]], dtype=np.float64)
+    else:
+        result = problem.evaluate_array(validated_variable)
+    LOGGER.info("...Evaluated.")
+    return result
+
+
+def write_error(message: str, data_format: str) -> None:
+    """Output an error message as the result.
+
+    Args:
+        message (str): error message
+        data_format (str): format of the results
+    """
+    LOGGER.info("Outputting the result...")
+    if data_format == "json":
+        sys.stdout.write(json.dumps({"objective": None, "error": message}))
+    else:
+        write_error_frame(sys.stdout.buffer, data_format, message)
+    LOGGER.info("...Outputted.")
+
+
+def respond(problem: RosenbrockProblem, data_format: str, stream: bool, reduce: str) -> None:
+    """Evaluate the solution variables given on stdin and output the results to stdout.
+
+    Args:
+        problem (RosenbrockProblem): rosenbrock function built from the validated optima
+        data_format (str): format of the solution variables and the results
+        stream (bool): whether to keep evaluating the solution variables until EOF
+        reduce (str): none for the objective values of all the optima, or min for the best one
+    """
+    try:
+        if data_format != "json":
+            handle = partial(evaluate_array, problem=problem, reduce=reduce)
+            serve_binary(handle, data_format, stream)
+            if problem.cache is not None:
+                LOGGER.info("Cache statistics: %s", problem.cache.stats())
+            return
+
+        if stream:
+            LOGGER.info("Streaming the evaluations...")
+            serve_stream(partial(evaluate_line, problem=problem, reduce=reduce))
+            LOGGER.info("...Streamed.")
+            if problem.cache is not None:
+                LOGGER.info("Cache statistics: %s", problem.cache.stats())
+            return
+
+        result = evaluate_line(input(), problem, reduce)
+
+        # Output the result
+        LOGGER.info("Outputting the result...")
+        sys.stdout.write(json.dumps(result))
+        LOGGER.info("...Outputted.")
+
+    except Exception as e:
+        LOGGER.exception(format_exc())
+        write_error(str(e), data_format)
+
+
 @click.command(help="Rosenbrock function minimization problem.")
 @click.option(
     "-o",
@@ -21,49 +143,125 @@ LOGGER = logging.getLogger(__name__)
     envvar="Rosenbrock_OPTIMA",
     help="Optima of the rosenbrock function.",
 )
+@click.option(
+    "--optima-file",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="Rosenbrock_OPTIMA_FILE",
+    default=None,
+    help="Optima of the rosenbrock function stored in a .npy file of shape (m, d). Overrides --optima.",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Keep evaluating newline-delimited solution variables until EOF.",
+)
+@click.option(
+    "--format",
+    "data_format",
+    type=click.Choice(DATA_FORMATS),
+    default="json",
+    help="Format of the solution variables and the results.",
+)
+@click.option(
+    "--precision",
+    type=click.Choice(PRECISIONS),
+    default="float64",
+    help="Floating-point precision of the evaluation. float32 is faster but less accurate.",
+)
+@click.option(
+    "--reduce",
+    type=click.Choice(REDUCTIONS),
+    default="none",
+    help="Output the objective values of all the optima, or the best one and the index of its optimum (uncached).",
+)
+@click.option(
+    "--cache-size",
+    type=str,
+    default="64M",
+    help="Memory budget of the evaluation cache such as 64M, 0 to disable it.",
+)
+@click.option(
+    "--cache-path",
+    type=click.Path(dir_okay=False),
+    envvar="OPTHUB_CACHE_PATH",
+    default=None,
+    help="SQLite database persisting the evaluation cache, shared by the processes on the node.",
+)
+@click.option(
+    "--rotation-seed",
+    type=int,
+    envvar="Rosenbrock_ROTATION_SEED",
+    default=None,
+    help="Seed of the rotation matrix of the rotated variant of the rosenbrock function.",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(backend_names()),
+    envvar=BACKEND_ENVVAR,
+    default=None,
+    help="Compute backend of the evaluation. An unavailable backend falls back to numpy.",
+)
+@click.option(
+    "--fork-server",
+    type=click.Path(dir_okay=False),
+    envvar=FORK_SERVER_ENVVAR,
+    default=None,
+    help="Unix socket to serve on, forking a child to answer each connection like a run of this command.",
+)
 @click.option(
     "--log-level",
     type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
     default="INFO",
     help="Log level.",
 )
-def main(optima: str, log_level: str) -> None:
+def main(  # noqa: PLR0913, PLR0917
+    optima: str,
+    optima_file: str | None,
+    stream: bool,
+    data_format: str,
+    precision: str,
+    reduce: str,
+    cache_size: str,
+    cache_path: str | None,
+    rotation_seed: int | None,
+    backend: str | None,
+    fork_server: str | None,
+    log_level: str,
+) -> None:
     """Evaluate the given solution on the rosenbrock function minimization problem."""
     logging.basicConfig(level=log_level)
 
     try:
         # Validate the input
         LOGGER.info("Validating the environment variables...")
-        optima = json.loads(optima)
-        validated_optima = validate_optima(optima)
+        validated_optima: list[list[float]] | npt.NDArray[np.float64]
+        validated_optima = validate_optima_file(optima_file) if optima_file is not None else parse_optima(optima)
         decision_dim = len(validated_optima[0])
         LOGGER.info("Validated.")
         LOGGER.debug("optima: %s", validated_optima)
         LOGGER.debug("decision_dim: %s", decision_dim)
-
-        LOGGER.info("Validating the solution variable.")
-        variable = json.loads(input())
-        validated_variable = validate_variable(variable, decision_dim)
-        LOGGER.info("Validated.")
-        LOGGER.debug("variable: %s", validated_variable)
-
-        # Evaluate variable
-        LOGGER.info("Evaluating the variable...")
-        result = evaluate(validated_variable, validated_optima)
-        LOGGER.info("...Evaluated.")
-
-        LOGGER.debug("result: %s", result)
-
-        # Output the result
-        LOGGER.info("Outputting the result...")
-        sys.stdout.write(json.dumps(result))
-        LOGGER.info("...Outputted.")
+        max_cache_size = parse_size(cache_size)
+        # The cache stores the objective values of all the optima
+        use_cache = reduce == "none" and (max_cache_size > 0 or cache_path is not None)
+        cache = EvaluationCache(max_cache_size, cache_path) if use_cache else None
+        problem = RosenbrockProblem(
+            validated_optima,
+            precision=precision,
+            cache=cache,
+            rotation_seed=rotation_seed,
+            backend=backend,
+        )
 
     except Exception as e:
         LOGGER.exception(format_exc())
-        LOGGER.info("Outputting the result...")
-        sys.stdout.write(json.dumps({"objective": None, "error": str(e)}))
-        LOGGER.info("...Outputted.")
+        write_error(str(e), data_format)
+        return
+
+    if fork_server is not None:
+        serve_fork(fork_server, partial(respond, problem, data_format, stream, reduce))
+    else:
+        respond(problem, data_format, stream, reduce)
 
 
 if __name__ == "__main__":
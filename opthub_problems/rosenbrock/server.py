@@ -0,0 +1,11 @@
+"""Micro-batching evaluation server of the rosenbrock function."""
+
+from opthub_problems.rosenbrock import validator
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.utils.cli import server_command
+
+main = server_command(RosenbrockProblem, validator, "Rosenbrock")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,14 @@
 import json
 from typing import Any, cast
 
-from jsonschema import ValidationError, validate
+import numpy as np
+import numpy.typing as npt
+from jsonschema import ValidationError
+
+from opthub_common.schema import validate_finite, validate_schema
+from opthub_problems.utils.jsonarray import decode_array
+from opthub_problems.utils.optima import load_optima_file, validate_optima_array
+from opthub_problems.utils.population import validate_population_rows
 
 # Schema to validate the optima of the rosenbrock function
 OPTIMA_SCHEMA = """{
@@ -19,22 +26,73 @@ OPTIMA_SCHEMA = """{
 }"""
 
 
-def validate_optima(optima: Any) -> list[list[float]]:  # noqa: ANN401
+def validate_optima(optima: Any) -> npt.NDArray[np.float64]:  # noqa: ANN401
     """Validate the optima of the rosenbrock function.
 
+    An array is validated on its shape, dtype and values without visiting each element with jsonschema.
+
     Args:
-        optima (Any): optima environment variable of the rosenbrock function
+        optima (Any): optima environment variable of the rosenbrock function, decoded from JSON or as an array
 
     Raises:
         jsonschema.exceptions.ValidationError: if the optima is invalid
+
+    Returns:
+        npt.NDArray[np.float64]: validated optima of shape (m, d)
     """
-    validate(instance=optima, schema=json.loads(OPTIMA_SCHEMA))
-    first_vector_length = len(optima[0])
-    for vector in optima:
-        if len(vector) != first_vector_length:
-            message = "All vectors must have the same length."
-            raise ValidationError(message)
-    return cast(list[list[float]], optima)
+    if isinstance(optima, np.ndarray):
+        if optima.dtype.kind not in "iuf":
+            msg = f"The optima must be numeric, but got dtype {optima.dtype}."
+            raise ValidationError(msg)
+    else:
+        validate_schema(optima, OPTIMA_SCHEMA)
+        first_vector_length = len(optima[0])
+        for vector in optima:
+            if len(vector) != first_vector_length:
+                message = "All vectors must have the same length."
+                raise ValidationError(message)
+    opt_arr = np.ascontiguousarray(optima, dtype="<f8")
+    validate_optima_array(opt_arr, min_dim=2)
+    return opt_arr
+
+
+def parse_optima(optima: str) -> npt.NDArray[np.float64]:
+    """Decode and validate the JSON optima of the rosenbrock function.
+
+    A rectangular array of numbers is decoded directly into an array, and anything else is validated by
+    `validate_optima` as decoded JSON, so the errors are the same.
+
+    Args:
+        optima (str): JSON encoded optima
+
+    Raises:
+        json.JSONDecodeError: if the optima is not JSON
+        jsonschema.exceptions.ValidationError: if the optima is invalid
+
+    Returns:
+        npt.NDArray[np.float64]: validated optima of shape (m, d)
+    """
+    opt_arr = decode_array(optima)
+    if opt_arr is not None and opt_arr.ndim == 2 and opt_arr.shape[0] > 0 and opt_arr.shape[1] > 1:  # noqa: PLR2004
+        return validate_optima(opt_arr)
+    return validate_optima(json.loads(optima))
+
+
+def validate_optima_file(path: str) -> npt.NDArray[np.float64]:
+    """Validate the optima of the rosenbrock function stored in a .npy file.
+
+    The validation is done once per file and recorded in a sidecar digest.
+
+    Args:
+        path (str): .npy file of the optima of shape (m, d)
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the optima is invalid
+
+    Returns:
+        npt.NDArray[np.float64]: memory-mapped optima
+    """
+    return load_optima_file(path, min_dim=2)
 
 
 # Schema to validate the variable of the rosenbrock function with n decision dimensions
@@ -48,18 +106,101 @@ VARIABLE_ND_SCHEMA = """{{
 }}"""
 
 
-def validate_variable(variable: Any, dim: int) -> list[float]:  # noqa: ANN401
+def validate_variable(variable: Any, dim: int) -> list[float] | npt.NDArray[np.float64]:  # noqa: ANN401
     """Validate the variable of the rosenbrock function.
 
+    An array is validated by `validate_variable_array` without visiting each element with jsonschema.
+
     Args:
-        variable (Any): variable to be validated
+        variable (Any): variable to be validated, decoded from JSON or as an array
         dim (int): number of decided dimensions
 
     Raises:
         jsonschema.exceptions.ValidationError: if the variable is invalid
+
+    Returns:
+        list[float] | npt.NDArray[np.float64]: validated variable
     """
+    if isinstance(variable, np.ndarray):
+        return validate_variable_array(variable, dim)
     if dim == 1:
         msg = "The rosenbrock function requires at least 2 decision dimensions."
         raise ValidationError(msg)
-    validate(instance=variable, schema=json.loads(VARIABLE_ND_SCHEMA.format(items=dim)))
+    validate_schema(variable, VARIABLE_ND_SCHEMA.format(items=dim))
+    validate_finite(np.asarray(variable, dtype=np.float64), "variable")
     return cast(list[float], variable)
+
+
+def parse_variable(line: str | bytes, dim: int) -> npt.NDArray[np.float64]:
+    """Decode and validate the JSON variable of the rosenbrock function.
+
+    An array of numbers of the right shape is decoded directly into an array, and anything else is validated by
+    `validate_variable`, so the errors are the same.
+
+    Args:
+        line (str | bytes): JSON encoded variable
+        dim (int): number of decided dimensions
+
+    Raises:
+        json.JSONDecodeError: if the variable is not JSON
+        jsonschema.exceptions.ValidationError: if the variable is invalid
+
+    Returns:
+        npt.NDArray[np.float64]: validated variable of shape (dim,)
+    """
+    var_arr = decode_array(line)
+    if var_arr is not None and dim > 1 and var_arr.shape == (dim,):
+        return validate_variable_array(var_arr, dim)
+    return np.asarray(validate_variable(json.loads(line), dim), dtype=np.float64).reshape(dim)
+
+
+def validate_variable_array(variable: npt.NDArray[Any], dim: int) -> npt.NDArray[np.float64]:
+    """Validate the variable of the rosenbrock function given as an array.
+
+    The same variables as `validate_variable` are accepted, checking the shape, the dtype and the finiteness
+    of the array instead of each element.
+
+    Args:
+        variable (npt.NDArray[Any]): variable to be validated
+        dim (int): number of decided dimensions
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the variable is invalid
+
+    Returns:
+        npt.NDArray[np.float64]: validated variable of shape (dim,)
+    """
+    if dim == 1:
+        msg = "The rosenbrock function requires at least 2 decision dimensions."
+        raise ValidationError(msg)
+    if variable.dtype.kind not in "iuf":
+        msg = f"The variable must be numeric, but got dtype {variable.dtype}."
+        raise ValidationError(msg)
+    if variable.shape != (dim,):
+        msg = f"The variable must have shape ({dim},), but got {variable.shape}."
+        raise ValidationError(msg)
+    validate_finite(variable, "variable")
+    return np.asarray(variable, dtype=np.float64).reshape(dim)
+
+
+def validate_population(population: Any, dim: int) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.int8]]:  # noqa: ANN401
+    """Validate the variables of the rosenbrock function in a population at once.
+
+    The shape, the dtype and the finiteness are checked in a single vectorized pass, so the invalid rows can be
+    reported while the valid ones are still evaluated in the same batch.
+
+    Args:
+        population (Any): array of shape (n, dim), or list of decoded JSON variables
+        dim (int): number of decided dimensions
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the population is not made of rows
+
+    Returns:
+        tuple[npt.NDArray[np.bool_], npt.NDArray[np.int8]]: mask of the valid rows and error code of each row,
+            one of the ROW_* codes of `opthub_problems.utils.population`
+    """
+    if dim == 1:
+        msg = "The rosenbrock function requires at least 2 decision dimensions."
+        raise ValidationError(msg)
+    return validate_population_rows(population, dim)
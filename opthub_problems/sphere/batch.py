@@ -0,0 +1,11 @@
+"""Out-of-core batch evaluation of the sphere function."""
+
+from opthub_problems.sphere import validator
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.cli import batch_command
+
+main = batch_command(SphereProblem, validator, "SPHERE")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Chunked evaluation of a single decision variable of the sphere function too large for the memory."""
+
+from opthub_problems.sphere import validator
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.cli import chunked_command
+
+main = chunked_command(SphereProblem, validator, "SPHERE")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Micro-batching evaluation server of the sphere function."""
+
+from opthub_problems.sphere import validator
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.cli import server_command
+
+main = server_command(SphereProblem, validator, "SPHERE")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+"""Generate pyramids of tiles of the landscapes of the problems for interactive viewers.
+
+A pyramid covers a 2D slice of a problem, varying two decision dimensions on a square and fixing the others
+at an origin. Zoom level z splits the square into 2^z x 2^z tiles, laid out as `<z>/<x>/<y>.png` like the
+tiles of web maps, with the rows of the tiles and of their pixels going down the second decision dimension.
+Each tile is written as a PNG image for display and as a .npy array of the raw objective values for probing.
+
+The tiles are rendered in parallel by a pool of processes. The key of each tile, which covers all the inputs
+of the tile, is kept in `tiles.json` with the description of the pyramid, so a tile is rendered again only
+when its inputs have changed:
+
+    python -m opthub_problems.tiles --problem rastrigin --optima '[[0, 0, 0]]' --max-zoom 5 --output-dir tiles
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+import click
+import numpy as np
+import numpy.typing as npt
+from matplotlib import colormaps
+from matplotlib.image import imsave
+
+from opthub_problems.utils.parallel import default_context
+from opthub_problems.utils.problem import Problem, use_single_thread
+from opthub_problems.visualizer import PROBLEMS
+
+LOGGER = logging.getLogger(__name__)
+
+# Name of the file describing the pyramid and keeping the keys of its tiles
+MANIFEST_NAME = "tiles.json"
+
+# Version of the layout and the rendering of the tiles, to bump to render all the tiles again
+TILES_VERSION = 1
+
+# Pyramid of a worker process
+_worker_pyramid: "TilePyramid | None" = None
+
+
+class TilePyramid:
+    """Pyramid of tiles of a 2D slice of a problem.
+
+    The colors of all the tiles share the range of objective values, scaled logarithmically
+    since the landscapes span several orders of magnitude.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        problem: Problem,
+        output_dir: Path,
+        *,
+        axes: tuple[int, int] = (0, 1),
+        origin: npt.ArrayLike | None = None,
+        bounds: tuple[float, float] = (-5.0, 5.0),
+        tile_size: int = 256,
+        value_range: tuple[float, float] | None = None,
+        colormap: str = "rainbow",
+    ) -> None:
+        """Describe the pyramid.
+
+        Args:
+            problem (Problem): problem to visualize
+            output_dir (Path): directory of the tiles
+            axes (tuple[int, int]): decision dimensions varying horizontally and vertically
+            origin (npt.ArrayLike | None): decision variable of shape (d,) fixing the other decision dimensions,
+                the first optimum if None
+            bounds (tuple[float, float]): lower and upper bounds of both varying decision dimensions
+            tile_size (int): number of pixels along each side of a tile
+            value_range (tuple[float, float] | None): objective values of the ends of the colormap,
+                the range over the tile of zoom level 0 if None
+            colormap (str): name of the matplotlib colormap
+
+        Raises:
+            ValueError: if the axes or the origin do not match the decision dimensions of the problem
+        """
+        if len(set(axes)) != 2 or not all(0 <= axis < problem.dim for axis in axes):  # noqa: PLR2004
+            msg = f"The axes must be 2 distinct decision dimensions in [0, {problem.dim}), but got {axes}."
+            raise ValueError(msg)
+        origin_arr = np.array(problem.opt[0] if origin is None else origin, dtype=np.float64)
+        if origin_arr.shape != (problem.dim,):
+            msg = f"The origin must have shape ({problem.dim},), but got {origin_arr.shape}."
+            raise ValueError(msg)
+        self.problem = problem
+        self.output_dir = output_dir
+        self.axes = axes
+        self.origin = origin_arr
+        self.bounds = bounds
+        self.tile_size = tile_size
+        self.colormap = colormap
+        self.value_range = value_range if value_range is not None else self._root_range()
+
+    def _root_range(self) -> tuple[float, float]:
+        """Calculate the range of objective values over the tile of zoom level 0.
+
+        Returns:
+            tuple[float, float]: lowest and highest objective values
+        """
+        values = self.evaluate_tile(0, 0, 0)
+        return float(values.min()), float(values.max())
+
+    def tile_points(self, zoom: int, x: int, y: int) -> npt.NDArray[np.float64]:
+        """Calculate the decision variables at the centers of the pixels of a tile.
+
+        Args:
+            zoom (int): zoom level
+            x (int): column of the tile, from the lower bound of the horizontal decision dimension
+            y (int): row of the tile, from the upper bound of the vertical decision dimension
+
+        Returns:
+            npt.NDArray[np.float64]: decision variables of shape (s * s, d), row by row of pixels
+        """
+        span = (self.bounds[1] - self.bounds[0]) / 2**zoom
+        offsets = (np.arange(self.tile_size) + 0.5) / self.tile_size
+        u, v = np.meshgrid(self.bounds[0] + span * (x + offsets), self.bounds[1] - span * (y + offsets))
+        points = np.tile(self.origin, (u.size, 1))
+        points[:, self.axes[0]] = u.ravel()
+        points[:, self.axes[1]] = v.ravel()
+        return points
+
+    def evaluate_tile(self, zoom: int, x: int, y: int) -> npt.NDArray[np.float64]:
+        """Evaluate the best objective value over the optima at the pixels of a tile.
+
+        Args:
+            zoom (int): zoom level
+            x (int): column of the tile
+            y (int): row of the tile
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (s, s)
+        """
+        obj_arr = self.problem.evaluate_batch(self.tile_points(zoom, x, y))
+        return obj_arr.min(axis=1).reshape(self.tile_size, self.tile_size)
+
+    def colorize(self, values: npt.NDArray[np.float64]) -> npt.NDArray[np.uint8]:
+        """Map objective values to colors on a logarithmic scale of the value range.
+
+        Args:
+            values (npt.NDArray[np.float64]): objective values of shape (s, s)
+
+        Returns:
+            npt.NDArray[np.uint8]: RGBA colors of shape (s, s, 4)
+        """
+        low, high = self.value_range
+        scaled = np.log1p(np.clip(values - low, 0.0, None)) / max(np.log1p(high - low), np.finfo(np.float64).tiny)
+        return colormaps[self.colormap](np.clip(scaled, 0.0, 1.0), bytes=True)  # type: ignore[no-any-return]
+
+    def tile_key(self, zoom: int, x: int, y: int) -> str:
+        """Calculate the key of the inputs of a tile.
+
+        Args:
+            zoom (int): zoom level
+            x (int): column of the tile
+            y (int): row of the tile
+
+        Returns:
+            str: key of the tile
+        """
+        digest = hashlib.blake2b(self.problem.digest, digest_size=16)
+        digest.update(self.origin.tobytes())
+        settings = [TILES_VERSION, self.axes, self.bounds, self.tile_size, self.value_range, self.colormap]
+        digest.update(json.dumps([*settings, zoom, x, y]).encode())
+        return digest.hexdigest()
+
+    def tile_path(self, zoom: int, x: int, y: int) -> Path:
+        """Get the path of a tile without its suffix.
+
+        Args:
+            zoom (int): zoom level
+            x (int): column of the tile
+            y (int): row of the tile
+
+        Returns:
+            Path: path of the tile without its suffix
+        """
+        return self.output_dir / str(zoom) / str(x) / str(y)
+
+    def render_tile(self, zoom: int, x: int, y: int) -> None:
+        """Evaluate a tile and write its PNG image and its raw objective values.
+
+        Args:
+            zoom (int): zoom level
+            x (int): column of the tile
+            y (int): row of the tile
+        """
+        values = self.evaluate_tile(zoom, x, y)
+        path = self.tile_path(zoom, x, y)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path.with_suffix(".npy"), values.astype(np.float32))
+        # The fastest compression, since deflating the PNG costs more than evaluating the tile
+        imsave(path.with_suffix(".png"), self.colorize(values), format="png", pil_kwargs={"compress_level": 1})
+
+    def describe(self) -> dict[str, Any]:
+        """Describe the pyramid for the viewers.
+
+        Returns:
+            dict[str, Any]: description of the pyramid
+        """
+        return {
+            "version": TILES_VERSION,
+            "problem": self.problem.name,
+            "axes": list(self.axes),
+            "origin": self.origin.tolist(),
+            "bounds": list(self.bounds),
+            "tile_size": self.tile_size,
+            "value_range": list(self.value_range),
+            "colormap": self.colormap,
+        }
+
+
+def _init_worker(pyramid: TilePyramid) -> None:
+    """Keep the pyramid in the worker process, evaluating it in a single thread as the workers run in parallel.
+
+    Args:
+        pyramid (TilePyramid): pyramid to render
+    """
+    global _worker_pyramid  # noqa: PLW0603
+    _worker_pyramid = pyramid
+    use_single_thread()
+
+
+def _render_tile(tile: tuple[int, int, int]) -> tuple[int, int, int]:
+    """Render a tile of the pyramid of the worker process.
+
+    Args:
+        tile (tuple[int, int, int]): zoom level, column and row of the tile
+
+    Returns:
+        tuple[int, int, int]: rendered tile
+    """
+    if _worker_pyramid is None:
+        msg = "The worker is not initialized."
+        raise RuntimeError(msg)
+    _worker_pyramid.render_tile(*tile)
+    return tile
+
+
+def load_manifest(output_dir: Path) -> dict[str, Any]:
+    """Load the manifest of the tiles rendered in a directory.
+
+    Args:
+        output_dir (Path): directory of the tiles
+
+    Returns:
+        dict[str, Any]: description of the pyramid and keys of its tiles, empty if there is none
+    """
+    path = output_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        manifest: dict[str, Any] = json.loads(path.read_text())
+    except json.JSONDecodeError:
+        LOGGER.warning("Ignoring the malformed manifest %s.", path)
+        return {}
+    return manifest
+
+
+def save_manifest(output_dir: Path, manifest: dict[str, Any]) -> None:
+    """Save the manifest of the tiles rendered in a directory.
+
+    Args:
+        output_dir (Path): directory of the tiles
+        manifest (dict[str, Any]): description of the pyramid and keys of its tiles
+    """
+    path = output_dir / MANIFEST_NAME
+    # Written under a temporary name then renamed, so an interrupted run never leaves a partial manifest
+    temporary = path.with_suffix(f".{os.getpid()}.json")
+    temporary.write_text(json.dumps(manifest, indent=2))
+    temporary.replace(path)
+
+
+def render_pyramid(pyramid: TilePyramid, max_zoom: int, workers: int | None = None) -> list[tuple[int, int, int]]:
+    """Render the tiles of the zoom levels up to a maximum whose inputs have changed since the last run.
+
+    Args:
+        pyramid (TilePyramid): pyramid to render
+        max_zoom (int): highest zoom level
+        workers (int | None): number of worker processes, defaults to the number of CPUs
+
+    Returns:
+        list[tuple[int, int, int]]: rendered tiles
+    """
+    manifest = load_manifest(pyramid.output_dir)
+    keys: dict[str, str] = manifest.get("tiles", {})
+    current = {}
+    pending = []
+    for zoom in range(max_zoom + 1):
+        for x in range(2**zoom):
+            for y in range(2**zoom):
+                name = f"{zoom}/{x}/{y}"
+                current[name] = pyramid.tile_key(zoom, x, y)
+                path = pyramid.tile_path(zoom, x, y)
+                exists = path.with_suffix(".png").exists() and path.with_suffix(".npy").exists()
+                if keys.get(name) != current[name] or not exists:
+                    pending.append((zoom, x, y))
+    LOGGER.info("Rendering %d of %d tiles...", len(pending), len(current))
+
+    pyramid.output_dir.mkdir(parents=True, exist_ok=True)
+    # The keys of the rendered tiles are saved even on failure, so the next run resumes where this one stopped
+    rendered: list[tuple[int, int, int]] = []
+    try:
+        if workers == 1 or len(pending) <= 1:
+            for tile in pending:
+                pyramid.render_tile(*tile)
+                rendered.append(tile)
+        else:
+            with default_context().Pool(workers, initializer=_init_worker, initargs=(pyramid,)) as pool:
+                # Appended one by one, so the tiles rendered before a failure are kept
+                for tile in pool.imap_unordered(_render_tile, pending):
+                    rendered.append(tile)  # noqa: PERF402
+    finally:
+        stale = {f"{zoom}/{x}/{y}" for zoom, x, y in set(pending) - set(rendered)}
+        tiles = {name: key for name, key in current.items() if name not in stale}
+        save_manifest(pyramid.output_dir, {**pyramid.describe(), "max_zoom": max_zoom, "tiles": tiles})
+    return rendered
+
+
+@click.command(help="Generate a pyramid of tiles of the landscape of a problem.")
+@click.option(
+    "--problem",
+    type=click.Choice(list(PROBLEMS)),
+    required=True,
+    help="Problem to visualize.",
+)
+@click.option(
+    "--optima",
+    type=str,
+    default=None,
+    help="Optima of the problem, the ones of the thumbnails by default.",
+)
+@click.option(
+    "--axes",
+    type=(int, int),
+    default=(0, 1),
+    help="Decision dimensions varying horizontally and vertically.",
+)
+@click.option(
+    "--origin",
+    type=str,
+    default=None,
+    help="Decision variable fixing the other decision dimensions, the first optimum by default.",
+)
+@click.option(
+    "--bounds",
+    type=(float, float),
+    default=(-5.0, 5.0),
+    help="Lower and upper bounds of both varying decision dimensions.",
+)
+@click.option(
+    "--max-zoom",
+    type=click.IntRange(min=0),
+    default=4,
+    help="Highest zoom level.",
+)
+@click.option(
+    "--tile-size",
+    type=click.IntRange(min=1),
+    default=256,
+    help="Number of pixels along each side of a tile.",
+)
+@click.option(
+    "--value-range",
+    type=(float, float),
+    default=None,
+    help="Objective values of the ends of the colormap, the range over the tile of zoom level 0 by default.",
+)
+@click.option(
+    "--colormap",
+    type=click.Choice(sorted(colormaps)),
+    default="rainbow",
+    help="Colormap of the PNG tiles.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    required=True,
+    help="Directory of the tiles.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes, the number of CPUs by default.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
+    default="INFO",
+    help="Log level.",
+)
+def main(  # noqa: PLR0913, PLR0917
+    problem: str,
+    optima: str | None,
+    axes: tuple[int, int],
+    origin: str | None,
+    bounds: tuple[float, float],
+    max_zoom: int,
+    tile_size: int,
+    value_range: tuple[float, float] | None,
+    colormap: str,
+    output_dir: str,
+    workers: int | None,
+    log_level: str,
+) -> None:
+    """Render the tiles of a problem."""
+    logging.basicConfig(level=log_level)
+
+    problem_class, default_optima = PROBLEMS[problem]
+    try:
+        pyramid = TilePyramid(
+            problem_class(json.loads(optima) if optima is not None else default_optima),
+            Path(output_dir),
+            axes=axes,
+            origin=json.loads(origin) if origin is not None else None,
+            bounds=bounds,
+            tile_size=tile_size,
+            value_range=value_range,
+            colormap=colormap,
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+    rendered = render_pyramid(pyramid, max_zoom, workers)
+    LOGGER.info("Rendered %d tiles in %s.", len(rendered), output_dir)
+
+
+if __name__ == "__main__":
+    main()
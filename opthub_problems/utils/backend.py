@@ -0,0 +1,229 @@
+"""Registry of the compute backends evaluating the problems.
+
+The backend is selected by the `--backend` option of the commands or the OPTHUB_BACKEND environment variable.
+The numba and dask backends need the optional dependencies of the `backends` extra.
+"""
+
+import importlib.util
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from opthub_problems.utils.problem import Problem
+
+LOGGER = logging.getLogger(__name__)
+
+# Environment variable selecting the backend when none is given
+BACKEND_ENVVAR = "OPTHUB_BACKEND"
+
+# Backend used by default and when the selected one is unavailable
+DEFAULT_BACKEND = "numpy"
+
+# Size in bytes of the row chunks of the Dask backend
+DASK_CHUNK_BYTES = 128 * 1024**2
+
+# Backend classes by name, in registration order
+_backend_classes: dict[str, type["Backend"]] = {}
+
+# Backend instances by name, created on first use
+_backends: dict[str, "Backend"] = {}
+
+
+def register_backend(backend_class: type["Backend"]) -> type["Backend"]:
+    """Register a backend class under its name.
+
+    Args:
+        backend_class (type[Backend]): backend class to register
+
+    Returns:
+        type[Backend]: the same backend class, so this can be used as a decorator
+    """
+    _backend_classes[backend_class.name] = backend_class
+    return backend_class
+
+
+def backend_names() -> list[str]:
+    """Get the names of the registered backends, available or not.
+
+    Returns:
+        list[str]: names of the backends
+    """
+    return list(_backend_classes)
+
+
+def get_backend(name: str | None = None) -> "Backend":
+    """Get a backend by name, falling back to the default backend if it is unavailable.
+
+    Args:
+        name (str | None): name of the backend, or None for $OPTHUB_BACKEND or the default backend
+
+    Raises:
+        ValueError: if the backend is not registered
+
+    Returns:
+        Backend: shared instance of the backend
+    """
+    if name is None:
+        name = os.environ.get(BACKEND_ENVVAR) or DEFAULT_BACKEND
+    if name not in _backend_classes:
+        msg = f"The backend must be one of {backend_names()}, but got {name}."
+        raise ValueError(msg)
+    if name not in _backends:
+        if not _backend_classes[name].is_available():
+            LOGGER.warning("The %s backend is unavailable, falling back to the %s backend.", name, DEFAULT_BACKEND)
+            return get_backend(DEFAULT_BACKEND)
+        _backends[name] = _backend_classes[name]()
+    return _backends[name]
+
+
+class Backend(ABC):
+    """Backend computing the objective values of a problem."""
+
+    name: ClassVar[str]
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check whether the optional dependencies of the backend are installed.
+
+        Returns:
+            bool: True if the backend can be used
+        """
+        return True
+
+    @abstractmethod
+    def evaluate(self, problem: "Problem", var_arr: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.floating[Any]]:
+        """Calculate the objective values of validated decision variables.
+
+        Args:
+            problem (Problem): problem to evaluate
+            var_arr (npt.NDArray[np.floating[Any]]): rotated decision variables of shape (n, d)
+                in the precision of the problem
+
+        Returns:
+            npt.NDArray[np.floating[Any]]: objective values of shape (n, m)
+        """
+
+    def evaluate_batch(self, problem: "Problem", var_batch: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Calculate the objective values of a batch of decision variables.
+
+        Args:
+            problem (Problem): problem to evaluate
+            var_batch (npt.ArrayLike): decision variables of shape (n, d)
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (n, m)
+        """
+        return problem._evaluate(problem.rotate(problem._as_batch(var_batch)))  # noqa: SLF001
+
+
+@register_backend
+class NumpyBackend(Backend):
+    """Backend running the NumPy kernels of the problems block by block on the thread pool."""
+
+    name = "numpy"
+
+    def evaluate(self, problem: "Problem", var_arr: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.floating[Any]]:  # noqa: D102
+        return problem._evaluate_blocked(var_arr, problem.get_block_size(var_arr.shape[0]))  # noqa: SLF001
+
+
+@register_backend
+class NumbaBackend(Backend):
+    """Backend compiling the loop kernels of the problems with Numba.
+
+    The kernels are compiled once per process and their machine code is cached on disk next to their modules,
+    so the next processes skip the compilation. They release the GIL and run block by block on the thread pool
+    like the NumPy kernels. They accumulate in float64, so the objective values match the NumPy kernels
+    up to rounding but are not bit-identical.
+    """
+
+    name = "numba"
+
+    def __init__(self) -> None:
+        """Initialize the compiled kernels."""
+        self._kernels: dict[Callable[..., None], Callable[..., None]] = {}
+
+    @classmethod
+    def is_available(cls) -> bool:  # noqa: D102
+        return importlib.util.find_spec("numba") is not None
+
+    def evaluate(self, problem: "Problem", var_arr: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.floating[Any]]:  # noqa: D102
+        kernel = self._compile(problem.loop_kernel)
+        constants = [getattr(problem, name) for name in problem.kernel_constants]
+
+        def partial_kernel(var_rows: npt.NDArray[np.floating[Any]], start: int, stop: int) -> npt.NDArray[Any]:
+            obj_arr = np.empty((var_rows.shape[0], problem.n_optima), dtype=problem.dtype)
+            kernel(np.ascontiguousarray(var_rows), start, stop, obj_arr, *constants)
+            return obj_arr
+
+        return problem._evaluate_blocked(var_arr, problem.get_block_size(var_arr.shape[0]), partial_kernel)  # noqa: SLF001
+
+    def _compile(self, function: Callable[..., None]) -> Callable[..., None]:
+        """Compile a loop kernel on first use.
+
+        Args:
+            function (Callable[..., None]): loop kernel in plain Python
+
+        Returns:
+            Callable[..., None]: compiled kernel
+        """
+        if function not in self._kernels:
+            import numba  # noqa: PLC0415
+
+            LOGGER.debug("Compiling %s with Numba...", function.__qualname__)
+            self._kernels[function] = numba.njit(cache=True, nogil=True)(function)
+        return self._kernels[function]
+
+
+def _evaluate_chunk(problem: "Problem", var_chunk: npt.NDArray[Any]) -> npt.NDArray[np.float64]:
+    """Evaluate a chunk of rows of a Dask array with the NumPy kernels.
+
+    Args:
+        problem (Problem): problem to evaluate
+        var_chunk (npt.NDArray[Any]): decision variables of shape (k, d)
+
+    Returns:
+        npt.NDArray[np.float64]: objective values of shape (k, m)
+    """
+    return problem._evaluate(problem.rotate(problem._as_batch(var_chunk)))  # noqa: SLF001
+
+
+@register_backend
+class DaskBackend(NumpyBackend):
+    """Backend evaluating large batches as Dask arrays chunked by rows.
+
+    A batch larger than a chunk, or given as a Dask array, is evaluated chunk by chunk by the Dask scheduler,
+    so a memory-mapped population bigger than the memory is read one chunk at a time.
+    The chunks are evaluated with the NumPy kernels, so the objective values are bit-identical to them.
+    """
+
+    name = "dask"
+
+    @classmethod
+    def is_available(cls) -> bool:  # noqa: D102
+        return importlib.util.find_spec("dask") is not None
+
+    def evaluate_batch(self, problem: "Problem", var_batch: npt.ArrayLike) -> npt.NDArray[np.float64]:  # noqa: D102
+        import dask.array as da  # noqa: PLC0415
+
+        is_dask = isinstance(var_batch, da.Array)
+        if not is_dask and np.asarray(var_batch).nbytes <= DASK_CHUNK_BYTES:
+            return super().evaluate_batch(problem, var_batch)
+        var_arr: Any = var_batch if is_dask else da.from_array(var_batch)
+        if var_arr.ndim != 2 or var_arr.shape[1] != problem.dim:  # noqa: PLR2004
+            msg = f"Expected decision variables of shape (n, {problem.dim}), but got {var_arr.shape}."
+            raise ValueError(msg)
+        chunk_rows = max(1, DASK_CHUNK_BYTES // (problem.dim * var_arr.dtype.itemsize))
+        var_arr = var_arr.rechunk((chunk_rows, -1))
+        obj_arr = var_arr.map_blocks(
+            partial(_evaluate_chunk, problem),
+            dtype=np.float64,
+            chunks=(var_arr.chunks[0], (problem.n_optima,)),
+        )
+        return np.asarray(obj_arr.compute(), dtype=np.float64)
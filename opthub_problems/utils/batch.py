@@ -0,0 +1,226 @@
+"""Out-of-core evaluation of populations stored in .npy files."""
+
+import copy
+import logging
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from opthub_problems.utils.parallel import ParallelEvaluator
+from opthub_problems.utils.problem import Problem
+
+LOGGER = logging.getLogger(__name__)
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(size: str) -> int:
+    """Parse a memory size such as 512M or 2G.
+
+    Args:
+        size (str): number of bytes with an optional K, M, G or T suffix
+
+    Returns:
+        int: number of bytes
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([KMGT]?)i?B?\s*", size, flags=re.IGNORECASE)
+    if match is None:
+        msg = f"Invalid memory size: {size}"
+        raise ValueError(msg)
+    return int(match.group(1)) * SIZE_UNITS[match.group(2).upper()]
+
+
+def chunk_rows_for_memory(  # noqa: PLR0913, PLR0917
+    max_memory: int,
+    dim: int,
+    n_optima: int,
+    block_rows: int = 1,
+    block_bytes: int = 0,
+    concurrency: int = 1,
+) -> int:
+    """Calculate the number of rows to evaluate at once within the memory budget.
+
+    A chunk of k rows is split into ceil(k / block_rows) blocks, of which at most `concurrency` hold their
+    temporaries at once, so the budget covers the rows of the chunk and the temporaries of that many blocks.
+
+    Args:
+        max_memory (int): memory budget in bytes
+        dim (int): number of decision dimensions
+        n_optima (int): number of optima
+        block_rows (int): number of rows of a block
+        block_bytes (int): memory of the temporaries of a block
+        concurrency (int): number of blocks evaluated at once
+
+    Returns:
+        int: number of rows, 1 with a warning if not even a single row fits in the budget
+    """
+    itemsize = np.dtype(np.float64).itemsize
+    row_bytes = itemsize * (dim + n_optima)
+    rows = (max_memory - concurrency * block_bytes) // row_bytes
+    if rows < concurrency * block_rows:
+        # The chunk has fewer blocks than the concurrency, each taking its rows and its own temporaries
+        n_blocks, rest = divmod(max_memory, block_rows * row_bytes + block_bytes)
+        rows = n_blocks * block_rows + max(0, (rest - block_bytes) // row_bytes)
+    if rows < 1:
+        LOGGER.warning(
+            "The memory budget of %d bytes does not fit a row of %d bytes and the temporaries of its block of %d "
+            "bytes, so the rows are evaluated one by one beyond the budget.",
+            max_memory,
+            row_bytes,
+            block_bytes,
+        )
+        return 1
+    return rows
+
+
+def _chunk_rows_for_problem(problem: Problem, block_size: int, max_memory: int, workers: int) -> int:
+    """Calculate the number of rows of a problem to evaluate at once within the memory budget.
+
+    Args:
+        problem (Problem): problem to evaluate
+        block_size (int): number of elements of a block
+        max_memory (int): memory budget in bytes
+        workers (int): number of worker processes
+
+    Returns:
+        int: number of rows
+    """
+    # The worker processes evaluate one block each at once, and a single process a block per thread
+    concurrency = workers if workers > 1 else os.cpu_count() or 1
+    return chunk_rows_for_memory(
+        max_memory,
+        problem.dim,
+        problem.n_optima,
+        problem.block_rows(block_size),
+        problem.block_bytes(block_size),
+        concurrency,
+    )
+
+
+def _start_workers(problem: Problem, block_size: int, workers: int) -> ParallelEvaluator | None:
+    """Start the worker processes evaluating the chunks, unless there is a single one.
+
+    Args:
+        problem (Problem): problem to evaluate
+        block_size (int): number of elements of a block the chunks are sized for
+        workers (int): number of worker processes
+
+    Returns:
+        ParallelEvaluator | None: evaluator on the workers, or None for a single worker
+    """
+    if workers <= 1:
+        return None
+    # The workers evaluate with the block size the chunks are sized for instead of calibrating it again
+    worker_problem = copy.copy(problem)
+    worker_problem.block_size = block_size
+    return ParallelEvaluator(worker_problem, workers)
+
+
+def evaluate_valid_rows(
+    evaluate_batch: Callable[[npt.NDArray[Any]], npt.NDArray[np.float64]],
+    chunk: npt.NDArray[Any],
+    mask: npt.NDArray[np.bool_],
+    n_optima: int,
+) -> npt.NDArray[np.float64]:
+    """Evaluate the valid rows of a chunk, giving NaN objectives to the invalid ones.
+
+    Args:
+        evaluate_batch (Callable[[npt.NDArray[Any]], npt.NDArray[np.float64]]): function evaluating rows
+        chunk (npt.NDArray[Any]): rows of shape (n, d)
+        mask (npt.NDArray[np.bool_]): mask of the valid rows of shape (n,)
+        n_optima (int): number of optima
+
+    Returns:
+        npt.NDArray[np.float64]: objectives of shape (n, m)
+    """
+    if mask.all():
+        return evaluate_batch(chunk)
+    obj_arr = np.full((len(chunk), n_optima), np.nan)
+    if mask.any():
+        obj_arr[mask] = evaluate_batch(chunk[mask])
+    return obj_arr
+
+
+def evaluate_npy(  # noqa: PLR0913
+    problem: Problem,
+    input_path: str | Path,
+    output_path: str | Path,
+    *,
+    chunk_rows: int | None = None,
+    max_memory: int = 256 * 1024**2,
+    workers: int = 1,
+    validate_population: Callable[[Any, int], tuple[npt.NDArray[np.bool_], npt.NDArray[np.int8]]] | None = None,
+    errors_path: str | Path | None = None,
+) -> None:
+    """Evaluate a memory-mapped population of shape (n, d) chunk by chunk.
+
+    The objectives of shape (n, m) are written to a memory-mapped .npy file,
+    so the peak memory is bounded by the chunk size instead of n.
+    If `validate_population` is given, the invalid rows of each chunk get NaN objectives and the valid ones
+    are still evaluated, and the error code of each row is written to `errors_path` if given.
+
+    Args:
+        problem (Problem): problem built from the validated optima
+        input_path (str | Path): .npy file of the population
+        output_path (str | Path): .npy file to write the objectives to
+        chunk_rows (int | None): number of rows to evaluate at once, derived from max_memory if None
+        max_memory (int): memory budget in bytes used when chunk_rows is None
+        workers (int): number of worker processes evaluating each chunk in parallel
+        validate_population (Callable[[Any, int], tuple[npt.NDArray[np.bool_], npt.NDArray[np.int8]]] | None):
+            validator of the rows of a chunk returning the mask of the valid rows and their error codes
+        errors_path (str | Path | None): .npy file to write the int8 error code of each row to
+    """
+    population = np.load(input_path, mmap_mode="r")
+    dim = problem.dim
+    if population.ndim != 2 or population.shape[1] != dim:  # noqa: PLR2004
+        msg = f"Expected a population of shape (n, {dim}), but got {population.shape}."
+        raise ValueError(msg)
+    if population.dtype.kind not in "iuf":
+        msg = f"The population must be numeric, but got dtype {population.dtype}."
+        raise ValueError(msg)
+
+    n_rows = population.shape[0]
+    # Calibrated before sizing the chunks, since the temporaries of the blocks follow the block size
+    block_size = problem.get_block_size(n_rows)
+    if chunk_rows is None:
+        chunk_rows = _chunk_rows_for_problem(problem, block_size, max_memory, workers)
+    LOGGER.info("Evaluating %d rows in chunks of %d rows...", n_rows, chunk_rows)
+
+    objectives = np.lib.format.open_memmap(output_path, mode="w+", dtype=np.float64, shape=(n_rows, problem.n_optima))
+    errors = (
+        None
+        if errors_path is None
+        else np.lib.format.open_memmap(errors_path, mode="w+", dtype=np.int8, shape=(n_rows,))
+    )
+    evaluator = _start_workers(problem, block_size, workers)
+    evaluate_batch = problem.evaluate_batch if evaluator is None else evaluator.evaluate_batch
+    n_invalid = 0
+    try:
+        for start in range(0, n_rows, chunk_rows):
+            stop = min(start + chunk_rows, n_rows)
+            chunk = population[start:stop]
+            if validate_population is None:
+                objectives[start:stop] = evaluate_batch(chunk)
+            else:
+                mask, codes = validate_population(chunk, dim)
+                if errors is not None:
+                    errors[start:stop] = codes
+                n_invalid += len(mask) - int(np.count_nonzero(mask))
+                objectives[start:stop] = evaluate_valid_rows(evaluate_batch, chunk, mask, problem.n_optima)
+            LOGGER.debug("Evaluated rows %d to %d.", start, stop)
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+    if n_invalid:
+        LOGGER.warning("%d invalid rows were not evaluated and have NaN objectives.", n_invalid)
+    objectives.flush()
+    del objectives
+    if errors is not None:
+        errors.flush()
+        del errors
+    LOGGER.info("...Evaluated.")
@@ -0,0 +1,181 @@
+"""Binary wire formats of the solution variables and the objectives.
+
+Two formats are supported besides JSON:
+
+- npy: each frame is a complete NumPy .npy file (header and data).
+  An error is returned as a .npy frame of a unicode string array.
+- raw: each frame is a little-endian int64 element count followed by the little-endian float64 elements.
+  An error is returned as a negative int64 byte count followed by the UTF-8 encoded message.
+"""
+
+import io
+import logging
+import struct
+import sys
+from collections.abc import Callable
+from traceback import format_exc
+from typing import Any, BinaryIO
+
+import numpy as np
+import numpy.typing as npt
+
+LOGGER = logging.getLogger(__name__)
+
+DATA_FORMATS = ["json", "npy", "raw"]
+
+RAW_PREFIX = struct.Struct("<q")
+RAW_DTYPE = np.dtype("<f8")
+
+
+def read_exact(stream: BinaryIO, size: int) -> bytes | None:
+    """Read exactly the given number of bytes.
+
+    Args:
+        stream (BinaryIO): buffered input stream
+        size (int): number of bytes to read
+
+    Raises:
+        EOFError: if the stream ends in the middle of the bytes
+
+    Returns:
+        bytes | None: read bytes, or None if the stream is already at EOF
+    """
+    data = stream.read(size)
+    if not data:
+        return None
+    if len(data) < size:
+        msg = f"Unexpected EOF: expected {size} bytes, but got {len(data)} bytes."
+        raise EOFError(msg)
+    return data
+
+
+def read_npy_frame(stream: BinaryIO) -> npt.NDArray[Any] | None:
+    """Read an array from a .npy frame without copying the data.
+
+    Args:
+        stream (BinaryIO): input stream
+
+    Returns:
+        npt.NDArray[Any] | None: read array, or None at EOF
+    """
+    magic = read_exact(stream, np.lib.format.MAGIC_LEN)
+    if magic is None:
+        return None
+    version = np.lib.format.read_magic(io.BytesIO(magic))
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject:
+        msg = "Object arrays are not supported."
+        raise ValueError(msg)
+
+    size = int(np.prod(shape)) * dtype.itemsize
+    data = read_exact(stream, size) if size > 0 else b""
+    if data is None:
+        msg = "Unexpected EOF: the .npy frame has no data."
+        raise EOFError(msg)
+    return np.frombuffer(data, dtype=dtype).reshape(shape, order="F" if fortran_order else "C")
+
+
+def write_npy_frame(stream: BinaryIO, array: npt.NDArray[Any]) -> None:
+    """Write an array as a .npy frame.
+
+    Args:
+        stream (BinaryIO): output stream
+        array (npt.NDArray[Any]): array to write
+    """
+    np.lib.format.write_array(stream, array, allow_pickle=False)
+
+
+def read_raw_frame(stream: BinaryIO) -> npt.NDArray[np.float64] | None:
+    """Read a length-prefixed raw float64 frame without copying the data.
+
+    Args:
+        stream (BinaryIO): input stream
+
+    Returns:
+        npt.NDArray[np.float64] | None: read array, or None at EOF
+    """
+    prefix = read_exact(stream, RAW_PREFIX.size)
+    if prefix is None:
+        return None
+    (count,) = RAW_PREFIX.unpack(prefix)
+    if count < 0:
+        msg = f"The element count must be non-negative, but got {count}."
+        raise ValueError(msg)
+    data = read_exact(stream, count * RAW_DTYPE.itemsize) if count > 0 else b""
+    if data is None:
+        msg = "Unexpected EOF: the raw frame has no data."
+        raise EOFError(msg)
+    return np.frombuffer(data, dtype=RAW_DTYPE)
+
+
+def write_raw_frame(stream: BinaryIO, array: npt.NDArray[Any]) -> None:
+    """Write an array as a length-prefixed raw float64 frame.
+
+    Args:
+        stream (BinaryIO): output stream
+        array (npt.NDArray[Any]): array to write
+    """
+    data = np.ascontiguousarray(array, dtype=RAW_DTYPE).ravel()
+    stream.write(RAW_PREFIX.pack(data.size))
+    stream.write(data.data)
+
+
+def write_error_frame(stream: BinaryIO, data_format: str, message: str) -> None:
+    """Write an error as a frame of the given format.
+
+    Args:
+        stream (BinaryIO): output stream
+        data_format (str): npy or raw
+        message (str): error message
+    """
+    if data_format == "npy":
+        write_npy_frame(stream, np.array(message))
+    else:
+        encoded = message.encode("utf-8")
+        stream.write(RAW_PREFIX.pack(-len(encoded)))
+        stream.write(encoded)
+
+
+def serve_binary(
+    handle: Callable[[npt.NDArray[Any]], npt.NDArray[np.float64]],
+    data_format: str,
+    stream: bool,
+    stdin: BinaryIO | None = None,
+    stdout: BinaryIO | None = None,
+) -> None:
+    """Evaluate solution variables given as binary frames.
+
+    An error raised by `handle` is reported as an error frame and does not stop the stream.
+
+    Args:
+        handle (Callable[[npt.NDArray[Any]], npt.NDArray[np.float64]]): function to evaluate a variable
+        data_format (str): npy or raw
+        stream (bool): keep evaluating frames until EOF if True, otherwise evaluate one frame
+        stdin (BinaryIO | None): input stream, defaults to sys.stdin.buffer
+        stdout (BinaryIO | None): output stream, defaults to sys.stdout.buffer
+
+    Raises:
+        EOFError: if no frame is given when not streaming
+    """
+    stdin = sys.stdin.buffer if stdin is None else stdin
+    stdout = sys.stdout.buffer if stdout is None else stdout
+    read_frame = read_npy_frame if data_format == "npy" else read_raw_frame
+    write_frame = write_npy_frame if data_format == "npy" else write_raw_frame
+
+    while (variable := read_frame(stdin)) is not None:
+        try:
+            result = handle(variable)
+        except Exception as e:
+            LOGGER.exception(format_exc())
+            write_error_frame(stdout, data_format, str(e))
+        else:
+            write_frame(stdout, result)
+        stdout.flush()
+        if not stream:
+            return
+    if not stream:
+        msg = "No solution variable was given."
+        raise EOFError(msg)
@@ -0,0 +1,200 @@
+"""Content-addressed cache of the evaluations."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from opthub_problems.utils.problem import Problem
+
+LOGGER = logging.getLogger(__name__)
+
+# Memory budget of the in-memory entries used by default
+DEFAULT_CACHE_SIZE = 64 * 1024**2
+
+# Seconds to wait for another process holding the lock of the SQLite database
+SQLITE_TIMEOUT = 30.0
+
+# Approximate memory used by an in-memory entry besides its key and objective values
+ENTRY_OVERHEAD = 200
+
+
+class EvaluationCache:
+    """Cache of the objective values keyed by a hash of the problem and the raw bytes of the decision variable.
+
+    The entries are kept in memory and evicted in least-recently-used order once their size exceeds `max_size`.
+    If `path` is given, the entries are also stored in a SQLite database, which outlives the process
+    and is shared by the processes on the same node. The database itself is not evicted.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, path: str | Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size (int): memory budget of the in-memory entries in bytes, 0 to only use the database
+            path (str | Path | None): SQLite database to persist the entries to, or None to only keep them in memory
+        """
+        self.max_size = max_size
+        self.path = Path(path) if path is not None else None
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, npt.NDArray[np.float64]] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+
+    def __enter__(self) -> "EvaluationCache":  # noqa: PYI034
+        """Enter the context.
+
+        Returns:
+            EvaluationCache: this cache
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database on exit."""
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the settings only, since the connection cannot be shared by processes.
+
+        Returns:
+            dict[str, Any]: state of a new empty cache
+        """
+        return {"max_size": self.max_size, "path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Unpickle the settings into a new empty cache.
+
+        Args:
+            state (dict[str, Any]): state of a new empty cache
+        """
+        self.__init__(state["max_size"], state["path"])  # type: ignore[misc]
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def stats(self) -> dict[str, int]:
+        """Get the counters of the cache.
+
+        Returns:
+            dict[str, int]: numbers of hits, misses and in-memory entries, and their size in bytes
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "size": self.size}
+
+    def key(self, problem: Problem, var_arr: npt.NDArray[Any]) -> bytes:
+        """Calculate the key of a decision variable.
+
+        Args:
+            problem (Problem): problem to evaluate
+            var_arr (npt.NDArray[Any]): decision variable in the precision of the problem
+
+        Returns:
+            bytes: key of the evaluation
+        """
+        digest = hashlib.blake2b(problem.digest, digest_size=32)
+        digest.update(np.ascontiguousarray(var_arr).tobytes())
+        return digest.digest()
+
+    def get(self, key: bytes) -> npt.NDArray[np.float64] | None:
+        """Get the objective values of a key, counting a hit or a miss.
+
+        Args:
+            key (bytes): key of the evaluation
+
+        Returns:
+            npt.NDArray[np.float64] | None: objective values of shape (m,), or None if not cached
+        """
+        obj_arr = self._find(key)
+        if obj_arr is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return obj_arr
+
+    def put(self, key: bytes, obj_arr: npt.NDArray[np.float64]) -> None:
+        """Store the objective values of a key.
+
+        Args:
+            key (bytes): key of the evaluation
+            obj_arr (npt.NDArray[np.float64]): objective values of shape (m,)
+        """
+        obj_arr = np.array(obj_arr, dtype=np.float64)
+        obj_arr.flags.writeable = False
+        self._remember(key, obj_arr)
+        if self.path is not None:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO evaluations (key, objective) VALUES (?, ?)",
+                    (key, obj_arr.tobytes()),
+                )
+
+    def _find(self, key: bytes) -> npt.NDArray[np.float64] | None:
+        """Find the objective values of a key in memory, then in the database.
+
+        Args:
+            key (bytes): key of the evaluation
+
+        Returns:
+            npt.NDArray[np.float64] | None: objective values of shape (m,), or None if not cached
+        """
+        obj_arr = self._entries.get(key)
+        if obj_arr is not None:
+            self._entries.move_to_end(key)
+        elif self.path is not None:
+            row = self._connect().execute("SELECT objective FROM evaluations WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                obj_arr = np.frombuffer(row[0], dtype=np.float64)
+                self._remember(key, obj_arr)
+        return obj_arr
+
+    def _remember(self, key: bytes, obj_arr: npt.NDArray[np.float64]) -> None:
+        """Keep the objective values in memory, evicting the least recently used entries.
+
+        Args:
+            key (bytes): key of the evaluation
+            obj_arr (npt.NDArray[np.float64]): read-only objective values of shape (m,)
+        """
+        if key in self._entries:
+            self.size -= len(key) + self._entries.pop(key).nbytes + ENTRY_OVERHEAD
+        entry_size = len(key) + obj_arr.nbytes + ENTRY_OVERHEAD
+        if entry_size > self.max_size:
+            return
+        self._entries[key] = obj_arr
+        self.size += entry_size
+        while self.size > self.max_size:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted_key) + evicted.nbytes + ENTRY_OVERHEAD
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database once per process.
+
+        Returns:
+            sqlite3.Connection: connection to the database
+        """
+        if self._connection is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._connection = sqlite3.connect(str(self.path), timeout=SQLITE_TIMEOUT)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS evaluations (key BLOB PRIMARY KEY, objective BLOB NOT NULL)",
+                )
+            LOGGER.debug("Opened the evaluation cache %s.", self.path)
+        return self._connection
@@ -0,0 +1,179 @@
+"""Evaluation of a single decision variable too large for the memory, chunk by chunk.
+
+The objective functions are sums of terms over the decision dimensions, each reading its own decision dimension
+and at most `Problem.chunk_overlap` next ones. The decision variable is read as a stream of chunks, from an
+iterator, a .npy file or a stream of raw little-endian float64, and the partial objective values of each chunk are
+accumulated, carrying the last decision dimensions over to the next chunk. The optima are read by the same
+chunks, typically from a memory-mapped .npy file, so the memory is bounded by the chunk size whatever the number
+of decision dimensions. The problem is not built, since its constants would take memory for every decision
+dimension, so the rotated variants are not supported.
+"""
+
+import logging
+import sys
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO
+
+import numpy as np
+import numpy.typing as npt
+from jsonschema import ValidationError
+
+from opthub_problems.utils.binary import RAW_DTYPE
+from opthub_problems.utils.problem import Problem
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of (optimum, decision dimension) elements of the temporaries of a chunk
+CHUNK_ELEMENTS = 2**20
+
+# Formats of the decision variables read chunk by chunk
+CHUNK_FORMATS = ["npy", "raw"]
+
+
+def read_npy_chunks(path: str, chunk_size: int) -> Iterator[npt.NDArray[np.float64]]:
+    """Read a decision variable from a memory-mapped .npy file chunk by chunk.
+
+    Args:
+        path (str): .npy file of the decision variable of shape (d,)
+        chunk_size (int): number of decision dimensions of a chunk
+
+    Yields:
+        npt.NDArray[np.float64]: chunks of the decision variable
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the file is not a decision variable of numbers
+    """
+    try:
+        var: npt.NDArray[Any] = np.load(path, mmap_mode="r")
+    except ValueError as e:
+        msg = f"The variable file {path} is not a .npy file of numbers: {e}"
+        raise ValidationError(msg) from e
+    if var.ndim != 1 or var.dtype.kind not in "iuf":
+        msg = f"The variable must be a .npy file of numbers of shape (d,), but got {var.dtype.str} {var.shape}."
+        raise ValidationError(msg)
+    for start in range(0, len(var), chunk_size):
+        yield np.asarray(var[start : start + chunk_size], dtype=np.float64)
+
+
+def read_raw_chunks(stream: BinaryIO, chunk_size: int) -> Iterator[npt.NDArray[np.float64]]:
+    """Read a decision variable from a stream of raw little-endian float64 chunk by chunk, until EOF.
+
+    Args:
+        stream (BinaryIO): buffered input stream
+        chunk_size (int): number of decision dimensions of a chunk
+
+    Yields:
+        npt.NDArray[np.float64]: chunks of the decision variable
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the stream ends in the middle of a number
+    """
+    chunk_bytes = chunk_size * RAW_DTYPE.itemsize
+    while data := stream.read(chunk_bytes):
+        # A pipe may return less than asked for before EOF
+        while len(data) % RAW_DTYPE.itemsize:
+            more = stream.read(RAW_DTYPE.itemsize - len(data) % RAW_DTYPE.itemsize)
+            if not more:
+                msg = f"The variable must be a whole number of float64, but got {len(data)} bytes at the end."
+                raise ValidationError(msg)
+            data += more
+        yield np.frombuffer(data, dtype=RAW_DTYPE).astype(np.float64)
+
+
+class ChunkedEvaluator:
+    """Evaluator of a single decision variable given chunk by chunk."""
+
+    def __init__(self, problem_class: type[Problem], opt: npt.NDArray[Any]) -> None:
+        """Keep the optima without copying them.
+
+        Args:
+            problem_class (type[Problem]): class of the problem
+            opt (npt.NDArray[Any]): validated optima of shape (m, d), typically memory-mapped
+        """
+        if opt.ndim != 2:  # noqa: PLR2004
+            msg = f"Expected optima of shape (m, d), but got {opt.shape}."
+            raise ValueError(msg)
+        self.problem_class = problem_class
+        self.opt = opt
+        self.n_optima, self.dim = opt.shape
+        # The temporaries of a piece of a chunk are bounded whatever the number of optima
+        self.piece_size = max(1, CHUNK_ELEMENTS // self.n_optima)
+
+    def evaluate(self, chunks: Iterable[npt.ArrayLike]) -> npt.NDArray[np.float64]:
+        """Calculate the objective values of a decision variable given chunk by chunk.
+
+        The chunks may have any size, and are split into pieces bounding the temporaries.
+
+        Args:
+            chunks (Iterable[npt.ArrayLike]): consecutive chunks of the decision variable of shape (c,)
+
+        Raises:
+            jsonschema.exceptions.ValidationError: if the decision variable does not have d finite decision dimensions
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (m,)
+        """
+        overlap = self.problem_class.chunk_overlap
+        obj_arr = np.zeros(self.n_optima, dtype=np.float64)
+        carried = np.empty(0, dtype=np.float64)
+        position = 0
+        for chunk in chunks:
+            chunk_arr = np.asarray(chunk, dtype=np.float64)
+            if chunk_arr.ndim != 1:
+                msg = f"The chunks of the variable must have shape (c,), but got {chunk_arr.shape}."
+                raise ValidationError(msg)
+            if position + len(chunk_arr) > self.dim:
+                msg = f"The variable must have {self.dim} elements, but got more."
+                raise ValidationError(msg)
+            if not np.all(np.isfinite(chunk_arr)):
+                msg = f"The variable must be finite, but got a non-finite value after index {position}."
+                raise ValidationError(msg)
+            for piece_start in range(0, len(chunk_arr), self.piece_size):
+                piece = chunk_arr[piece_start : piece_start + self.piece_size]
+                # The window starts with the decision dimensions carried over from the previous piece
+                window = np.concatenate([carried, piece])
+                start = position + piece_start - len(carried)
+                opt_window = np.asarray(self.opt[:, start : start + len(window)], dtype=np.float64)
+                if len(window) > overlap:
+                    obj_arr += self.problem_class.chunk_partial(window, opt_window, start, self.dim)
+                    carried = window[len(window) - overlap :]
+                else:
+                    carried = window
+            position += len(chunk_arr)
+            LOGGER.debug("Evaluated %d of %d decision dimensions.", position, self.dim)
+        if position != self.dim:
+            msg = f"The variable must have {self.dim} elements, but got {position}."
+            raise ValidationError(msg)
+        return obj_arr
+
+
+def evaluate_path(
+    evaluator: ChunkedEvaluator,
+    path: str,
+    data_format: str | None = None,
+    chunk_size: int = CHUNK_ELEMENTS,
+) -> npt.NDArray[np.float64]:
+    """Calculate the objective values of a decision variable read from a file or stdin chunk by chunk.
+
+    Args:
+        evaluator (ChunkedEvaluator): evaluator of the problem
+        path (str): file of the decision variable, or - for stdin
+        data_format (str | None): npy or raw, raw for stdin and npy for a file if None
+        chunk_size (int): number of decision dimensions of a chunk
+
+    Raises:
+        ValueError: if the format is npy but the decision variable is read from stdin
+
+    Returns:
+        npt.NDArray[np.float64]: objective values of shape (m,)
+    """
+    data_format = data_format or ("raw" if path == "-" else "npy")
+    if data_format == "npy":
+        if path == "-":
+            msg = "The npy format needs a file, since it is memory-mapped."
+            raise ValueError(msg)
+        return evaluator.evaluate(read_npy_chunks(path, chunk_size))
+    if path == "-":
+        return evaluator.evaluate(read_raw_chunks(sys.stdin.buffer, chunk_size))
+    with open(path, "rb") as stream:  # noqa: PTH123
+        return evaluator.evaluate(read_raw_chunks(stream, chunk_size))
@@ -0,0 +1,362 @@
+"""Commands shared by the problems, built for each problem from its class, its validators and its env vars.
+
+Each problem keeps thin entry modules building its commands, such as `opthub_problems/sphere/batch.py`,
+so the commands are still run with `python -m opthub_problems.<problem>.<command>`. The validator module of
+a problem provides `parse_optima`, `validate_optima_file`, `parse_variable`, `validate_variable_array` and
+`validate_population`, and its env vars are named after the prefix, such as SPHERE_OPTIMA.
+"""
+
+import json
+import logging
+import sys
+from collections.abc import Callable
+from traceback import format_exc
+from types import ModuleType
+from typing import Any, TypeVar
+
+import click
+import numpy as np
+import numpy.typing as npt
+
+from opthub_problems.utils.backend import BACKEND_ENVVAR, backend_names
+from opthub_problems.utils.batch import evaluate_npy, parse_size
+from opthub_problems.utils.binary import DATA_FORMATS
+from opthub_problems.utils.chunked import CHUNK_FORMATS, ChunkedEvaluator, evaluate_path
+from opthub_problems.utils.problem import PRECISIONS, REDUCTIONS, Problem, to_evaluation
+from opthub_problems.utils.server import DEFAULT_MAX_BATCH, DEFAULT_WINDOW, EvaluationServer
+
+LOGGER = logging.getLogger(__name__)
+
+# Log levels of the commands
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def optima_options(name: str, envvar_prefix: str) -> Callable[[F], F]:
+    """Add the options of the optima of a problem to a command.
+
+    Args:
+        name (str): name of the problem
+        envvar_prefix (str): prefix of the env vars of the problem
+
+    Returns:
+        Callable[[F], F]: decorator adding the --optima and --optima-file options
+    """
+
+    def decorator(function: F) -> F:
+        function = click.option(
+            "--optima-file",
+            type=click.Path(exists=True, dir_okay=False),
+            envvar=f"{envvar_prefix}_OPTIMA_FILE",
+            default=None,
+            help=f"Optima of the {name} function stored in a .npy file of shape (m, d). Overrides --optima.",
+        )(function)
+        return click.option(
+            "-o",
+            "--optima",
+            type=str,
+            envvar=f"{envvar_prefix}_OPTIMA",
+            help=f"Optima of the {name} function.",
+        )(function)
+
+    return decorator
+
+
+def evaluation_options(name: str, envvar_prefix: str) -> Callable[[F], F]:
+    """Add the options of the evaluation of a problem to a command.
+
+    Args:
+        name (str): name of the problem
+        envvar_prefix (str): prefix of the env vars of the problem
+
+    Returns:
+        Callable[[F], F]: decorator adding the --precision, --rotation-seed and --backend options
+    """
+
+    def decorator(function: F) -> F:
+        function = click.option(
+            "--backend",
+            type=click.Choice(backend_names()),
+            envvar=BACKEND_ENVVAR,
+            default=None,
+            help="Compute backend of the evaluation. An unavailable backend falls back to numpy.",
+        )(function)
+        function = click.option(
+            "--rotation-seed",
+            type=int,
+            envvar=f"{envvar_prefix}_ROTATION_SEED",
+            default=None,
+            help=f"Seed of the rotation matrix of the rotated variant of the {name} function.",
+        )(function)
+        return click.option(
+            "--precision",
+            type=click.Choice(PRECISIONS),
+            default="float64",
+            help="Floating-point precision of the evaluation. float32 is faster but less accurate.",
+        )(function)
+
+    return decorator
+
+
+def load_optima(
+    validator: ModuleType,
+    optima: str | None,
+    optima_file: str | None,
+) -> npt.NDArray[np.float64]:
+    """Validate the optima given by the options of a command.
+
+    Args:
+        validator (ModuleType): validator module of the problem
+        optima (str | None): JSON optima
+        optima_file (str | None): .npy file of the optima, which overrides the JSON optima
+
+    Raises:
+        click.UsageError: if neither is given
+
+    Returns:
+        npt.NDArray[np.float64]: validated optima of shape (m, d)
+    """
+    LOGGER.info("Validating the optima...")
+    validated_optima: npt.NDArray[np.float64]
+    if optima_file is not None:
+        validated_optima = validator.validate_optima_file(optima_file)
+    elif optima is not None:
+        validated_optima = np.asarray(validator.parse_optima(optima), dtype=np.float64)
+    else:
+        msg = "Either --optima or --optima-file is required."
+        raise click.UsageError(msg)
+    LOGGER.info("Validated.")
+    return validated_optima
+
+
+def batch_command(problem_class: type[Problem], validator: ModuleType, envvar_prefix: str) -> click.Command:
+    """Build the command evaluating a population stored in a .npy file out of core.
+
+    Args:
+        problem_class (type[Problem]): class of the problem
+        validator (ModuleType): validator module of the problem
+        envvar_prefix (str): prefix of the env vars of the problem
+
+    Returns:
+        click.Command: batch command of the problem
+    """
+    name = problem_class.name
+
+    @click.command(help=f"Evaluate a population stored in a .npy file on the {name} function.")
+    @click.argument("input_path", type=click.Path(exists=True, dir_okay=False))
+    @click.argument("output_path", type=click.Path(dir_okay=False))
+    @optima_options(name, envvar_prefix)
+    @click.option(
+        "--errors-path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Write the int8 error code of each row to this .npy file. The invalid rows get NaN objectives.",
+    )
+    @click.option(
+        "--chunk-rows",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of rows to evaluate at once. Overrides --max-memory.",
+    )
+    @click.option(
+        "--max-memory",
+        type=str,
+        default="256M",
+        help="Memory budget of a chunk such as 512M or 2G.",
+    )
+    @click.option(
+        "--workers",
+        type=click.IntRange(min=1),
+        default=1,
+        help="Number of worker processes.",
+    )
+    @evaluation_options(name, envvar_prefix)
+    @click.option("--log-level", type=click.Choice(LOG_LEVELS), default="INFO", help="Log level.")
+    def main(  # noqa: PLR0913, PLR0917
+        input_path: str,
+        output_path: str,
+        optima: str | None,
+        optima_file: str | None,
+        errors_path: str | None,
+        chunk_rows: int | None,
+        max_memory: str,
+        workers: int,
+        precision: str,
+        rotation_seed: int | None,
+        backend: str | None,
+        log_level: str,
+    ) -> None:
+        """Evaluate the population in INPUT_PATH and write the objectives to OUTPUT_PATH."""
+        logging.basicConfig(level=log_level)
+
+        validated_optima = load_optima(validator, optima, optima_file)
+        evaluate_npy(
+            problem_class(validated_optima, precision=precision, rotation_seed=rotation_seed, backend=backend),
+            input_path,
+            output_path,
+            chunk_rows=chunk_rows,
+            max_memory=parse_size(max_memory),
+            workers=workers,
+            validate_population=validator.validate_population,
+            errors_path=errors_path,
+        )
+
+    return main
+
+
+def server_command(problem_class: type[Problem], validator: ModuleType, envvar_prefix: str) -> click.Command:
+    """Build the command serving the evaluations to concurrent clients in micro-batches.
+
+    Args:
+        problem_class (type[Problem]): class of the problem
+        validator (ModuleType): validator module of the problem
+        envvar_prefix (str): prefix of the env vars of the problem
+
+    Returns:
+        click.Command: server command of the problem
+    """
+    name = problem_class.name
+
+    @click.command(help=f"Serve the evaluations of the {name} function to concurrent clients, batching them.")
+    @optima_options(name, envvar_prefix)
+    @click.option(
+        "--socket",
+        "socket_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Unix socket to listen on. Overrides --port.",
+    )
+    @click.option(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Host to listen on with TCP.",
+    )
+    @click.option(
+        "--port",
+        type=click.IntRange(min=0, max=65535),
+        default=None,
+        help="TCP port to listen on.",
+    )
+    @click.option(
+        "--format",
+        "data_format",
+        type=click.Choice(DATA_FORMATS),
+        default="json",
+        help="Format of the solution variables and the results.",
+    )
+    @click.option(
+        "--window",
+        type=click.FloatRange(min=0),
+        default=DEFAULT_WINDOW * 1e3,
+        help="Milliseconds a solution variable waits for others to be evaluated with it.",
+    )
+    @click.option(
+        "--max-batch",
+        type=click.IntRange(min=1),
+        default=DEFAULT_MAX_BATCH,
+        help="Number of solution variables evaluated at once without waiting for the window.",
+    )
+    @click.option(
+        "--reduce",
+        type=click.Choice(REDUCTIONS),
+        default="none",
+        help="Output the objective values of all the optima, or the best one and the index of its optimum.",
+    )
+    @evaluation_options(name, envvar_prefix)
+    @click.option("--log-level", type=click.Choice(LOG_LEVELS), default="INFO", help="Log level.")
+    def main(  # noqa: PLR0913, PLR0917
+        optima: str | None,
+        optima_file: str | None,
+        socket_path: str | None,
+        host: str,
+        port: int | None,
+        data_format: str,
+        window: float,
+        max_batch: int,
+        reduce: str,
+        precision: str,
+        rotation_seed: int | None,
+        backend: str | None,
+        log_level: str,
+    ) -> None:
+        """Serve the evaluations until SIGTERM or SIGINT."""
+        logging.basicConfig(level=log_level)
+
+        if socket_path is None and port is None:
+            msg = "Either --socket or --port is required."
+            raise click.UsageError(msg)
+        validated_optima = load_optima(validator, optima, optima_file)
+        problem = problem_class(validated_optima, precision=precision, rotation_seed=rotation_seed, backend=backend)
+        server = EvaluationServer(
+            problem,
+            validator.parse_variable,
+            validator.validate_variable_array,
+            data_format=data_format,
+            reduce=reduce,
+            window=window / 1e3,
+            max_batch=max_batch,
+        )
+        server.serve(socket_path, host, port)
+
+    return main
+
+
+def chunked_command(problem_class: type[Problem], validator: ModuleType, envvar_prefix: str) -> click.Command:
+    """Build the command evaluating a single decision variable too large for the memory chunk by chunk.
+
+    Args:
+        problem_class (type[Problem]): class of the problem
+        validator (ModuleType): validator module of the problem
+        envvar_prefix (str): prefix of the env vars of the problem
+
+    Returns:
+        click.Command: chunked command of the problem
+    """
+    name = problem_class.name
+
+    @click.command(help=f"Evaluate a single decision variable on the {name} function chunk by chunk in bounded memory.")
+    @click.argument("input_path", type=click.Path(allow_dash=True, dir_okay=False), default="-")
+    @optima_options(name, envvar_prefix)
+    @click.option(
+        "--format",
+        "data_format",
+        type=click.Choice(CHUNK_FORMATS),
+        default=None,
+        help="Format of the variable: a .npy file of shape (d,), or raw little-endian float64. "
+        "raw for stdin and npy for a file by default.",
+    )
+    @click.option(
+        "--chunk-size",
+        type=click.IntRange(min=1),
+        default=2**20,
+        help="Number of decision dimensions read at once.",
+    )
+    @click.option("--log-level", type=click.Choice(LOG_LEVELS), default="INFO", help="Log level.")
+    def main(  # noqa: PLR0913, PLR0917
+        input_path: str,
+        optima: str | None,
+        optima_file: str | None,
+        data_format: str | None,
+        chunk_size: int,
+        log_level: str,
+    ) -> None:
+        """Evaluate the decision variable in INPUT_PATH, or stdin if -, and output the result as JSON."""
+        logging.basicConfig(level=log_level)
+
+        try:
+            validated_optima = load_optima(validator, optima, optima_file)
+            LOGGER.info("Evaluating the variable chunk by chunk...")
+            evaluator = ChunkedEvaluator(problem_class, validated_optima)
+            obj_arr = evaluate_path(evaluator, input_path, data_format, chunk_size)
+            LOGGER.info("...Evaluated.")
+            sys.stdout.write(json.dumps(to_evaluation(obj_arr)))
+
+        except click.UsageError:
+            raise
+        except Exception as e:
+            LOGGER.exception(format_exc())
+            sys.stdout.write(json.dumps({"objective": None, "error": str(e)}))
+
+    return main
@@ -0,0 +1,98 @@
+"""Decoding of numeric JSON arrays directly into ndarrays.
+
+The solution variables and the optima are JSON arrays of numbers, which are decoded, validated element by element
+by jsonschema, and copied into an ndarray. For the arrays that are valid anyway, `decode_array` replaces the three
+passes: simdjson copies a flat array of numbers into a buffer without building Python objects, orjson decodes it
+faster than the standard library, and the standard library is used otherwise. Anything else is left to the
+validators, so their error messages are unchanged.
+"""
+
+import importlib.util
+import json
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+LOGGER = logging.getLogger(__name__)
+
+# Literals of JSON values that are not numbers, whose arrays must be rejected by the validators.
+# The booleans would be converted to 0 and 1 by NumPy, and the strings may be parsed as numbers.
+NON_NUMERIC_TOKENS = (b'"', b"{", b"true", b"false", b"null")
+
+
+def _import_loads() -> tuple[str, Callable[[bytes], Any]]:
+    """Import the fastest JSON decoder installed.
+
+    Returns:
+        tuple[str, Callable[[bytes], Any]]: name of the decoder and its function decoding bytes
+    """
+    if importlib.util.find_spec("orjson") is not None:
+        import orjson  # noqa: PLC0415
+
+        return "orjson", orjson.loads
+    return "json", json.loads
+
+
+DECODER, _loads = _import_loads()
+
+# simdjson is only used for the flat arrays it can copy into a buffer
+HAS_SIMDJSON = importlib.util.find_spec("simdjson") is not None
+
+# A simdjson parser reuses its memory for each document, so each thread has its own parser
+_local = threading.local()
+
+
+def _decode_simdjson(data: bytes) -> npt.NDArray[np.float64] | None:
+    """Decode a flat JSON array of numbers with simdjson.
+
+    Args:
+        data (bytes): JSON text
+
+    Returns:
+        npt.NDArray[np.float64] | None: decoded array of shape (n,), or None if the text is not
+            a flat array of numbers
+    """
+    import simdjson  # noqa: PLC0415
+
+    if not hasattr(_local, "parser"):
+        _local.parser = simdjson.Parser()
+    try:
+        document = _local.parser.parse(data)
+        if not isinstance(document, simdjson.Array):
+            return None
+        # The buffer is copied, since the memory of the parser is reused by the next document
+        return np.frombuffer(document.as_buffer(of_type="d"), dtype=np.float64).copy()
+    except (ValueError, TypeError):
+        return None
+
+
+def decode_array(text: str | bytes) -> npt.NDArray[np.float64] | None:
+    """Decode a JSON number or a rectangular JSON array of numbers into an ndarray.
+
+    The caller checks the shape, and validates anything that is not decoded from the JSON text again,
+    so a valid array is decoded at most twice and an invalid one gets the error message of the validator.
+
+    Args:
+        text (str | bytes): JSON text
+
+    Returns:
+        npt.NDArray[np.float64] | None: decoded array, or None if the text is not a number
+            or a rectangular array of numbers
+    """
+    data = text.encode() if isinstance(text, str) else text
+    # simdjson flattens the nested arrays into the buffer, so it only decodes the flat ones
+    if HAS_SIMDJSON and data.count(b"[") == 1:
+        arr = _decode_simdjson(data)
+        if arr is not None:
+            return arr
+    if any(token in data for token in NON_NUMERIC_TOKENS):
+        return None
+    try:
+        return np.array(_loads(data), dtype=np.float64)
+    except (ValueError, TypeError, OverflowError):
+        # Malformed JSON, ragged arrays and integers out of the range of float64
+        return None
@@ -0,0 +1,98 @@
+"""Search of the best optimum with a spatial index over the optima."""
+
+import logging
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from scipy.spatial import cKDTree  # type: ignore[import-untyped]
+
+from opthub_problems.utils.problem import MinEvaluation, Problem
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of nearest optima whose best objective value bounds the search
+NEAREST_OPTIMA = 8
+
+# Relative margin of the search radius covering the rounding errors of the objective values
+RADIUS_MARGIN = 2**10
+
+
+class MinimumSearch:
+    """Exact search of the optimum achieving the best objective value, pruned by a KD-tree over the optima.
+
+    The optima are embedded by `Problem.embed`, where the squared distance from a decision variable
+    is a lower bound of its objective value. The objective value f of a near optimum bounds the search
+    to the optima within the distance sqrt(f), which are the only ones evaluated.
+    The best of a few nearest optima is taken for f, since the nearest one alone may bound the search poorly.
+    For the sphere and elliptic functions, the bound is tight and only the nearest optima are evaluated.
+    """
+
+    def __init__(self, problem: Problem) -> None:
+        """Build the KD-tree over the optima.
+
+        Args:
+            problem (Problem): problem to evaluate
+        """
+        self.problem = problem
+        self.tree = cKDTree(problem.embed(problem.opt.astype(np.float64)))
+        self.margin = 1 + RADIUS_MARGIN * float(np.finfo(problem.dtype).eps)
+
+    def evaluate_batch(
+        self,
+        var_batch: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+        """Calculate the best objective values of a batch of decision variables and their optima.
+
+        The results are the minimum and the first index of the minimum of the objective values of `evaluate_batch`,
+        since the problem restricted to the candidate optima splits the decision dimensions into the same column blocks.
+
+        Args:
+            var_batch (npt.ArrayLike): decision variables of shape (n, d)
+
+        Returns:
+            tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]: objective values and indices of the optima
+                of shape (n,)
+        """
+        var_arr = np.asarray(var_batch, dtype=self.problem.dtype)
+        if var_arr.ndim != 2 or var_arr.shape[1] != self.problem.dim:  # noqa: PLR2004
+            msg = f"Expected decision variables of shape (n, {self.problem.dim}), but got {var_arr.shape}."
+            raise ValueError(msg)
+        points = self.problem.embed(self.problem.rotate(var_arr).astype(np.float64))
+        _, nearest = self.tree.query(points, k=min(NEAREST_OPTIMA, self.problem.n_optima))
+        nearest = nearest.reshape(len(var_arr), -1)
+
+        obj_arr = np.empty(len(var_arr), dtype=np.float64)
+        index_arr = np.empty(len(var_arr), dtype=np.int64)
+        for row, (var, point, neighbours) in enumerate(zip(var_arr, points, nearest, strict=True)):
+            # The KD-tree gives the index n_optima for the neighbours at an infinite distance
+            indices = neighbours[neighbours < self.tree.n]
+            bound = np.min(self.problem.subset(indices).evaluate_batch(var[np.newaxis, :])) if len(indices) else np.inf
+            radius = np.sqrt(bound * self.margin)
+            if np.isfinite(radius):
+                # The nearest optimum achieving the bound is in the ball, unless the rounding errors exceed the margin
+                candidates = np.asarray(self.tree.query_ball_point(point, radius, return_sorted=True), dtype=np.int64)
+                candidates = candidates if len(candidates) > 0 else np.sort(indices)
+            else:
+                # Without a finite bound, such as for an overflowing distance, the search is not pruned
+                candidates = np.arange(self.problem.n_optima)
+            problem = self.problem if len(candidates) == self.problem.n_optima else self.problem.subset(candidates)
+            candidate_obj_arr = problem.evaluate_batch(var[np.newaxis, :])[0]
+            best = int(np.argmin(candidate_obj_arr))
+            obj_arr[row] = candidate_obj_arr[best]
+            index_arr[row] = candidates[best]
+            LOGGER.debug("Evaluated %d of %d optima.", len(candidates), self.problem.n_optima)
+        return obj_arr, index_arr
+
+    def evaluate(self, var: Any) -> MinEvaluation:  # noqa: ANN401
+        """Calculate the best objective value of a decision variable and its optimum.
+
+        Args:
+            var (Any): decision variable of shape (d,), or a number if d is 1
+
+        Returns:
+            MinEvaluation: best objective value and index of its optimum
+        """
+        var_arr = np.asarray(var, dtype=self.problem.dtype).reshape(1, self.problem.dim)
+        obj_arr, index_arr = self.evaluate_batch(var_arr)
+        return {"objective": float(obj_arr[0]), "optimum": int(index_arr[0])}
@@ -0,0 +1,178 @@
+"""Online accumulators of statistics over streams of chunks.
+
+Each accumulator keeps a fixed amount of state whatever the length of the stream, and gives the same result
+as the statistic over the whole stream at once up to rounding. The chunks are merged by the pairwise formulas
+of Chan et al. rather than by sums of powers, which lose precision over long streams.
+"""
+
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+# Symbols of the slopes between consecutive values of a walk: down, flat and up
+N_SLOPES = 3
+
+
+class OnlineCorrelation:
+    """Means, variances and correlation of two paired streams of values."""
+
+    def __init__(self) -> None:
+        """Start with empty streams."""
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+        self.min_x = math.inf
+        self.max_x = -math.inf
+
+    def update(self, x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]) -> None:
+        """Merge a chunk of pairs of values.
+
+        Args:
+            x (npt.NDArray[np.float64]): first values of shape (n,)
+            y (npt.NDArray[np.float64]): second values of shape (n,)
+        """
+        count = len(x)
+        if count == 0:
+            return
+        mean_x, mean_y = float(x.mean()), float(y.mean())
+        dx, dy = x - mean_x, y - mean_y
+        total = self.count + count
+        delta_x, delta_y = mean_x - self.mean_x, mean_y - self.mean_y
+        weight = self.count * count / total
+        self.m2_x += float(dx @ dx) + delta_x * delta_x * weight
+        self.m2_y += float(dy @ dy) + delta_y * delta_y * weight
+        self.c_xy += float(dx @ dy) + delta_x * delta_y * weight
+        self.mean_x += delta_x * count / total
+        self.mean_y += delta_y * count / total
+        self.count = total
+        self.min_x = min(self.min_x, float(x.min()))
+        self.max_x = max(self.max_x, float(x.max()))
+
+    @property
+    def std_x(self) -> float:
+        """Population standard deviation of the first values, NaN if there are none."""
+        return math.sqrt(self.m2_x / self.count) if self.count else math.nan
+
+    @property
+    def correlation(self) -> float:
+        """Pearson correlation coefficient, NaN if either stream is constant."""
+        denominator = math.sqrt(self.m2_x * self.m2_y)
+        return self.c_xy / denominator if denominator > 0 else math.nan
+
+
+class OnlineAutocorrelation:
+    """Autocorrelations of a stream of values at the lags up to a maximum.
+
+    The autocorrelation at lag k is the correlation of the pairs of values k steps apart,
+    so the last k values of each chunk are carried over to pair them with the next chunk.
+    """
+
+    def __init__(self, max_lag: int) -> None:
+        """Start with an empty stream.
+
+        Args:
+            max_lag (int): highest lag
+        """
+        self.max_lag = max_lag
+        self.lags = [OnlineCorrelation() for _ in range(max_lag)]
+        self._tail = np.empty(0, dtype=np.float64)
+
+    def update(self, values: npt.NDArray[np.float64]) -> None:
+        """Merge a chunk of the stream.
+
+        Args:
+            values (npt.NDArray[np.float64]): next values of shape (n,)
+        """
+        stream = np.concatenate([self._tail, values])
+        carried = len(self._tail)
+        for lag, correlation in enumerate(self.lags, start=1):
+            start = max(carried, lag)
+            if start < len(stream):
+                correlation.update(stream[start - lag : len(stream) - lag], stream[start:])
+        self._tail = stream[-self.max_lag :] if self.max_lag else stream[:0]
+
+    @property
+    def autocorrelations(self) -> list[float]:
+        """Autocorrelations at the lags from 1 to the highest one."""
+        return [correlation.correlation for correlation in self.lags]
+
+    @property
+    def correlation_length(self) -> float:
+        """Correlation length -1 / ln|r(1)| of Weinberger, NaN without lags or with an uncorrelated stream."""
+        if not self.lags:
+            return math.nan
+        r = abs(self.lags[0].correlation)
+        if math.isnan(r) or r == 0:
+            return math.nan
+        return math.inf if r >= 1 else -1 / math.log(r)
+
+
+class OnlineInformationContent:
+    """Information content and partial information content of a walk of Vassilev et al.
+
+    The differences of consecutive values are turned into slopes, down, flat or up with a tolerance epsilon.
+    The information content is the entropy, with logarithms of base 6, of the pairs of different consecutive
+    slopes, and the partial information content is the fraction of slopes left once the flat ones and the
+    repeated ones are removed. Only the last value and slopes are carried over between chunks.
+    """
+
+    def __init__(self, epsilon: float = 0.0) -> None:
+        """Start with an empty walk.
+
+        Args:
+            epsilon (float): highest absolute difference of a flat slope
+        """
+        self.epsilon = epsilon
+        self.pair_counts = np.zeros((N_SLOPES, N_SLOPES), dtype=np.int64)
+        self.n_slopes = 0
+        self.n_changes = 0
+        self._last_value: float | None = None
+        self._last_slope: int | None = None
+        self._last_change = 1
+
+    def update(self, values: npt.NDArray[np.float64]) -> None:
+        """Merge a chunk of the walk.
+
+        Args:
+            values (npt.NDArray[np.float64]): next values of shape (n,)
+        """
+        if len(values) == 0:
+            return
+        previous = values[:-1] if self._last_value is None else np.concatenate([[self._last_value], values[:-1]])
+        self._last_value = float(values[-1])
+        diff = values[len(values) - len(previous) :] - previous
+        # 0 for down, 1 for flat and 2 for up
+        slopes = np.where(diff < -self.epsilon, 0, np.where(diff > self.epsilon, 2, 1))
+        if len(slopes) == 0:
+            return
+        chained = slopes if self._last_slope is None else np.concatenate([[self._last_slope], slopes])
+        pairs = chained[:-1] * N_SLOPES + chained[1:]
+        self.pair_counts += np.bincount(pairs, minlength=N_SLOPES * N_SLOPES).reshape(N_SLOPES, N_SLOPES)
+        self._last_slope = int(slopes[-1])
+        self.n_slopes += len(slopes)
+
+        # The partial information content counts the changes of direction between the slopes that are not flat
+        directed = slopes[slopes != 1]
+        if len(directed):
+            chained = np.concatenate([[self._last_change], directed])
+            self.n_changes += int(np.count_nonzero(chained[1:] != chained[:-1]))
+            self._last_change = int(directed[-1])
+
+    @property
+    def information_content(self) -> float:
+        """Entropy of the pairs of different consecutive slopes, NaN with less than 2 slopes."""
+        n_pairs = int(self.pair_counts.sum())
+        if n_pairs == 0:
+            return math.nan
+        probabilities = self.pair_counts[~np.eye(N_SLOPES, dtype=bool)] / n_pairs
+        probabilities = probabilities[probabilities > 0]
+        return float(-(probabilities * np.log(probabilities)).sum() / math.log(6))
+
+    @property
+    def partial_information_content(self) -> float:
+        """Fraction of the changes of direction among the slopes, NaN without slopes."""
+        return self.n_changes / self.n_slopes if self.n_slopes else math.nan
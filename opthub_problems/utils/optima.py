@@ -0,0 +1,116 @@
+"""Optima stored in memory-mapped .npy files."""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from jsonschema import ValidationError
+
+LOGGER = logging.getLogger(__name__)
+
+# Suffix of the sidecar file recording that an optima file was validated
+DIGEST_SUFFIX = ".digest"
+
+# Number of bytes of the optima validated and hashed at once
+CHUNK_BYTES = 64 * 1024**2
+
+
+def digest_path(path: str | Path) -> Path:
+    """Get the path of the sidecar digest of an optima file.
+
+    Args:
+        path (str | Path): .npy file of the optima
+
+    Returns:
+        Path: sidecar digest next to the optima file
+    """
+    return Path(f"{path}{DIGEST_SUFFIX}")
+
+
+def validate_optima_array(optima: npt.NDArray[Any], min_dim: int = 1) -> str:
+    """Validate the shape and the values of the optima, and hash them.
+
+    Args:
+        optima (npt.NDArray[Any]): optima of shape (m, d)
+        min_dim (int): minimum number of decision dimensions
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the optima is invalid
+
+    Returns:
+        str: BLAKE2b digest of the optima
+    """
+    if optima.ndim != 2 or optima.shape[0] < 1 or optima.shape[1] < min_dim:  # noqa: PLR2004
+        msg = f"The optima must be of shape (m, d) with m >= 1 and d >= {min_dim}, but got {optima.shape}."
+        raise ValidationError(msg)
+    if optima.dtype != np.dtype("<f8") or not optima.flags.c_contiguous:
+        msg = f"The optima must be little-endian float64 in C order, but got {optima.dtype.str}."
+        raise ValidationError(msg)
+
+    digest = hashlib.blake2b(digest_size=32)
+    # Chunked over the flat elements, so a single row of many decision dimensions is not read at once
+    flat = optima.reshape(-1)
+    chunk_size = CHUNK_BYTES // optima.itemsize
+    for start in range(0, flat.size, chunk_size):
+        chunk = flat[start : start + chunk_size]
+        if not np.all(np.isfinite(chunk)):
+            first, last = start // optima.shape[1], (start + len(chunk) - 1) // optima.shape[1]
+            msg = f"The optima must be finite, but got a non-finite value in rows {first} to {last + 1}."
+            raise ValidationError(msg)
+        digest.update(chunk.tobytes())
+    return digest.hexdigest()
+
+
+def load_optima_file(path: str | Path, min_dim: int = 1) -> npt.NDArray[np.float64]:
+    """Open the optima stored in a .npy file as a read-only memory map.
+
+    The forked processes share the pages of the file instead of copying the optima.
+    The optima are validated once and the result is recorded in a sidecar digest with the size
+    and the modification time of the file. The validation is skipped while they match the file.
+
+    Args:
+        path (str | Path): .npy file of the optima of shape (m, d)
+        min_dim (int): minimum number of decision dimensions
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the optima is invalid
+
+    Returns:
+        npt.NDArray[np.float64]: memory-mapped optima
+    """
+    try:
+        optima: npt.NDArray[np.float64] = np.load(path, mmap_mode="r")
+    except ValueError as e:
+        msg = f"The optima file {path} is not a .npy file of numbers: {e}"
+        raise ValidationError(msg) from e
+    stat = Path(path).stat()
+    record: dict[str, Any] = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "shape": list(optima.shape),
+        "dtype": optima.dtype.str,
+        "min_dim": min_dim,
+    }
+    sidecar = digest_path(path)
+    try:
+        recorded = json.loads(sidecar.read_text())
+    except (OSError, ValueError):
+        recorded = None
+    if isinstance(recorded, dict) and {key: recorded.get(key) for key in record} == record:
+        LOGGER.debug("Skipped the validation of %s recorded in %s.", path, sidecar)
+        return optima
+
+    record["blake2b"] = validate_optima_array(optima, min_dim)
+    temporary = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        temporary.write_text(json.dumps(record))
+        temporary.replace(sidecar)
+    except OSError:
+        LOGGER.warning("Could not record the validation of %s in %s.", path, sidecar, exc_info=True)
+        temporary.unlink(missing_ok=True)
+    return optima
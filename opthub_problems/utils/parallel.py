@@ -0,0 +1,201 @@
+"""Process-parallel batch evaluation through shared memory."""
+
+import logging
+import math
+import multiprocessing as mp
+import os
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from opthub_problems.utils.problem import Problem, use_single_thread
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of tasks given to each worker per batch to balance the load
+TASKS_PER_WORKER = 4
+
+# Problem and attached shared memory blocks of a worker process
+_worker_problem: Problem | None = None
+_worker_segments: dict[str, SharedMemory] = {}
+
+
+def default_context() -> BaseContext:
+    """Get the multiprocessing context starting the worker processes.
+
+    The workers are started by a fork server, or spawned where there is none, since forking a parent
+    whose thread pool is running may leave the locks of the threads held in the children.
+
+    Returns:
+        BaseContext: forkserver context, or spawn context
+    """
+    return mp.get_context("forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn")
+
+
+def _init_worker(problem: Problem) -> None:
+    """Keep the problem in the worker process, evaluating it in a single thread as the workers run in parallel.
+
+    Args:
+        problem (Problem): problem to evaluate
+    """
+    global _worker_problem  # noqa: PLW0603
+    _worker_problem = problem
+    use_single_thread()
+
+
+def _attach(names: tuple[str, str]) -> tuple[SharedMemory, SharedMemory]:
+    """Attach the shared memory blocks of a batch, detaching the ones of the previous batches.
+
+    Args:
+        names (tuple[str, str]): names of the input and output blocks
+
+    Returns:
+        tuple[SharedMemory, SharedMemory]: input and output blocks
+    """
+    for name in list(_worker_segments):
+        if name not in names:
+            _worker_segments.pop(name).close()
+    for name in names:
+        if name not in _worker_segments:
+            _worker_segments[name] = SharedMemory(name=name)
+    return _worker_segments[names[0]], _worker_segments[names[1]]
+
+
+def _evaluate_rows(task: tuple[str, str, int, int, int, int, int]) -> None:
+    """Evaluate a range of rows in the shared input and write them to the shared output.
+
+    Args:
+        task (tuple[str, str, int, int, int, int, int]): input and output block names,
+            number of rows, dimensions and optima, and the range of rows to evaluate
+    """
+    input_name, output_name, n_rows, dim, n_optima, start, stop = task
+    if _worker_problem is None:
+        msg = "The worker is not initialized."
+        raise RuntimeError(msg)
+    input_segment, output_segment = _attach((input_name, output_name))
+    var_arr = np.ndarray((n_rows, dim), dtype=np.float64, buffer=input_segment.buf)
+    obj_arr = np.ndarray((n_rows, n_optima), dtype=np.float64, buffer=output_segment.buf)
+    obj_arr[start:stop] = _worker_problem.evaluate_batch(var_arr[start:stop])
+
+
+class ParallelEvaluator:
+    """Evaluator sharding populations across a pool of worker processes.
+
+    The problem is sent once to each worker, and the rows are exchanged through shared memory
+    so they are never pickled. The output rows are in the same order as the input rows.
+    """
+
+    def __init__(self, problem: Problem, workers: int | None = None, context: BaseContext | None = None) -> None:
+        """Start the worker processes.
+
+        Args:
+            problem (Problem): problem to evaluate
+            workers (int | None): number of worker processes, defaults to the number of CPUs
+            context (BaseContext | None): multiprocessing context, defaults to `default_context`
+        """
+        self.problem = problem
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        context = context if context is not None else default_context()
+        self._pool: Pool | None = context.Pool(self.workers, initializer=_init_worker, initargs=(problem,))
+
+    def __enter__(self) -> "ParallelEvaluator":  # noqa: PYI034
+        """Enter the context.
+
+        Returns:
+            ParallelEvaluator: this evaluator
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the worker processes on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def evaluate_batch(self, var_batch: npt.ArrayLike, chunk_rows: int | None = None) -> npt.NDArray[np.float64]:
+        """Calculate the objective values of a batch of decision variables in parallel.
+
+        Args:
+            var_batch (npt.ArrayLike): decision variables of shape (n, d)
+            chunk_rows (int | None): number of rows of a task, derived from the number of workers if None
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (n, m)
+        """
+        if self._pool is None:
+            msg = "The evaluator is closed."
+            raise RuntimeError(msg)
+        # Converted to float64 by the copy to the shared memory, so an array is not copied twice
+        var_arr = np.asarray(var_batch)
+        if var_arr.ndim != 2 or var_arr.shape[1] != self.problem.dim:  # noqa: PLR2004
+            msg = f"Expected decision variables of shape (n, {self.problem.dim}), but got {var_arr.shape}."
+            raise ValueError(msg)
+        n_rows, n_optima = var_arr.shape[0], self.problem.n_optima
+        if n_rows == 0:
+            return np.empty((0, n_optima), dtype=np.float64)
+        if chunk_rows is None:
+            chunk_rows = math.ceil(n_rows / (self.workers * TASKS_PER_WORKER))
+
+        input_segment = SharedMemory(create=True, size=var_arr.size * np.dtype(np.float64).itemsize)
+        output_segment = SharedMemory(create=True, size=n_rows * n_optima * np.dtype(np.float64).itemsize)
+        try:
+            shared_var_arr = np.ndarray(var_arr.shape, dtype=np.float64, buffer=input_segment.buf)
+            shared_var_arr[:] = var_arr
+            del shared_var_arr
+
+            tasks = [
+                (input_segment.name, output_segment.name, n_rows, self.problem.dim, n_optima, start, start + chunk_rows)
+                for start in range(0, n_rows, chunk_rows)
+            ]
+            LOGGER.debug("Evaluating %d rows in %d tasks on %d workers...", n_rows, len(tasks), self.workers)
+            for _ in self._pool.imap_unordered(_evaluate_rows, tasks):
+                pass
+
+            shared_obj_arr = np.ndarray((n_rows, n_optima), dtype=np.float64, buffer=output_segment.buf)
+            obj_arr = shared_obj_arr.copy()
+            del shared_obj_arr
+        finally:
+            for segment in (input_segment, output_segment):
+                segment.close()
+                segment.unlink()
+        return obj_arr
+
+
+def evaluate_parallel(
+    problem: Problem,
+    var_batch: npt.ArrayLike,
+    workers: int | None = None,
+    chunk_rows: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Calculate the objective values of a batch of decision variables on a temporary pool of workers.
+
+    Args:
+        problem (Problem): problem to evaluate
+        var_batch (npt.ArrayLike): decision variables of shape (n, d)
+        workers (int | None): number of worker processes, defaults to the number of CPUs
+        chunk_rows (int | None): number of rows of a task, derived from the number of workers if None
+
+    Returns:
+        npt.NDArray[np.float64]: objective values of shape (n, m)
+    """
+    if workers == 1:
+        return problem.evaluate_batch(var_batch)
+    with ParallelEvaluator(problem, workers) as evaluator:
+        return evaluator.evaluate_batch(var_batch, chunk_rows)
@@ -0,0 +1,138 @@
+"""Vectorized validation of populations with an error code per row."""
+
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from jsonschema import ValidationError
+
+# Error codes of the rows of a population
+ROW_VALID = 0
+ROW_WRONG_LENGTH = 1
+ROW_NOT_NUMERIC = 2
+ROW_NAN = 3
+ROW_INFINITE = 4
+
+# Error messages of the rows of a population by error code
+ROW_ERROR_MESSAGES = {
+    ROW_WRONG_LENGTH: "The variable must have {dim} elements.",
+    ROW_NOT_NUMERIC: "The variable must only contain numbers.",
+    ROW_NAN: "The variable must not contain NaN.",
+    ROW_INFINITE: "The variable must not contain infinities.",
+}
+
+
+def row_error_message(code: int, dim: int) -> str:
+    """Get the error message of a row of a population.
+
+    Args:
+        code (int): error code of the row, other than ROW_VALID
+        dim (int): number of decision dimensions
+
+    Returns:
+        str: error message
+    """
+    return ROW_ERROR_MESSAGES[code].format(dim=dim)
+
+
+def _finite_codes(population: npt.NDArray[Any]) -> npt.NDArray[np.int8]:
+    """Find the rows of a numeric population with NaN or infinite values.
+
+    Args:
+        population (npt.NDArray[Any]): numeric population of shape (n, d)
+
+    Returns:
+        npt.NDArray[np.int8]: error codes of shape (n,)
+    """
+    codes = np.zeros(len(population), dtype=np.int8)
+    if population.dtype.kind != "f":
+        return codes
+    codes[np.isinf(population).any(axis=1)] = ROW_INFINITE
+    codes[np.isnan(population).any(axis=1)] = ROW_NAN
+    return codes
+
+
+def _array_codes(population: npt.NDArray[Any], dim: int) -> npt.NDArray[np.int8]:
+    """Find the error codes of the rows of a population given as an array.
+
+    Args:
+        population (npt.NDArray[Any]): population of shape (n, d)
+        dim (int): number of decision dimensions
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the population is not of shape (n, d)
+
+    Returns:
+        npt.NDArray[np.int8]: error codes of shape (n,)
+    """
+    if population.ndim != 2:  # noqa: PLR2004
+        msg = f"The population must have shape (n, {dim}), but got {population.shape}."
+        raise ValidationError(msg)
+    if population.shape[1] != dim:
+        return np.full(len(population), ROW_WRONG_LENGTH, dtype=np.int8)
+    if population.dtype.kind not in "iuf":
+        return np.full(len(population), ROW_NOT_NUMERIC, dtype=np.int8)
+    return _finite_codes(population)
+
+
+def _list_codes(population: list[Any], dim: int) -> npt.NDArray[np.int8]:
+    """Find the error codes of the rows of a population given as decoded JSON solution variables.
+
+    Args:
+        population (list[Any]): decoded JSON solution variables, numbers if d is 1
+        dim (int): number of decision dimensions
+
+    Returns:
+        npt.NDArray[np.int8]: error codes of shape (n,)
+    """
+    codes = np.zeros(len(population), dtype=np.int8)
+    numeric_rows = []
+    numeric = []
+    for i, row in enumerate(population):
+        values = [row] if dim == 1 and type(row) in {int, float} else row
+        if not isinstance(values, list) or len(values) != dim:
+            codes[i] = ROW_WRONG_LENGTH
+        elif not all(type(value) in {int, float} for value in values):
+            codes[i] = ROW_NOT_NUMERIC
+        else:
+            numeric_rows.append(values)
+            numeric.append(i)
+    if not numeric:
+        return codes
+    try:
+        codes[numeric] = _finite_codes(np.array(numeric_rows, dtype=np.float64).reshape(len(numeric), dim))
+    except OverflowError:
+        # Some integers are out of the range of float64, so the rows are converted one by one
+        for i, values in zip(numeric, numeric_rows, strict=True):
+            try:
+                codes[i] = _finite_codes(np.array([values], dtype=np.float64))[0]
+            except OverflowError:
+                codes[i] = ROW_INFINITE
+    return codes
+
+
+def validate_population_rows(population: Any, dim: int) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.int8]]:  # noqa: ANN401
+    """Validate the rows of a population at once.
+
+    A numeric array of shape (n, d) is checked in a single vectorized pass without visiting each element.
+    A list of decoded JSON solution variables is checked row by row for the length and the types,
+    then the numeric rows are checked for NaN and infinities at once.
+
+    Args:
+        population (Any): array of shape (n, d), or list of decoded JSON solution variables
+        dim (int): number of decision dimensions
+
+    Raises:
+        jsonschema.exceptions.ValidationError: if the population is not made of rows
+
+    Returns:
+        tuple[npt.NDArray[np.bool_], npt.NDArray[np.int8]]: mask of the valid rows and error code of each row
+    """
+    if isinstance(population, np.ndarray) and population.dtype != object:
+        codes = _array_codes(population, dim)
+    elif isinstance(population, list):
+        codes = _list_codes(population, dim)
+    else:
+        msg = f"The population must be an array or a list of solution variables, but got {type(population).__name__}."
+        raise ValidationError(msg)
+    return codes == ROW_VALID, codes
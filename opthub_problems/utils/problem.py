@@ -0,0 +1,631 @@
+"""Base class of the problems."""
+
+import copy
+import hashlib
+import logging
+import mmap
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
+
+import numpy as np
+import numpy.typing as npt
+
+from opthub_problems.utils.backend import get_backend
+from opthub_problems.utils.rotation import rotation_matrix
+
+if TYPE_CHECKING:
+    from opthub_problems.utils.cache import EvaluationCache
+    from opthub_problems.utils.nearest import MinimumSearch
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of (row, optimum, dimension) elements of a block used until the block size is calibrated
+DEFAULT_BLOCK_SIZE = 2**16
+
+# Largest number of terms of a column block. The terms are split at the same points as the pairwise summation
+# of NumPy, which splits the sums of more than 128 terms in halves rounded down to a multiple of `PAIRWISE_UNROLL`
+COLUMN_BLOCK = 2**10
+
+# Multiple the pairwise summation of NumPy rounds its splits down to
+PAIRWISE_UNROLL = 8
+
+# Number of temporaries of the size of a block held at once by the kernels
+BLOCK_TEMPORARIES = 2
+
+# Block sizes tried by the calibration
+BLOCK_SIZE_CANDIDATES = (2**12, 2**14, 2**16, 2**18, 2**20)
+
+# Number of (row, optimum, dimension) elements evaluated to calibrate the block size
+CALIBRATION_SIZE = 2**20
+
+# Floating-point precisions the kernels can run in
+PRECISIONS = ["float64", "float32"]
+
+# Reductions of the objective values over the optima
+REDUCTIONS = ["none", "min"]
+
+# Calibrated block size of each problem class
+_calibrated_block_sizes: dict[str, int] = {}
+
+# Thread pool shared by the problems, created on first use
+_thread_pool: ThreadPoolExecutor | None = None
+
+# Whether the blocks are evaluated in the calling thread instead of the thread pool
+_single_threaded = False
+
+
+def _get_thread_pool() -> ThreadPoolExecutor:
+    """Get the thread pool shared by the problems.
+
+    Returns:
+        ThreadPoolExecutor: thread pool with one thread per CPU
+    """
+    global _thread_pool  # noqa: PLW0603
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(os.cpu_count(), thread_name_prefix="opthub-problems")
+    return _thread_pool
+
+
+def _reset_thread_pool() -> None:
+    """Forget the thread pool in a forked child, whose threads are not inherited."""
+    global _thread_pool  # noqa: PLW0603
+    _thread_pool = None
+
+
+os.register_at_fork(after_in_child=_reset_thread_pool)
+
+
+def use_single_thread() -> None:
+    """Evaluate the blocks in the calling thread, in a worker process already running in parallel with others."""
+    global _single_threaded  # noqa: PLW0603
+    _single_threaded = True
+
+
+class Evaluation(TypedDict):
+    """The type of the solution."""
+
+    objective: list[float] | float
+
+
+class MinEvaluation(TypedDict):
+    """The type of the solution reduced to its best optimum."""
+
+    objective: float
+    optimum: int
+
+
+def readonly(array: npt.ArrayLike, dtype: npt.DTypeLike = np.float64) -> npt.NDArray[Any]:
+    """Make a contiguous read-only copy of an array.
+
+    Read-only memory maps of the same data type are not copied, so the processes share their pages.
+
+    Args:
+        array (npt.ArrayLike): array to copy
+        dtype (npt.DTypeLike): data type of the copy
+
+    Returns:
+        npt.NDArray[Any]: contiguous read-only array
+    """
+    if (
+        isinstance(array, np.memmap)
+        and array.mode == "r"
+        and array.dtype == np.dtype(dtype)
+        and array.flags.c_contiguous
+    ):
+        return array
+    copied = np.array(array, dtype=dtype, order="C")
+    copied.flags.writeable = False
+    return copied
+
+
+def to_evaluation(obj_arr: npt.NDArray[np.float64]) -> Evaluation:
+    """Convert the objective values of a decision variable to its evaluation.
+
+    Args:
+        obj_arr (npt.NDArray[np.float64]): objective values of shape (m,)
+
+    Returns:
+        Evaluation: objective value, a list if there are several optima
+    """
+    objective: list[float] = obj_arr.tolist()
+    return {"objective": objective[0] if len(objective) == 1 else objective}
+
+
+class Problem(ABC):
+    """Problem built once from its validated optima.
+
+    The constants that only depend on the optima and the number of decision dimensions
+    are computed in the constructor and shared by all the evaluations.
+
+    The decision variables are evaluated in blocks of about `block_size` (row, optimum, dimension) elements
+    on a thread pool, so the temporaries stay in the cache and their size does not depend on the input.
+    The terms are split into column blocks of at most `COLUMN_BLOCK` at the split points of the pairwise
+    summation of NumPy, and their sums are added in the same order, so the objective values are identical to
+    a single `np.sum` over all the terms. Only the rows are split by the block size, so the objective values
+    depend neither on the block size nor on the number of optima.
+    The block size is calibrated once per problem class unless it is given.
+
+    With the float32 precision, the decision variables, the cached constants and the whole kernel are in single
+    precision, and only the objective values are returned as float64. With the unit roundoff u = 2**-24,
+    z = x - o and kappa = max_i (|x_i| + |o_i|) / |z_i| measuring the cancellation near the optimum,
+    the relative error against float64 is bounded as follows:
+
+    - sphere: (2 kappa + log2(d) + 3) u
+    - elliptic: (2 kappa + log2(d) + 4) u
+    - rastrigin: (2 kappa + log2(d) + 3) u + 4 pi max_i |z_i| u relative to sum_i (z_i**2 + 10 |cos(2 pi z_i)| + 10)
+    - rosenbrock: (4 kappa + log2(d) + 5) u relative to sum_i (100 (y_i**2 + |y_i+1|)**2 + (|y_i| + 1)**2)
+
+    The last two bounds are relative to the sums of the absolute values of the terms because the objective
+    itself vanishes at the optima. Away from the optima (kappa up to 10), for |z_i| up to 10 and d up to 10**6,
+    all of them are below 1e-5, which is enough to pre-screen large batches.
+
+    With a rotation seed, the problem is rotated around each optimum o as in the CEC benchmarks: the kernels
+    see R (x - o) instead of x - o, with an orthogonal matrix R generated from the seed. Since R (x - o) = R x - R o,
+    the rotated optima R o are kept in `opt` and a batch is rotated with a single matrix product.
+
+    The objective values are computed by a backend of `opthub_problems.utils.backend`, which runs the NumPy kernel
+    `_partial` by default, or the plain loop kernel `loop_kernel` compiled by Numba.
+    """
+
+    name: ClassVar[str]
+
+    # Attributes with one row per optimum, restricted by `subset`
+    optimum_constants: ClassVar[tuple[str, ...]] = ("opt",)
+
+    # Loop kernel computing the same partial objective values as `_partial` into an output array,
+    # called as loop_kernel(var_arr, start, stop, obj_arr, *constants) with the attributes in `kernel_constants`
+    loop_kernel: ClassVar[Callable[..., None]]
+
+    # Number of the next decision dimensions a term of `chunk_partial` reads besides its own,
+    # which are carried over from one chunk to the next
+    chunk_overlap: ClassVar[int] = 0
+    kernel_constants: ClassVar[tuple[str, ...]] = ("opt",)
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        opt: npt.ArrayLike,
+        block_size: int | None = None,
+        precision: str = "float64",
+        cache: "EvaluationCache | None" = None,
+        rotation_seed: int | None = None,
+        backend: str | None = None,
+    ) -> None:
+        """Initialize the problem.
+
+        Args:
+            opt (npt.ArrayLike): validated optima of shape (m, d)
+            block_size (int | None): number of elements of a block, calibrated on first use if None
+            precision (str): float64, or float32 to run the kernel in single precision
+            cache (EvaluationCache | None): cache of the evaluations of single decision variables
+            rotation_seed (int | None): seed of the rotation matrix, or None not to rotate the problem
+            backend (str | None): name of the compute backend, or None for $OPTHUB_BACKEND or numpy
+        """
+        if precision not in PRECISIONS:
+            msg = f"The precision must be one of {PRECISIONS}, but got {precision}."
+            raise ValueError(msg)
+        self.dtype = np.dtype(precision)
+        self.opt = readonly(opt, self.dtype)
+        if self.opt.ndim != 2:  # noqa: PLR2004
+            msg = f"Expected optima of shape (m, d), but got {self.opt.shape}."
+            raise ValueError(msg)
+        self.n_optima, self.dim = self.opt.shape
+        self.rotation_seed = rotation_seed
+        self.rotation: npt.NDArray[Any] | None = None
+        if rotation_seed is not None:
+            rotation = rotation_matrix(rotation_seed, self.dim)
+            self.opt = readonly(np.asarray(opt, dtype=np.float64) @ rotation.T, self.dtype)
+            self.rotation = readonly(rotation, self.dtype)
+        self.block_size = block_size
+        self.cache = cache
+        # The name is kept instead of the backend, so the problem is pickled without its compiled kernels
+        self.backend = get_backend(backend).name
+        self._precompute()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle memory-mapped optima as their file, so the worker processes map the same pages.
+
+        Returns:
+            dict[str, Any]: attributes of the problem
+        """
+        state = self.__dict__.copy()
+        if isinstance(self.opt, np.memmap) and isinstance(self.opt.base, mmap.mmap):
+            state["opt"] = (self.opt.filename, self.opt.offset)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Unpickle the problem, mapping the file of memory-mapped optima again.
+
+        Args:
+            state (dict[str, Any]): attributes of the problem
+        """
+        if isinstance(state["opt"], tuple):
+            filename, offset = state["opt"]
+            state["opt"] = np.memmap(
+                filename,
+                dtype=state["dtype"],
+                mode="r",
+                offset=offset,
+                shape=(state["n_optima"], state["dim"]),
+            )
+        self.__dict__.update(state)
+
+    def _precompute(self) -> None:  # noqa: B027
+        """Compute the constants that only depend on the optima."""
+
+    @cached_property
+    def digest(self) -> bytes:
+        """Hash of what the objective values depend on besides the decision variables."""
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(f"{self.name}:{self.dtype.str}:{self.opt.shape}:{self.rotation_seed}:{self.backend}:".encode())
+        digest.update(self.opt.tobytes())
+        return digest.digest()
+
+    @cached_property
+    def minimum_search(self) -> "MinimumSearch":
+        """Search of the best optimum, built on first use."""
+        # scipy is only imported by the problems reducing over their optima
+        from opthub_problems.utils.nearest import MinimumSearch  # noqa: PLC0415
+
+        return MinimumSearch(self)
+
+    def embed(self, points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Map points to the space where the squared distance to an optimum is a lower bound of the objective value.
+
+        The identity suits the problems whose objective values are at least the squared distance to the optimum.
+
+        Args:
+            points (npt.NDArray[np.float64]): decision variables or optima of shape (n, d)
+
+        Returns:
+            npt.NDArray[np.float64]: embedded points of shape (n, k)
+        """
+        return points
+
+    def rotate(self, var_arr: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        """Rotate decision variables into the space of the kernels.
+
+        Args:
+            var_arr (npt.NDArray[Any]): decision variables of shape (n, d)
+
+        Returns:
+            npt.NDArray[Any]: rotated decision variables of shape (n, d), the same array if not rotated
+        """
+        if self.rotation is None:
+            return var_arr
+        rotated: npt.NDArray[Any] = var_arr @ self.rotation.T
+        return rotated
+
+    def subset(self, indices: npt.ArrayLike) -> "Problem":
+        """Restrict the problem to some of its optima, sharing the other constants.
+
+        Args:
+            indices (npt.ArrayLike): indices of the optima to keep
+
+        Returns:
+            Problem: problem whose optima are the given ones in the given order
+        """
+        problem = copy.copy(self)
+        problem.__dict__.pop("digest", None)
+        problem.__dict__.pop("minimum_search", None)
+        problem.cache = None
+        for name in self.optimum_constants:
+            constant = getattr(self, name)[indices]
+            constant.flags.writeable = False
+            setattr(problem, name, constant)
+        problem.n_optima = problem.opt.shape[0]
+        return problem
+
+    def evaluate(self, var: Any) -> Evaluation:  # noqa: ANN401
+        """Calculate the objective value of a decision variable.
+
+        Args:
+            var (Any): decision variable of shape (d,), or a number if d is 1
+
+        Returns:
+            Evaluation: objective value, a list if there are several optima
+        """
+        return to_evaluation(self.evaluate_array(var))
+
+    def evaluate_array(self, var: Any) -> npt.NDArray[np.float64]:  # noqa: ANN401
+        """Calculate the objective values of a decision variable, through the cache if the problem has one.
+
+        Args:
+            var (Any): decision variable of shape (d,), or a number if d is 1
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (m,)
+        """
+        var_arr = np.asarray(var, dtype=self.dtype).reshape(1, self.dim)
+        if self.cache is None:
+            return self._evaluate(self.rotate(var_arr)).reshape(self.n_optima)
+        key = self.cache.key(self, var_arr)
+        obj_arr = self.cache.get(key)
+        if obj_arr is None:
+            obj_arr = self._evaluate(self.rotate(var_arr)).reshape(self.n_optima)
+            self.cache.put(key, obj_arr)
+        return obj_arr
+
+    def evaluate_min(self, var: Any) -> MinEvaluation:  # noqa: ANN401
+        """Calculate the best objective value of a decision variable over the optima and the index of its optimum.
+
+        Args:
+            var (Any): decision variable of shape (d,), or a number if d is 1
+
+        Returns:
+            MinEvaluation: best objective value and index of its optimum
+        """
+        return self.minimum_search.evaluate(var)
+
+    def evaluate_min_batch(
+        self,
+        var_batch: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+        """Calculate the best objective values of a batch of decision variables and the indices of their optima.
+
+        Args:
+            var_batch (npt.ArrayLike): decision variables of shape (n, d)
+
+        Returns:
+            tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]: objective values and indices of shape (n,)
+        """
+        return self.minimum_search.evaluate_batch(var_batch)
+
+    def evaluate_batch(self, var_batch: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Calculate the objective values of a batch of decision variables.
+
+        The result of each row is identical to the one of `evaluate` for the same decision variable.
+        The cache is not used, since the rows of a batch are rarely evaluated again.
+
+        Args:
+            var_batch (npt.ArrayLike): decision variables of shape (n, d), or a Dask array with the Dask backend
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (n, m)
+        """
+        return get_backend(self.backend).evaluate_batch(self, var_batch)
+
+    def gradient_batch(self, var_batch: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Calculate the gradients of the objective functions in closed form.
+
+        Args:
+            var_batch (npt.ArrayLike): decision variables of shape (n, d)
+
+        Returns:
+            npt.NDArray[np.float64]: gradients of shape (n, m, d) for each decision variable and optimum
+        """
+        grad_arr = self._gradient(self.rotate(self._as_batch(var_batch)))
+        if self.rotation is not None:
+            # The gradient of f(R x) is R^T times the gradient of f at R x
+            grad_arr = grad_arr @ self.rotation
+        return grad_arr.astype(np.float64, copy=False)
+
+    def hvp_batch(self, var_batch: npt.ArrayLike, vec_batch: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Calculate the products of the Hessians of the objective functions and vectors in closed form.
+
+        Args:
+            var_batch (npt.ArrayLike): decision variables of shape (n, d)
+            vec_batch (npt.ArrayLike): vectors of shape (n, d), one per decision variable
+
+        Returns:
+            npt.NDArray[np.float64]: Hessian-vector products of shape (n, m, d) for each decision variable and optimum
+        """
+        var_arr = self._as_batch(var_batch)
+        vec_arr = self._as_batch(vec_batch)
+        if vec_arr.shape != var_arr.shape:
+            msg = f"Expected vectors of shape {var_arr.shape}, but got {vec_arr.shape}."
+            raise ValueError(msg)
+        hvp_arr = self._hvp(self.rotate(var_arr), self.rotate(vec_arr))
+        if self.rotation is not None:
+            # The Hessian of f(R x) is R^T H R
+            hvp_arr = hvp_arr @ self.rotation
+        return hvp_arr.astype(np.float64, copy=False)
+
+    def _as_batch(self, var_batch: npt.ArrayLike) -> npt.NDArray[np.floating[Any]]:
+        """Convert a batch of decision variables to the precision of the problem.
+
+        Args:
+            var_batch (npt.ArrayLike): decision variables of shape (n, d)
+
+        Returns:
+            npt.NDArray[np.floating[Any]]: decision variables of shape (n, d) in the precision of the problem
+        """
+        var_arr = np.asarray(var_batch, dtype=self.dtype)
+        if var_arr.ndim != 2 or var_arr.shape[1] != self.dim:  # noqa: PLR2004
+            msg = f"Expected decision variables of shape (n, {self.dim}), but got {var_arr.shape}."
+            raise ValueError(msg)
+        return var_arr
+
+    def calibrate_block_size(self) -> int:
+        """Measure the fastest block size for this problem class, which only changes the row blocking.
+
+        Returns:
+            int: number of elements of a block
+        """
+        n_rows = max(1, CALIBRATION_SIZE // (self.n_optima * self.dim))
+        var_arr = (np.random.default_rng(0).uniform(-1, 1, (n_rows, self.dim)) + self.opt[0]).astype(self.dtype)
+        timings = {}
+        for block_size in BLOCK_SIZE_CANDIDATES:
+            start = time.perf_counter()
+            self._evaluate_blocked(var_arr, block_size)
+            timings[block_size] = time.perf_counter() - start
+        fastest = min(timings, key=timings.__getitem__)
+        LOGGER.debug("Calibrated the block size of %s: %d (%s)", self.name, fastest, timings)
+        return fastest
+
+    def block_rows(self, block_size: int) -> int:
+        """Get the number of rows of a block, which always holds at least one row of a column block.
+
+        Args:
+            block_size (int): number of elements of a block
+
+        Returns:
+            int: number of rows of a block
+        """
+        block_rows: int = max(1, block_size // (self.n_optima * min(self.dim, COLUMN_BLOCK)))
+        return block_rows
+
+    def block_bytes(self, block_size: int) -> int:
+        """Get the memory of the temporaries of a block.
+
+        Args:
+            block_size (int): number of elements of a block
+
+        Returns:
+            int: number of bytes of the temporaries of a block
+        """
+        elements: int = self.block_rows(block_size) * self.n_optima * min(self.dim, COLUMN_BLOCK)
+        return BLOCK_TEMPORARIES * elements * self.dtype.itemsize
+
+    def get_block_size(self, n_rows: int) -> int:
+        """Get the block size of an input, calibrating it if the input does not fit in a single block.
+
+        Args:
+            n_rows (int): number of decision variables of the input
+
+        Returns:
+            int: number of elements of a block
+        """
+        if self.block_size is not None:
+            return self.block_size
+        if self.name in _calibrated_block_sizes:
+            return _calibrated_block_sizes[self.name]
+        # The rows of a single block are evaluated at once whatever the block size
+        if n_rows <= self.block_rows(DEFAULT_BLOCK_SIZE):
+            return DEFAULT_BLOCK_SIZE
+        block_size = self.calibrate_block_size()
+        _calibrated_block_sizes[self.name] = block_size
+        return block_size
+
+    def _evaluate(self, var_arr: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.float64]:
+        """Calculate the objective values of validated decision variables.
+
+        Args:
+            var_arr (npt.NDArray[np.floating[Any]]): decision variables of shape (n, d) in the precision of the problem
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (n, m)
+        """
+        obj_arr = get_backend(self.backend).evaluate(self, var_arr)
+        return obj_arr.astype(np.float64, copy=False)
+
+    def _evaluate_blocked(
+        self,
+        var_arr: npt.NDArray[np.floating[Any]],
+        block_size: int,
+        partial: Callable[[npt.NDArray[Any], int, int], npt.NDArray[Any]] | None = None,
+    ) -> npt.NDArray[np.floating[Any]]:
+        """Calculate the objective values block by block on the thread pool.
+
+        Args:
+            var_arr (npt.NDArray[np.floating[Any]]): decision variables of shape (n, d) in the precision of the problem
+            block_size (int): number of elements of a block
+            partial (Callable[[npt.NDArray[Any], int, int], npt.NDArray[Any]] | None): kernel of a block
+                with the signature of `_partial`, which is used if None
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (n, m)
+        """
+        n_rows = var_arr.shape[0]
+        # Only the row blocking depends on the block size, since splitting the rows does not change the sums
+        block_rows = self.block_rows(block_size)
+        obj_arr = np.empty((n_rows, self.n_optima), dtype=self.dtype)
+        kernel = partial if partial is not None else self._partial
+
+        def evaluate_columns(rows: slice, start: int, stop: int) -> npt.NDArray[Any]:
+            if stop - start <= COLUMN_BLOCK:
+                return kernel(var_arr[rows], start, stop)
+            # Split like the pairwise summation of NumPy, so the partial sums are added in the same order
+            half = (stop - start) // 2
+            half -= half % PAIRWISE_UNROLL
+            obj_rows: npt.NDArray[Any] = evaluate_columns(rows, start, start + half)
+            obj_rows += evaluate_columns(rows, start + half, stop)
+            return obj_rows
+
+        def evaluate_rows(start: int) -> None:
+            rows = slice(start, min(start + block_rows, n_rows))
+            obj_arr[rows] = evaluate_columns(rows, 0, max(1, self.dim - self.chunk_overlap))
+
+        starts = range(0, n_rows, block_rows)
+        if len(starts) == 1 or _single_threaded:
+            for start in starts:
+                evaluate_rows(start)
+        else:
+            for future in [_get_thread_pool().submit(evaluate_rows, start) for start in starts]:
+                future.result()
+        return obj_arr
+
+    @abstractmethod
+    def _partial(
+        self,
+        var_arr: npt.NDArray[np.floating[Any]],
+        start: int,
+        stop: int,
+    ) -> npt.NDArray[np.floating[Any]]:
+        """Calculate the part of the objective values coming from the decision dimensions [start, stop).
+
+        Args:
+            var_arr (npt.NDArray[np.floating[Any]]): decision variables of shape (n, d) in the precision of the problem
+            start (int): first decision dimension
+            stop (int): decision dimension after the last one
+
+        Returns:
+            npt.NDArray[np.floating[Any]]: partial objective values of shape (n, m)
+        """
+
+    @classmethod
+    @abstractmethod
+    def chunk_partial(
+        cls,
+        var_chunk: npt.NDArray[np.float64],
+        opt_chunk: npt.NDArray[np.float64],
+        start: int,
+        dim: int,
+    ) -> npt.NDArray[np.float64]:
+        """Calculate the part of the objective values coming from a chunk of a single decision variable.
+
+        Unlike `_partial`, only the chunk of the decision variable and of the optima are given, so a decision
+        variable too large for the memory is evaluated chunk by chunk without building the problem.
+        The terms of the last `chunk_overlap` decision dimensions of the chunk are left to the next chunk,
+        which starts with them.
+
+        Args:
+            var_chunk (npt.NDArray[np.float64]): decision dimensions [start, start + c) of the decision variable
+            opt_chunk (npt.NDArray[np.float64]): decision dimensions [start, start + c) of the optima of shape (m, c)
+            start (int): first decision dimension of the chunk
+            dim (int): number of decision dimensions of the whole decision variable
+
+        Returns:
+            npt.NDArray[np.float64]: partial objective values of shape (m,)
+        """
+
+    @abstractmethod
+    def _gradient(self, var_arr: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.floating[Any]]:
+        """Calculate the gradients of the objective functions.
+
+        Args:
+            var_arr (npt.NDArray[np.floating[Any]]): decision variables of shape (n, d) in the precision of the problem
+
+        Returns:
+            npt.NDArray[np.floating[Any]]: gradients of shape (n, m, d)
+        """
+
+    @abstractmethod
+    def _hvp(
+        self,
+        var_arr: npt.NDArray[np.floating[Any]],
+        vec_arr: npt.NDArray[np.floating[Any]],
+    ) -> npt.NDArray[np.floating[Any]]:
+        """Calculate the products of the Hessians of the objective functions and vectors.
+
+        Args:
+            var_arr (npt.NDArray[np.floating[Any]]): decision variables of shape (n, d) in the precision of the problem
+            vec_arr (npt.NDArray[np.floating[Any]]): vectors of shape (n, d) in the precision of the problem
+
+        Returns:
+            npt.NDArray[np.floating[Any]]: Hessian-vector products of shape (n, m, d)
+        """
@@ -0,0 +1,71 @@
+"""Random rotation matrices cached on disk."""
+
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+LOGGER = logging.getLogger(__name__)
+
+# Environment variable overriding the directory of the cached rotation matrices
+ROTATION_DIR_ENVVAR = "OPTHUB_ROTATION_DIR"
+
+
+def rotation_dir() -> Path:
+    """Get the directory of the cached rotation matrices.
+
+    Returns:
+        Path: $OPTHUB_ROTATION_DIR, or opthub_problems/rotations in the user cache directory
+    """
+    if ROTATION_DIR_ENVVAR in os.environ:
+        return Path(os.environ[ROTATION_DIR_ENVVAR])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "opthub_problems" / "rotations"
+
+
+def generate_rotation(seed: int, dim: int) -> npt.NDArray[np.float64]:
+    """Generate a uniformly random orthogonal matrix.
+
+    The matrix is the Q factor of the QR decomposition of a Gaussian matrix,
+    with the signs fixed by the diagonal of R so that it is uniform over the orthogonal group.
+
+    Args:
+        seed (int): seed of the random generator
+        dim (int): number of decision dimensions
+
+    Returns:
+        npt.NDArray[np.float64]: orthogonal matrix of shape (d, d)
+    """
+    gaussian = np.random.default_rng(seed).standard_normal((dim, dim))
+    q_arr, r_arr = np.linalg.qr(gaussian)
+    return np.asarray(q_arr * np.sign(np.diag(r_arr)), dtype=np.float64)
+
+
+def rotation_matrix(seed: int, dim: int, directory: str | Path | None = None) -> npt.NDArray[np.float64]:
+    """Load the rotation matrix of a seed and a dimension, generating and caching it as .npy on first use.
+
+    The cache keeps the matrix identical on a node even if the linear algebra library rounds differently.
+
+    Args:
+        seed (int): seed of the random generator
+        dim (int): number of decision dimensions
+        directory (str | Path | None): directory of the cached matrices, defaults to `rotation_dir()`
+
+    Returns:
+        npt.NDArray[np.float64]: read-only memory-mapped orthogonal matrix of shape (d, d)
+    """
+    path = Path(directory if directory is not None else rotation_dir()) / f"rotation-{seed}-{dim}.npy"
+    if not path.exists():
+        LOGGER.debug("Generating the rotation matrix %s...", path)
+        rotation = generate_rotation(seed, dim)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(temporary, rotation)
+        temporary.replace(path)
+    loaded: npt.NDArray[np.float64] = np.load(path, mmap_mode="r")
+    if loaded.shape != (dim, dim):
+        msg = f"Expected a rotation matrix of shape ({dim}, {dim}) in {path}, but got {loaded.shape}."
+        raise ValueError(msg)
+    return loaded
@@ -0,0 +1,381 @@
+"""Asyncio socket server coalescing concurrent evaluations into vectorized calls."""
+
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import signal
+from collections.abc import Callable
+from pathlib import Path
+from traceback import format_exc
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from opthub_problems.utils.binary import RAW_DTYPE, RAW_PREFIX, write_error_frame, write_npy_frame, write_raw_frame
+from opthub_problems.utils.problem import Problem, to_evaluation
+
+LOGGER = logging.getLogger(__name__)
+
+# Seconds a request waits for others to be evaluated with it by default
+DEFAULT_WINDOW = 0.002
+
+# Number of decision variables evaluated at once by default
+DEFAULT_MAX_BATCH = 256
+
+# Limit of a line of a JSON request in bytes
+LINE_LIMIT = 64 * 1024**2
+
+
+class MicroBatcher:
+    """Coalescer of the decision variables evaluated concurrently.
+
+    A decision variable waits at most `window` seconds for others, or until `max_batch` of them are pending,
+    then they are all evaluated by a single call of `evaluate_batch` in a worker thread,
+    and each caller gets its own row of the result.
+    """
+
+    def __init__(
+        self,
+        evaluate_batch: Callable[[npt.NDArray[Any]], npt.NDArray[np.float64]],
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            evaluate_batch (Callable[[npt.NDArray[Any]], npt.NDArray[np.float64]]): function evaluating
+                decision variables of shape (n, d) to results of shape (n, k)
+            window (float): seconds a decision variable waits for others
+            max_batch (int): number of pending decision variables evaluated without waiting for the window
+        """
+        self.evaluate_batch = evaluate_batch
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.rows = 0
+        self._pending: list[tuple[npt.NDArray[Any], asyncio.Future[npt.NDArray[np.float64]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def evaluate(self, var_arr: npt.NDArray[Any]) -> npt.NDArray[np.float64]:
+        """Evaluate a decision variable with the others pending.
+
+        Args:
+            var_arr (npt.NDArray[Any]): validated decision variable of shape (d,)
+
+        Returns:
+            npt.NDArray[np.float64]: result of shape (k,)
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[npt.NDArray[np.float64]] = loop.create_future()
+        self._pending.append((var_arr, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def stats(self) -> dict[str, int]:
+        """Get the counters of the batcher.
+
+        Returns:
+            dict[str, int]: numbers of vectorized calls and of decision variables evaluated
+        """
+        return {"batches": self.batches, "rows": self.rows}
+
+    def _flush(self) -> None:
+        """Start evaluating the pending decision variables."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.get_running_loop().create_task(self._evaluate(pending))
+            # The loop only keeps weak references to the tasks
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _evaluate(
+        self,
+        pending: list[tuple[npt.NDArray[Any], asyncio.Future[npt.NDArray[np.float64]]]],
+    ) -> None:
+        """Evaluate decision variables at once and resolve their futures.
+
+        Args:
+            pending (list[tuple[npt.NDArray[Any], asyncio.Future[npt.NDArray[np.float64]]]]): decision variables
+                and the futures of their callers
+        """
+        var_batch = np.stack([var_arr for var_arr, _ in pending])
+        self.batches += 1
+        self.rows += len(pending)
+        LOGGER.debug("Evaluating a batch of %d decision variables.", len(pending))
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(None, self.evaluate_batch, var_batch)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for row, (_, future) in enumerate(pending):
+            if not future.done():
+                future.set_result(result[row])
+
+
+async def read_exact(reader: asyncio.StreamReader, size: int) -> bytes | None:
+    """Read exactly the given number of bytes.
+
+    Args:
+        reader (asyncio.StreamReader): input stream
+        size (int): number of bytes to read
+
+    Raises:
+        EOFError: if the stream ends in the middle of the bytes
+
+    Returns:
+        bytes | None: read bytes, or None if the stream is already at EOF
+    """
+    try:
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        msg = f"Unexpected EOF: expected {size} bytes, but got {len(e.partial)} bytes."
+        raise EOFError(msg) from e
+
+
+async def read_npy_frame(reader: asyncio.StreamReader) -> npt.NDArray[Any] | None:
+    """Read an array from a .npy frame.
+
+    Args:
+        reader (asyncio.StreamReader): input stream
+
+    Returns:
+        npt.NDArray[Any] | None: read array, or None at EOF
+    """
+    magic = await read_exact(reader, np.lib.format.MAGIC_LEN)
+    if magic is None:
+        return None
+    version = np.lib.format.read_magic(io.BytesIO(magic))
+    length = await reader.readexactly(2 if version == (1, 0) else 4)
+    header = io.BytesIO(length + await reader.readexactly(int.from_bytes(length, "little")))
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+    if dtype.hasobject:
+        msg = "Object arrays are not supported."
+        raise ValueError(msg)
+    data = await reader.readexactly(int(np.prod(shape)) * dtype.itemsize)
+    return np.frombuffer(data, dtype=dtype).reshape(shape, order="F" if fortran_order else "C")
+
+
+async def read_raw_frame(reader: asyncio.StreamReader) -> npt.NDArray[np.float64] | None:
+    """Read a length-prefixed raw float64 frame.
+
+    Args:
+        reader (asyncio.StreamReader): input stream
+
+    Returns:
+        npt.NDArray[np.float64] | None: read array, or None at EOF
+    """
+    prefix = await read_exact(reader, RAW_PREFIX.size)
+    if prefix is None:
+        return None
+    (count,) = RAW_PREFIX.unpack(prefix)
+    if count < 0:
+        msg = f"The element count must be non-negative, but got {count}."
+        raise ValueError(msg)
+    return np.frombuffer(await reader.readexactly(count * RAW_DTYPE.itemsize), dtype=RAW_DTYPE)
+
+
+class EvaluationServer:
+    """Server evaluating the solution variables sent by concurrent clients through a micro-batcher.
+
+    A connection sends newline-delimited JSON solution variables, or binary frames, as in the streaming mode
+    of the commands, and gets one result per solution variable in the same order. A connection may send
+    several solution variables without waiting for their results, so they are batched together too.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        problem: Problem,
+        parse_variable: Callable[[str | bytes, int], npt.NDArray[np.float64]],
+        validate_variable_array: Callable[[npt.NDArray[Any], int], npt.NDArray[Any]],
+        data_format: str = "json",
+        reduce: str = "none",
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            problem (Problem): problem built from the validated optima
+            parse_variable (Callable[[str | bytes, int], npt.NDArray[np.float64]]): decoder and validator of
+                a JSON solution variable
+            validate_variable_array (Callable[[npt.NDArray[Any], int], npt.NDArray[Any]]): validator of
+                a solution variable given as an array
+            data_format (str): json, npy or raw
+            reduce (str): none for the objective values of all the optima, or min for the best one
+            window (float): seconds a solution variable waits for others
+            max_batch (int): number of solution variables evaluated at once
+        """
+        self.problem = problem
+        self.parse_variable = parse_variable
+        self.validate_variable_array = validate_variable_array
+        self.data_format = data_format
+        self.reduce = reduce
+        self.batcher = MicroBatcher(self._evaluate_batch, window, max_batch)
+
+    def _evaluate_batch(self, var_batch: npt.NDArray[Any]) -> npt.NDArray[np.float64]:
+        """Evaluate validated decision variables.
+
+        Args:
+            var_batch (npt.NDArray[Any]): decision variables of shape (n, d)
+
+        Returns:
+            npt.NDArray[np.float64]: objective values of shape (n, m),
+                or the best one and the index of its optimum of shape (n, 2)
+        """
+        if self.reduce == "min":
+            obj_arr, index_arr = self.problem.evaluate_min_batch(var_batch)
+            return np.stack([obj_arr, index_arr.astype(np.float64)], axis=1)
+        return self.problem.evaluate_batch(var_batch)
+
+    async def _evaluate_line(self, line: bytes) -> bytes:
+        """Evaluate a JSON solution variable.
+
+        Args:
+            line (bytes): JSON encoded solution variable
+
+        Returns:
+            bytes: JSON line of the result or the error
+        """
+        try:
+            var_arr = self.parse_variable(line, self.problem.dim)
+            result_arr = await self.batcher.evaluate(np.asarray(var_arr, dtype=self.problem.dtype))
+            result: dict[str, Any]
+            if self.reduce == "min":
+                result = {"objective": float(result_arr[0]), "optimum": int(result_arr[1])}
+            else:
+                result = dict(to_evaluation(result_arr))
+        except Exception as e:
+            LOGGER.exception(format_exc())
+            result = {"objective": None, "error": str(e)}
+        return json.dumps(result).encode() + b"\n"
+
+    async def _evaluate_frame(self, variable: npt.NDArray[Any]) -> bytes:
+        """Evaluate a solution variable given as a binary frame.
+
+        Args:
+            variable (npt.NDArray[Any]): solution variable
+
+        Returns:
+            bytes: frame of the result or the error
+        """
+        frame = io.BytesIO()
+        try:
+            var_arr = self.validate_variable_array(variable, self.problem.dim)
+            result_arr = await self.batcher.evaluate(np.asarray(var_arr, dtype=self.problem.dtype))
+        except Exception as e:
+            LOGGER.exception(format_exc())
+            write_error_frame(frame, self.data_format, str(e))
+        else:
+            if self.data_format == "npy":
+                write_npy_frame(frame, result_arr)
+            else:
+                write_raw_frame(frame, result_arr)
+        return frame.getvalue()
+
+    async def _read_requests(
+        self,
+        reader: asyncio.StreamReader,
+        responses: "asyncio.Queue[asyncio.Task[bytes] | bytes | None]",
+    ) -> None:
+        """Read the requests of a connection and queue the tasks evaluating them in order.
+
+        Args:
+            reader (asyncio.StreamReader): input stream of the connection
+            responses (asyncio.Queue[asyncio.Task[bytes] | bytes | None]): queue of the responses, ended by None
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            if self.data_format == "json":
+                while line := await reader.readline():
+                    if line.strip():
+                        await responses.put(loop.create_task(self._evaluate_line(line)))
+            else:
+                read_frame = read_npy_frame if self.data_format == "npy" else read_raw_frame
+                while (variable := await read_frame(reader)) is not None:
+                    await responses.put(loop.create_task(self._evaluate_frame(variable)))
+        except Exception as e:
+            # The next request cannot be found after a malformed one, so the connection is closed
+            LOGGER.exception(format_exc())
+            if self.data_format == "json":
+                await responses.put(json.dumps({"objective": None, "error": str(e)}).encode() + b"\n")
+            else:
+                frame = io.BytesIO()
+                write_error_frame(frame, self.data_format, str(e))
+                await responses.put(frame.getvalue())
+        finally:
+            await responses.put(None)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer the requests of a connection until EOF.
+
+        Args:
+            reader (asyncio.StreamReader): input stream of the connection
+            writer (asyncio.StreamWriter): output stream of the connection
+        """
+        responses: asyncio.Queue[asyncio.Task[bytes] | bytes | None] = asyncio.Queue()
+        read_task = asyncio.get_running_loop().create_task(self._read_requests(reader, responses))
+        try:
+            while (response := await responses.get()) is not None:
+                writer.write(response if isinstance(response, bytes) else await response)
+                await writer.drain()
+        except ConnectionError:
+            LOGGER.info("The client closed the connection.")
+        finally:
+            read_task.cancel()
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def serve(self, path: str | Path | None = None, host: str = "127.0.0.1", port: int | None = None) -> None:
+        """Serve on a Unix socket or a TCP port until SIGTERM or SIGINT.
+
+        Args:
+            path (str | Path | None): Unix socket to listen on, replaced if it exists
+            host (str): host to listen on with TCP
+            port (int | None): TCP port to listen on if no Unix socket is given
+        """
+        if path is not None:
+            Path(path).unlink(missing_ok=True)
+        try:
+            asyncio.run(self._serve(path, host, port))
+        finally:
+            if path is not None:
+                Path(path).unlink(missing_ok=True)
+            LOGGER.info("Stopped serving. Batching statistics: %s", self.batcher.stats())
+
+    async def _serve(self, path: str | Path | None, host: str, port: int | None) -> None:
+        """Serve until SIGTERM or SIGINT.
+
+        Args:
+            path (str | Path | None): Unix socket to listen on
+            host (str): host to listen on with TCP
+            port (int | None): TCP port to listen on if no Unix socket is given
+        """
+        if path is not None:
+            server = await asyncio.start_unix_server(self.handle_connection, str(path), limit=LINE_LIMIT)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, limit=LINE_LIMIT)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stop.set)
+        LOGGER.info("Serving on %s.", ", ".join(str(sock.getsockname()) for sock in server.sockets))
+        async with server:
+            await stop.wait()
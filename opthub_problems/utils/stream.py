@@ -0,0 +1,39 @@
+"""Newline-delimited JSON streaming of evaluations."""
+
+import json
+import logging
+import sys
+from collections.abc import Callable, Mapping
+from traceback import format_exc
+from typing import Any, TextIO
+
+LOGGER = logging.getLogger(__name__)
+
+
+def serve_stream(
+    handle: Callable[[str], Mapping[str, Any]],
+    stdin: TextIO | None = None,
+    stdout: TextIO | None = None,
+) -> None:
+    """Evaluate newline-delimited solution variables until EOF.
+
+    Each non-empty input line is passed to `handle` and answered by exactly one newline-terminated JSON object.
+    An error raised for a line is reported as the result of that line and does not stop the stream.
+
+    Args:
+        handle (Callable[[str], Mapping[str, Any]]): function to evaluate a line
+        stdin (TextIO | None): input stream, defaults to sys.stdin
+        stdout (TextIO | None): output stream, defaults to sys.stdout
+    """
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            result: Mapping[str, Any] = handle(line)
+        except Exception as e:
+            LOGGER.exception(format_exc())
+            result = {"objective": None, "error": str(e)}
+        stdout.write(json.dumps(result) + "\n")
+        stdout.flush()
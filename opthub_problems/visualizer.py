@@ -0,0 +1,249 @@
+"""Visualize the landscapes of the problems as 3D surfaces.
+
+Regenerate the thumbnails of all the problems next to their modules:
+
+    python -m opthub_problems.visualizer
+
+The surface of a problem is evaluated on the whole mesh at once and cached as a .npz file keyed by the problem,
+its optima, the bounds and the resolution, so rendering again in another format or size does not evaluate it again.
+The figures are rendered with the Agg canvas, which needs no display.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import click
+import numpy as np
+import numpy.typing as npt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.problem import Problem
+
+LOGGER = logging.getLogger(__name__)
+
+# Problems with the optima of their thumbnails
+PROBLEMS: dict[str, tuple[type[Problem], list[list[float]]]] = {
+    "sphere": (SphereProblem, [[0.0, 0.0]]),
+    "rastrigin": (RastriginProblem, [[0.0, 0.0]]),
+    "rosenbrock": (RosenbrockProblem, [[1.0, 1.0]]),
+    "elliptic": (EllipticProblem, [[0.0, 0.0]]),
+}
+
+# Formats of the figures
+IMAGE_FORMATS = ("jpg", "png", "svg", "pdf")
+
+# Environment variable giving the directory of the cached surfaces
+CACHE_DIR_ENVVAR = "OPTHUB_VISUALIZER_CACHE"
+
+# Directory of the cached surfaces by default
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "opthub_problems" / "visualizer"
+
+# Directory of the modules of the problems, where their thumbnails are rendered by default
+PACKAGE_DIR = Path(__file__).parent
+
+
+def surface_key(problem: Problem, bounds: tuple[float, float], resolution: int) -> str:
+    """Calculate the key of the surface of a problem.
+
+    Args:
+        problem (Problem): problem of 2 decision dimensions
+        bounds (tuple[float, float]): lower and upper bounds of both decision dimensions
+        resolution (int): number of points along each decision dimension
+
+    Returns:
+        str: key of the surface
+    """
+    digest = hashlib.blake2b(problem.digest, digest_size=16)
+    digest.update(json.dumps([list(bounds), resolution]).encode())
+    return f"{problem.name}-{digest.hexdigest()}"
+
+
+def compute_surface(
+    problem: Problem,
+    bounds: tuple[float, float],
+    resolution: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Evaluate the best objective value over the optima on a square mesh in a single batch.
+
+    Args:
+        problem (Problem): problem of 2 decision dimensions
+        bounds (tuple[float, float]): lower and upper bounds of both decision dimensions
+        resolution (int): number of points along each decision dimension
+
+    Returns:
+        tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]: coordinates and objective
+            values of shape (resolution, resolution)
+    """
+    axis = np.linspace(bounds[0], bounds[1], resolution)
+    x, y = np.meshgrid(axis, axis)
+    # The optima are few, so the minimum of the dense evaluation is faster than the search of `evaluate_min_batch`
+    z = problem.evaluate_batch(np.column_stack([x.ravel(), y.ravel()])).min(axis=1).reshape(x.shape)
+    return x, y, z
+
+
+def load_surface(
+    problem: Problem,
+    bounds: tuple[float, float],
+    resolution: int,
+    cache_dir: Path | None = None,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Load the surface of a problem from the cache, or evaluate and cache it.
+
+    Args:
+        problem (Problem): problem of 2 decision dimensions
+        bounds (tuple[float, float]): lower and upper bounds of both decision dimensions
+        resolution (int): number of points along each decision dimension
+        cache_dir (Path | None): directory of the cached surfaces, or None not to cache
+
+    Returns:
+        tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]: coordinates and objective
+            values of shape (resolution, resolution)
+    """
+    if cache_dir is None:
+        return compute_surface(problem, bounds, resolution)
+    path = cache_dir / f"{surface_key(problem, bounds, resolution)}.npz"
+    if path.exists():
+        LOGGER.info("Loading the surface from %s.", path)
+        with np.load(path) as surface:
+            return surface["x"], surface["y"], surface["z"]
+    x, y, z = compute_surface(problem, bounds, resolution)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Written under a temporary name then renamed, so a concurrent reader never sees a partial file
+    temporary = path.with_suffix(f".{os.getpid()}.npz")
+    np.savez(temporary, x=x, y=y, z=z)
+    temporary.replace(path)
+    LOGGER.info("Cached the surface in %s.", path)
+    return x, y, z
+
+
+def render_surface(
+    surface: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]],
+    path: Path,
+    image_format: str = "jpg",
+    dpi: int = 600,
+) -> None:
+    """Render a surface as a 3D plot without axis labels.
+
+    Args:
+        surface (tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]): coordinates and
+            objective values of shape (r, r)
+        path (Path): file of the figure
+        image_format (str): format of the figure
+        dpi (int): resolution of the figure in dots per inch
+    """
+    x, y, z = surface
+    figure = Figure(figsize=(10, 5))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111, projection="3d")
+    ax.plot_surface(x, y, z, cmap="rainbow", edgecolor="none")
+    figure.subplots_adjust(left=-0.2, right=1.2, top=1.2, bottom=-0.2)
+    ax.view_init(elev=25, azim=125)
+    ax.set_xticklabels([])
+    ax.set_yticklabels([])
+    ax.set_zticklabels([])
+    figure.savefig(path, format=image_format, dpi=dpi)
+
+
+@click.command(help="Visualize the landscapes of the problems as 3D surfaces.")
+@click.option(
+    "--problem",
+    "problems",
+    type=click.Choice(list(PROBLEMS)),
+    multiple=True,
+    help="Problems to visualize, all of them by default.",
+)
+@click.option(
+    "--optima",
+    type=str,
+    default=None,
+    help="Optima of 2 decision dimensions of the problems, the ones of the thumbnails by default.",
+)
+@click.option(
+    "--bounds",
+    type=(float, float),
+    default=(-5.0, 5.0),
+    help="Lower and upper bounds of both decision dimensions.",
+)
+@click.option(
+    "--resolution",
+    type=click.IntRange(min=2),
+    default=200,
+    help="Number of points along each decision dimension.",
+)
+@click.option(
+    "--format",
+    "image_format",
+    type=click.Choice(IMAGE_FORMATS),
+    default="jpg",
+    help="Format of the figures.",
+)
+@click.option(
+    "--dpi",
+    type=click.IntRange(min=1),
+    default=600,
+    help="Resolution of the figures in dots per inch.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory of the figures, the directory of each problem by default.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar=CACHE_DIR_ENVVAR,
+    default=DEFAULT_CACHE_DIR,
+    help="Directory of the cached surfaces.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Evaluate the surfaces without the cache.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
+    default="INFO",
+    help="Log level.",
+)
+def main(  # noqa: PLR0913, PLR0917
+    problems: tuple[str, ...],
+    optima: str | None,
+    bounds: tuple[float, float],
+    resolution: int,
+    image_format: str,
+    dpi: int,
+    output_dir: str | None,
+    cache_dir: str,
+    no_cache: bool,
+    log_level: str,
+) -> None:
+    """Render the surfaces of the problems."""
+    logging.basicConfig(level=log_level)
+
+    for name in problems or tuple(PROBLEMS):
+        problem_class, default_optima = PROBLEMS[name]
+        problem = problem_class(json.loads(optima) if optima is not None else default_optima)
+        if problem.dim != 2:  # noqa: PLR2004
+            msg = f"The optima must have 2 decision dimensions, but got {problem.dim}."
+            raise click.BadParameter(msg, param_hint="--optima")
+        surface = load_surface(problem, bounds, resolution, None if no_cache else Path(cache_dir))
+        directory = PACKAGE_DIR / name if output_dir is None else Path(output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{name}.{image_format}"
+        render_surface(surface, path, image_format, dpi)
+        LOGGER.info("Rendered %s.", path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Micro-benchmarks of the problem evaluators with stored baselines.
+
+Run the benchmarks and compare them with the committed baseline:
+
+    python -m tests.benchmarks.bench run --output current.json
+    python -m tests.benchmarks.bench compare current.json
+
+The baseline is regenerated with `run --output tests/benchmarks/baseline.json` on the reference machine
+when a change is accepted to be slower, or faster.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import click
+import numpy as np
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.problem import Problem
+
+PROBLEM_CLASSES: dict[str, type[Problem]] = {
+    "sphere": SphereProblem,
+    "elliptic": EllipticProblem,
+    "rastrigin": RastriginProblem,
+    "rosenbrock": RosenbrockProblem,
+}
+
+# Minimum numbers of decision dimensions accepted by the validators
+MIN_DIMS = {"sphere": 1, "elliptic": 2, "rastrigin": 1, "rosenbrock": 2}
+
+# Grid of the numbers of decision dimensions, decision variables and optima
+DIMS = (1, 10, 100, 10**3, 10**4, 10**5, 10**6)
+ROWS = (1, 100)
+OPTIMA = (1, 10)
+
+# Cases with more (row, optimum, dimension) elements than this are skipped
+MAX_ELEMENTS = 10**8
+
+# Minimum duration of a timing round, so the fast cases are repeated enough to be measured
+MIN_ROUND_SECONDS = 0.05
+
+# Number of timing rounds, whose fastest one is reported
+ROUNDS = 5
+
+# Relative slowdown and memory growth flagged as regressions by default
+TIME_TOLERANCE = 0.25
+MEMORY_TOLERANCE = 0.1
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+def case_id(problem: str, method: str, dim: int, rows: int, optima: int) -> str:
+    """Format the identifier of a benchmark case.
+
+    Args:
+        problem (str): name of the problem
+        method (str): name of the evaluation method
+        dim (int): number of decision dimensions
+        rows (int): number of decision variables
+        optima (int): number of optima
+
+    Returns:
+        str: identifier of the case
+    """
+    return f"{problem}/{method}/d={dim}/n={rows}/m={optima}"
+
+
+def cases(max_elements: int = MAX_ELEMENTS) -> list[tuple[str, str, int, int, int]]:
+    """List the benchmark cases of the grid.
+
+    `evaluate` takes a single decision variable, and `evaluate_min_batch` is only run with several optima.
+
+    Args:
+        max_elements (int): maximum number of (row, optimum, dimension) elements of a case
+
+    Returns:
+        list[tuple[str, str, int, int, int]]: problem, method, dimensions, rows and optima of each case
+    """
+    grid = []
+    for problem in PROBLEM_CLASSES:
+        for dim in DIMS:
+            if dim < MIN_DIMS[problem]:
+                continue
+            for optima in OPTIMA:
+                for rows in ROWS:
+                    if rows * optima * dim > max_elements:
+                        continue
+                    if rows == 1:
+                        grid.append((problem, "evaluate", dim, rows, optima))
+                    grid.append((problem, "evaluate_batch", dim, rows, optima))
+                    if optima > 1:
+                        grid.append((problem, "evaluate_min_batch", dim, rows, optima))
+    return grid
+
+
+def measure(function: Callable[[], Any]) -> dict[str, float]:
+    """Time a function and measure the peak memory it allocates.
+
+    The time is the fastest of several rounds, each repeating the function for at least `MIN_ROUND_SECONDS`.
+    The peak memory is traced in a separate call, since tracing slows the allocations down.
+
+    Args:
+        function (Callable[[], Any]): function to measure
+
+    Returns:
+        dict[str, float]: seconds per call and peak bytes allocated during a call
+    """
+    function()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_ROUND_SECONDS:
+            break
+        number *= 10
+    timings = [elapsed / number]
+    for _ in range(ROUNDS - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_bytes": peak}
+
+
+def run_case(problem: str, method: str, dim: int, rows: int, optima: int) -> dict[str, float]:
+    """Measure a benchmark case on random optima and decision variables.
+
+    Args:
+        problem (str): name of the problem
+        method (str): name of the evaluation method
+        dim (int): number of decision dimensions
+        rows (int): number of decision variables
+        optima (int): number of optima
+
+    Returns:
+        dict[str, float]: seconds per call and peak bytes allocated during a call
+    """
+    rng = np.random.default_rng(0)
+    instance = PROBLEM_CLASSES[problem](rng.uniform(-5, 5, (optima, dim)))
+    population = rng.uniform(-5, 5, (rows, dim))
+    if method == "evaluate":
+        return measure(lambda: instance.evaluate(population[0]))
+    return measure(lambda: getattr(instance, method)(population))
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    time_tolerance: float = TIME_TOLERANCE,
+    memory_tolerance: float = MEMORY_TOLERANCE,
+) -> list[str]:
+    """Find the regressions of the current results against the baseline.
+
+    Args:
+        baseline (dict[str, Any]): results of the baseline
+        current (dict[str, Any]): results to check
+        time_tolerance (float): relative slowdown tolerated
+        memory_tolerance (float): relative growth of the peak memory tolerated
+
+    Returns:
+        list[str]: descriptions of the regressions
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        if key not in baseline["results"]:
+            continue
+        expected = baseline["results"][key]
+        if result["seconds"] > expected["seconds"] * (1 + time_tolerance):
+            ratio = result["seconds"] / expected["seconds"]
+            regressions.append(
+                f"{key}: {result['seconds'] * 1e3:.3f} ms against {expected['seconds'] * 1e3:.3f} ms ({ratio:.2f}x)",
+            )
+        if result["peak_bytes"] > expected["peak_bytes"] * (1 + memory_tolerance):
+            regressions.append(f"{key}: peak {result['peak_bytes']} bytes against {expected['peak_bytes']} bytes")
+    return regressions
+
+
+@click.group(help="Micro-benchmarks of the problem evaluators.")
+def main() -> None:
+    """Run or compare the benchmarks."""
+
+
+@main.command(help="Run the benchmarks and write the results as JSON.")
+@click.option("--output", type=click.Path(dir_okay=False), default=None, help="JSON file of the results.")
+@click.option(
+    "--problem",
+    "problems",
+    type=click.Choice(list(PROBLEM_CLASSES)),
+    multiple=True,
+    help="Problems to benchmark, all of them by default.",
+)
+@click.option(
+    "--max-elements",
+    type=click.IntRange(min=1),
+    default=MAX_ELEMENTS,
+    help="Skip the cases with more (row, optimum, dimension) elements.",
+)
+def run(output: str | None, problems: tuple[str, ...], max_elements: int) -> None:
+    """Run the benchmarks."""
+    results = {}
+    for problem, method, dim, rows, optima in cases(max_elements):
+        if problems and problem not in problems:
+            continue
+        key = case_id(problem, method, dim, rows, optima)
+        results[key] = run_case(problem, method, dim, rows, optima)
+        click.echo(f"{key}: {results[key]['seconds'] * 1e3:.3f} ms, peak {results[key]['peak_bytes']} bytes", err=True)
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2) + "\n"
+    if output is None:
+        sys.stdout.write(text)
+    else:
+        Path(output).write_text(text)
+
+
+@main.command(help="Flag the regressions of the results against a baseline, exiting with 1 if any.")
+@click.argument("current_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=BASELINE_PATH,
+    help="JSON file of the baseline results, the committed baseline by default.",
+)
+@click.option("--time-tolerance", type=float, default=TIME_TOLERANCE, help="Relative slowdown tolerated.")
+@click.option("--memory-tolerance", type=float, default=MEMORY_TOLERANCE, help="Relative memory growth tolerated.")
+def compare(current_path: str, baseline_path: str, time_tolerance: float, memory_tolerance: float) -> None:
+    """Compare the results with a baseline."""
+    baseline = json.loads(Path(baseline_path).read_text())
+    current = json.loads(Path(current_path).read_text())
+    regressions = compare_results(baseline, current, time_tolerance, memory_tolerance)
+    for regression in regressions:
+        click.echo(f"Regression: {regression}")
+    missing = sorted(set(baseline["results"]) - set(current["results"]))
+    if missing:
+        click.echo(f"Not measured: {len(missing)} cases of the baseline")
+    if regressions:
+        sys.exit(1)
+    click.echo(f"No regression in {len(current['results'])} cases.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Startup of the one-shot commands against the fork server.
+
+    python -m tests.benchmarks.startup --output startup.json
+
+Each command answers the same request in three ways: started from scratch as in the containers,
+through a fork server with the request sent in process, and through a fork server with the request sent
+by the standard-library client `python -m opthub_common.forkserver`.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import click
+
+from opthub_common.forkserver import request
+
+# Commands with their environment variables and request
+COMMANDS: dict[str, tuple[str, dict[str, str], bytes]] = {
+    "sphere": ("opthub_problems.sphere.main", {"SPHERE_OPTIMA": "[[0, 0], [1, 1]]"}, b"[1, 2]\n"),
+    "rastrigin": ("opthub_problems.rastrigin.main", {"Rastrigin_OPTIMA": "[[0, 0], [1, 1]]"}, b"[1, 2]\n"),
+    "best": ("opthub_indicators.best.main", {}, b'{"objective": 1.0, "feasible": true, "constraint": null}\n[]\n'),
+    "hypervolume": (
+        "opthub_indicators.hypervolume.main",
+        {"HV_REF_POINT": "[10, 10]"},
+        b'{"objective": [1.0, 2.0], "feasible": true, "constraint": null}\n[]\n',
+    ),
+}
+
+# Seconds to wait for a fork server to listen
+STARTUP_TIMEOUT = 60.0
+
+
+def measure(function: Callable[[], bytes], repeat: int) -> dict[str, float]:
+    """Time the answers to a request.
+
+    Args:
+        function (Callable[[], bytes]): function answering the request
+        repeat (int): number of timed answers
+
+    Returns:
+        dict[str, float]: median and minimum seconds of an answer
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {"median_seconds": statistics.median(timings), "min_seconds": min(timings)}
+
+
+def run_command(module: str, environment: dict[str, str], data: bytes) -> bytes:
+    """Answer a request with a one-shot command.
+
+    Args:
+        module (str): module of the command
+        environment (dict[str, str]): environment variables of the command
+        data (bytes): request
+
+    Returns:
+        bytes: response
+    """
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-m", module, "--log-level", "ERROR"],
+        input=data,
+        env={**os.environ, **environment},
+        capture_output=True,
+        check=True,
+    ).stdout
+
+
+def run_client(path: Path, data: bytes) -> bytes:
+    """Answer a request through a fork server with the standard-library client.
+
+    Args:
+        path (Path): Unix socket of the fork server
+        data (bytes): request
+
+    Returns:
+        bytes: response
+    """
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "opthub_common.forkserver", str(path)],
+        input=data,
+        capture_output=True,
+        check=True,
+    ).stdout
+
+
+def compare_startup(name: str, repeat: int) -> dict[str, dict[str, float]]:
+    """Time the answers of a command in the three ways.
+
+    Args:
+        name (str): name of the command
+        repeat (int): number of timed answers of each way
+
+    Returns:
+        dict[str, dict[str, float]]: timings of each way
+    """
+    module, environment, data = COMMANDS[name]
+    expected = run_command(module, environment, data)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"{name}.sock"
+        server = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-m", module, "--fork-server", str(path), "--log-level", "ERROR"],
+            env={**os.environ, **environment},
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + STARTUP_TIMEOUT
+            while not path.exists():
+                if server.poll() is not None or time.monotonic() > deadline:
+                    msg = f"The fork server of {name} did not start."
+                    raise RuntimeError(msg)
+                time.sleep(0.05)
+            if request(path, data) != expected:
+                msg = f"The fork server of {name} answered differently from the one-shot command."
+                raise RuntimeError(msg)
+            return {
+                "one_shot": measure(lambda: run_command(module, environment, data), repeat),
+                "fork_server": measure(lambda: request(path, data), repeat),
+                "fork_server_client": measure(lambda: run_client(path, data), repeat),
+            }
+        finally:
+            server.terminate()
+            server.wait()
+
+
+@click.command(help="Compare the startup of the one-shot commands and the fork server.")
+@click.option("--output", type=click.Path(dir_okay=False), default=None, help="JSON file of the results.")
+@click.option("--repeat", type=click.IntRange(min=1), default=10, help="Number of timed answers of each way.")
+def main(output: str | None, repeat: int) -> None:
+    """Compare the startup."""
+    results = {}
+    for name in COMMANDS:
+        results[name] = compare_startup(name, repeat)
+        speedup = results[name]["one_shot"]["median_seconds"] / results[name]["fork_server"]["median_seconds"]
+        click.echo(
+            f"{name}: one-shot {results[name]['one_shot']['median_seconds'] * 1e3:.1f} ms, "
+            f"fork server {results[name]['fork_server']['median_seconds'] * 1e3:.1f} ms ({speedup:.0f}x), "
+            f"with the client {results[name]['fork_server_client']['median_seconds'] * 1e3:.1f} ms",
+            err=True,
+        )
+    text = json.dumps(results, indent=2) + "\n"
+    if output is None:
+        sys.stdout.write(text)
+    else:
+        Path(output).write_text(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Test for the micro-benchmark suite."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from tests.benchmarks import bench
+from tests.benchmarks.bench import BASELINE_PATH, cases, compare_results, main
+
+
+def test_cases() -> None:
+    """Test the grid skips the large cases and the dimensions rejected by the validators."""
+    grid = cases(max_elements=1000)
+    if any(rows * optima * dim > 1000 for _, _, dim, rows, optima in grid):  # noqa: PLR2004
+        msg = "Expected no case larger than the limit"
+        raise ValueError(msg)
+    if ("rosenbrock", "evaluate", 1, 1, 1) in grid or ("sphere", "evaluate", 1, 1, 1) not in grid:
+        msg = "Expected the rosenbrock function to start at two dimensions"
+        raise ValueError(msg)
+
+
+def test_compare_results() -> None:
+    """Test the slowdowns and the memory growths beyond the tolerances are flagged."""
+    baseline = {"results": {"a": {"seconds": 1.0, "peak_bytes": 100}, "b": {"seconds": 1.0, "peak_bytes": 100}}}
+    current = {
+        "results": {
+            "a": {"seconds": 1.2, "peak_bytes": 105},
+            "b": {"seconds": 1.5, "peak_bytes": 200},
+            "c": {"seconds": 9.0, "peak_bytes": 900},
+        },
+    }
+    regressions = compare_results(baseline, current, time_tolerance=0.25, memory_tolerance=0.1)
+    if len(regressions) != 2 or not all(regression.startswith("b: ") for regression in regressions):  # noqa: PLR2004
+        msg = f"Expected the time and the memory of b to regress, but got {regressions}"
+        raise ValueError(msg)
+
+
+def test_run_and_compare(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the results of a run are written as JSON and compared with themselves and the baseline."""
+    monkeypatch.setattr(bench, "MIN_ROUND_SECONDS", 0.001)
+    output = tmp_path / "current.json"
+    result = CliRunner().invoke(main, ["run", "--output", str(output), "--problem", "sphere", "--max-elements", "10"])
+    if result.exit_code != 0:
+        msg = f"Expected the run to succeed, but got {result.output}"
+        raise ValueError(msg)
+    report = json.loads(output.read_text())
+    if set(report["results"]) != {
+        "sphere/evaluate/d=1/n=1/m=1",
+        "sphere/evaluate_batch/d=1/n=1/m=1",
+        "sphere/evaluate/d=10/n=1/m=1",
+        "sphere/evaluate_batch/d=10/n=1/m=1",
+        "sphere/evaluate/d=1/n=1/m=10",
+        "sphere/evaluate_batch/d=1/n=1/m=10",
+        "sphere/evaluate_min_batch/d=1/n=1/m=10",
+    }:
+        msg = f"Expected the sphere cases up to 10 elements, but got {sorted(report['results'])}"
+        raise ValueError(msg)
+
+    result = CliRunner().invoke(main, ["compare", str(output), "--baseline", str(output)])
+    if result.exit_code != 0 or "No regression" not in result.output:
+        msg = f"Expected no regression against the same results, but got {result.output}"
+        raise ValueError(msg)
+    if not set(report["results"]) <= set(json.loads(BASELINE_PATH.read_text())["results"]):
+        msg = "Expected the cases to be in the committed baseline"
+        raise ValueError(msg)
@@ -0,0 +1,73 @@
+"""Test for the fork server."""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from opthub_common.forkserver import request
+
+# Seconds to wait for the server to listen
+STARTUP_TIMEOUT = 30.0
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[tuple[subprocess.Popen[bytes], Path]]:
+    """Run the sphere function as a fork server."""
+    path = tmp_path / "sphere.sock"
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "opthub_problems.sphere.main", "--fork-server", str(path), "--log-level", "ERROR"],
+        env={**os.environ, "SPHERE_OPTIMA": "[[0, 0], [1, 1]]"},
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while not path.exists():
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            msg = "The fork server did not start"
+            raise RuntimeError(msg)
+        time.sleep(0.05)
+    yield process, path
+    process.kill()
+    process.wait()
+
+
+def test_request(server: tuple[subprocess.Popen[bytes], Path]) -> None:
+    """Test each connection is answered like a run of the command."""
+    _, path = server
+    response = json.loads(request(path, b"[1, 2]\n", timeout=10))
+    if response != {"objective": [5.0, 1.0]}:
+        msg = f"Expected the objective values, but got {response}"
+        raise ValueError(msg)
+
+    response = json.loads(request(path, b"[1, 2, 3]\n", timeout=10))
+    if response["objective"] is not None or "too long" not in response["error"]:
+        msg = f"Expected a validation error, but got {response}"
+        raise ValueError(msg)
+
+
+def test_concurrent_requests(server: tuple[subprocess.Popen[bytes], Path]) -> None:
+    """Test concurrent connections are answered by separate children."""
+    _, path = server
+    with ThreadPoolExecutor(8) as executor:
+        responses = list(executor.map(lambda x: request(path, f"[{x}, 0]\n".encode(), timeout=10), range(16)))
+    for x, response in enumerate(responses):
+        if json.loads(response) != {"objective": [float(x**2), float((x - 1) ** 2 + 1)]}:
+            msg = f"Expected the objective values of [{x}, 0], but got {response!r}"
+            raise ValueError(msg)
+
+
+def test_stop(server: tuple[subprocess.Popen[bytes], Path]) -> None:
+    """Test the server removes its socket on SIGTERM."""
+    process, path = server
+    process.send_signal(signal.SIGTERM)
+    if process.wait(timeout=10) != 0 or path.exists():
+        msg = "Expected the server to stop and remove its socket"
+        raise ValueError(msg)
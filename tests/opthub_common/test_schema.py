@@ -0,0 +1,63 @@
+"""Test for the cached schema validators."""
+
+import json
+
+import jsonschema
+import numpy as np
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from opthub_common.schema import compile_schema, validate_finite, validate_schema
+from opthub_problems.sphere.validator import OPTIMA_SCHEMA, validate_optima, validate_variable
+
+
+def test_compile_once() -> None:
+    """Test a schema is compiled once."""
+    if compile_schema(OPTIMA_SCHEMA) is not compile_schema(OPTIMA_SCHEMA):
+        msg = "Expected the validator of the schema to be cached"
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("instance", [[[1, 2]], [], [1.0], [[1, "B"]], [[[1, 2]]], [[True]], {"x": 1}])
+def test_same_errors(instance: object) -> None:
+    """Test the errors are the same as jsonschema.validate."""
+    try:
+        jsonschema.validate(instance=instance, schema=json.loads(OPTIMA_SCHEMA))
+    except ValidationError as e:
+        with pytest.raises(ValidationError) as error:
+            validate_schema(instance, OPTIMA_SCHEMA)
+        if error.value.message != e.message or list(error.value.path) != list(e.path):
+            msg = f"Expected the error {e.message}, but got {error.value.message}"
+            raise ValueError(msg) from None
+    else:
+        validate_schema(instance, OPTIMA_SCHEMA)
+
+
+def test_validate_finite() -> None:
+    """Test the non-finite values are rejected."""
+    validate_finite(np.array([1.0, -2.0]), "variable")
+    for value in (np.nan, np.inf, -np.inf):
+        with pytest.raises(ValidationError, match="index 1"):
+            validate_finite(np.array([1.0, value]), "variable")
+
+
+def test_array_fast_path() -> None:
+    """Test the arrays are validated like the decoded JSON, without jsonschema."""
+    for variable in (np.array([1.0, 2.0]), np.array([1, 2], dtype=np.int32)):
+        if np.asarray(validate_variable(variable, 2)).tolist() != [1.0, 2.0]:
+            msg = f"Expected the validated array of {variable}"
+            raise ValueError(msg)
+    for variable in (np.array([1.0, np.nan]), np.array([True, False]), np.array([1.0, 2.0, 3.0])):
+        with pytest.raises(ValidationError):
+            validate_variable(variable, 2)
+    with pytest.raises(ValidationError):
+        validate_variable([1.0, float("inf")], 2)
+
+    if validate_optima(np.array([[1, 2], [3, 4]])).tolist() != [[1.0, 2.0], [3.0, 4.0]]:
+        msg = "Expected the validated optima"
+        raise ValueError(msg)
+    for optima in (np.array([[1.0, np.nan]]), np.array([1.0, 2.0]), np.array([["A"]])):
+        with pytest.raises(ValidationError):
+            validate_optima(optima)
+    with pytest.raises(ValidationError):
+        validate_optima([[1.0, float("nan")]])
@@ -1,6 +1,8 @@
 """Test for elliptic evaluator."""
 
-from opthub_problems.elliptic.evaluator import evaluate
+import numpy as np
+
+from opthub_problems.elliptic.evaluator import evaluate, evaluate_batch
 
 EPS = 1e-6
 
@@ -48,3 +50,18 @@ def test_multi_objective_2d() -> None:
     if len(objective) != dim or abs(objective[0] - 2250000.25) > EPS or abs(objective[1] - 250000.25) > EPS:
         msg = f"Expected [2250000.25, 250000.25], but got {result['objective']}"
         raise ValueError(msg)
+
+
+def test_batch_matches_evaluate() -> None:
+    """Test batch evaluation is identical to the evaluation of each decision variable."""
+    rng = np.random.default_rng(0)
+    optima = rng.uniform(-5, 5, (3, 10)).tolist()
+    variables = rng.uniform(-5, 5, (20, 10))
+    result = evaluate_batch(variables, optima)
+    if result.shape != (20, 3):
+        msg = f"Expected shape (20, 3), but got {result.shape}"
+        raise ValueError(msg)
+    expected = [evaluate(var, optima)["objective"] for var in variables.tolist()]
+    if not np.array_equal(result, expected):
+        msg = f"Expected {expected}, but got {result.tolist()}"
+        raise ValueError(msg)
@@ -1,6 +1,8 @@
 """Test for elliptic evaluator."""
 
-from opthub_problems.rosenbrock.evaluator import evaluate
+import numpy as np
+
+from opthub_problems.rosenbrock.evaluator import evaluate, evaluate_batch
 
 EPS = 1e-6
 
@@ -34,3 +36,18 @@ def test_single_objective_2d() -> None:
     if abs(objective - 0) > EPS:
         msg = f"Expected 0, but got {objective}"
         raise ValueError(msg)
+
+
+def test_batch_matches_evaluate() -> None:
+    """Test batch evaluation is identical to the evaluation of each decision variable."""
+    rng = np.random.default_rng(0)
+    optima = rng.uniform(-5, 5, (3, 10)).tolist()
+    variables = rng.uniform(-5, 5, (20, 10))
+    result = evaluate_batch(variables, optima)
+    if result.shape != (20, 3):
+        msg = f"Expected shape (20, 3), but got {result.shape}"
+        raise ValueError(msg)
+    expected = [evaluate(var, optima)["objective"] for var in variables.tolist()]
+    if not np.array_equal(result, expected):
+        msg = f"Expected {expected}, but got {result.tolist()}"
+        raise ValueError(msg)
@@ -2,10 +2,17 @@
 
 import json
 
+import numpy as np
 import pytest
 from jsonschema.exceptions import ValidationError
 
-from opthub_problems.sphere.validator import validate_optima, validate_variable
+from opthub_problems.sphere.validator import (
+    parse_optima,
+    parse_variable,
+    validate_optima,
+    validate_variable,
+    validate_variable_array,
+)
 
 
 def test_optima_valid_1d() -> None:
@@ -128,3 +135,84 @@ def test_variable_invalid_not_matched_dimension() -> None:
     variable = json.loads(variable_json)
     with pytest.raises(ValidationError):
         validate_variable(variable, 2)
+
+
+def test_variable_array_valid() -> None:
+    """Test for the valid variable arrays."""
+    validate_variable_array(np.array([1.0, 2]), 2)
+    validate_variable_array(np.array(1.0), 1)
+    validate_variable_array(np.array([1]), 1)
+
+
+def test_variable_array_invalid() -> None:
+    """Test for the invalid variable arrays."""
+    with pytest.raises(ValidationError):
+        validate_variable_array(np.array([1.0, 2.0, 3.0]), 2)
+    with pytest.raises(ValidationError):
+        validate_variable_array(np.array([[1.0, 2.0]]), 2)
+    with pytest.raises(ValidationError):
+        validate_variable_array(np.array([True, False]), 2)
+    with pytest.raises(ValidationError):
+        validate_variable_array(np.array(["A", "B"]), 2)
+
+
+@pytest.mark.parametrize(
+    ("line", "dim"),
+    [
+        ("[1.0, 2]", 2),
+        ("[1, 2, 3]", 3),
+        ("1.5", 1),
+        ("[1]", 1),
+        ("[1.0, 2.0, 3.0]", 2),
+        ("[[1, 2]]", 2),
+        ('["A", 1]', 2),
+        ("[true, 1]", 2),
+        ("[]", 1),
+        ("[1, 2", 2),
+    ],
+)
+def test_parse_variable(line: str, dim: int) -> None:
+    """Test the variables are parsed like they are decoded and validated, with the same errors."""
+    try:
+        expected = np.asarray(validate_variable(json.loads(line), dim), dtype=np.float64).reshape(dim)
+    except (ValueError, ValidationError) as e:
+        with pytest.raises(type(e)) as error:
+            parse_variable(line, dim)
+        if str(error.value) != str(e):
+            msg = f"Expected the error {e}, but got {error.value}"
+            raise ValueError(msg) from None
+    else:
+        result = parse_variable(line, dim)
+        if not np.array_equal(result, expected):
+            msg = f"Expected {expected}, but got {result}"
+            raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    "optima",
+    [
+        "[[1.0, 2]]",
+        "[[1, 2], [3, 4]]",
+        "[[1]]",
+        "[]",
+        "[1.0]",
+        "[[1, true]]",
+        '[[1, "B"]]',
+        "[[1.0, 2.0], [3.0, 4.0, 5.0]]",
+    ],
+)
+def test_parse_optima(optima: str) -> None:
+    """Test the optima are parsed like they are decoded and validated, with the same errors."""
+    try:
+        expected = np.asarray(validate_optima(json.loads(optima)), dtype=np.float64)
+    except ValidationError as e:
+        with pytest.raises(ValidationError) as error:
+            parse_optima(optima)
+        if str(error.value) != str(e):
+            msg = f"Expected the error {e}, but got {error.value}"
+            raise ValueError(msg) from None
+    else:
+        result = np.asarray(parse_optima(optima))
+        if not np.array_equal(result, expected):
+            msg = f"Expected {expected}, but got {result}"
+            raise ValueError(msg)
@@ -0,0 +1,67 @@
+"""Test for the closed-form gradients and Hessian-vector products against finite differences."""
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.rosenbrock.evaluator import hvp_batch as rosenbrock_hvp_batch
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.sphere.evaluator import gradient_batch as sphere_gradient_batch
+
+PROBLEM_CLASSES = [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem]
+
+# Step of the central differences
+STEP = 1e-6
+
+
+@pytest.mark.parametrize("problem_class", PROBLEM_CLASSES)
+def test_gradient_batch(problem_class: Any) -> None:  # noqa: ANN401
+    """Test the gradients match the central differences of the objective values."""
+    rng = np.random.default_rng(0)
+    problem = problem_class(rng.uniform(-2, 2, (2, 5)))
+    population = rng.uniform(-2, 2, (3, 5))
+
+    gradients = problem.gradient_batch(population)
+
+    for i in range(5):
+        step = np.zeros(5)
+        step[i] = STEP
+        expected = (problem.evaluate_batch(population + step) - problem.evaluate_batch(population - step)) / (2 * STEP)
+        if not np.allclose(gradients[:, :, i], expected, rtol=1e-5, atol=1e-3):
+            msg = f"Expected the derivative {expected} along {i}, but got {gradients[:, :, i]}"
+            raise ValueError(msg)
+
+
+@pytest.mark.parametrize("problem_class", PROBLEM_CLASSES)
+def test_hvp_batch(problem_class: Any) -> None:  # noqa: ANN401
+    """Test the Hessian-vector products match the central differences of the gradients."""
+    rng = np.random.default_rng(1)
+    problem = problem_class(rng.uniform(-2, 2, (2, 5)))
+    population = rng.uniform(-2, 2, (3, 5))
+    vectors = rng.normal(size=(3, 5))
+
+    products = problem.hvp_batch(population, vectors)
+
+    expected = (
+        problem.gradient_batch(population + STEP * vectors) - problem.gradient_batch(population - STEP * vectors)
+    ) / (2 * STEP)
+    if products.shape != (3, 2, 5) or not np.allclose(products, expected, rtol=1e-5, atol=1e-3):
+        msg = f"Expected the Hessian-vector products {expected}, but got {products}"
+        raise ValueError(msg)
+
+
+def test_module_functions() -> None:
+    """Test the module functions at the optima and their validation."""
+    if not np.array_equal(sphere_gradient_batch([[1.0, 2.0]], [[1, 2], [0, 0]]), [[[0.0, 0.0], [2.0, 4.0]]]):
+        msg = "Expected the gradients of the sphere function"
+        raise ValueError(msg)
+    # The Hessian of the rosenbrock function at its optimum [1, 1] is [[802, -400], [-400, 200]]
+    if not np.array_equal(rosenbrock_hvp_batch([[1.0, 1.0]], [[1.0, 0.0]], [[1, 1]]), [[[802.0, -400.0]]]):
+        msg = "Expected the Hessian-vector product of the rosenbrock function"
+        raise ValueError(msg)
+    with pytest.raises(ValueError, match="Expected vectors"):
+        rosenbrock_hvp_batch([[1.0, 1.0]], [[1.0, 0.0], [0.0, 1.0]], [[1, 1]])
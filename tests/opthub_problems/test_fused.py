@@ -0,0 +1,61 @@
+"""Test for the fused evaluation kernels against the plain expressions of the objective functions."""
+
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.problem import COLUMN_BLOCK, PRECISIONS
+
+
+def sphere(var_arr: npt.NDArray[Any], problem: Any) -> npt.NDArray[Any]:  # noqa: ANN401
+    """Calculate the sphere function by the plain expression."""
+    return np.sum((var_arr[:, np.newaxis, :] - problem.opt) ** 2, axis=2)
+
+
+def elliptic(var_arr: npt.NDArray[Any], problem: Any) -> npt.NDArray[Any]:  # noqa: ANN401
+    """Calculate the elliptic function by the plain expression."""
+    return np.sum(problem.weights * (var_arr[:, np.newaxis, :] - problem.opt) ** 2, axis=2)
+
+
+def rastrigin(var_arr: npt.NDArray[Any], problem: Any) -> npt.NDArray[Any]:  # noqa: ANN401
+    """Calculate the Rastrigin function by the plain expression."""
+    diff_arr = var_arr[:, np.newaxis, :] - problem.opt
+    return np.sum(diff_arr**2 - 10 * np.cos(2 * np.pi * diff_arr) + 10, axis=2)
+
+
+def rosenbrock(var_arr: npt.NDArray[Any], problem: Any) -> npt.NDArray[Any]:  # noqa: ANN401
+    """Calculate the Rosenbrock function by the plain expression."""
+    var_arr = var_arr[:, np.newaxis, :] - problem.diff
+    return np.sum(100 * (var_arr[:, :, :-1] ** 2 - var_arr[:, :, 1:]) ** 2 + (var_arr[:, :, :-1] - 1) ** 2, axis=2)
+
+
+REFERENCES = [
+    (SphereProblem, sphere),
+    (EllipticProblem, elliptic),
+    (RastriginProblem, rastrigin),
+    (RosenbrockProblem, rosenbrock),
+]
+
+
+@pytest.mark.parametrize("precision", PRECISIONS)
+# The decision dimensions above COLUMN_BLOCK are summed block by block
+@pytest.mark.parametrize("dim", [2, 7, 1000, COLUMN_BLOCK + 1, 12345])
+@pytest.mark.parametrize(("problem_class", "reference"), REFERENCES)
+def test_fused_kernel(problem_class: Any, reference: Any, dim: int, precision: str) -> None:  # noqa: ANN401
+    """Test the fused kernels give bit-identical objective values to the plain expressions."""
+    rng = np.random.default_rng(dim)
+    problem = problem_class(rng.uniform(-5, 5, (3, dim)), block_size=10**9, precision=precision)
+    population = rng.uniform(-5, 5, (50, dim)).astype(problem.dtype)
+
+    expected = reference(population, problem).astype(np.float64)
+    obj_arr = problem.evaluate_batch(population)
+
+    if not np.array_equal(obj_arr, expected):
+        msg = f"Expected the objective values {expected}, but got {obj_arr}"
+        raise ValueError(msg)
@@ -0,0 +1,83 @@
+"""Test for the analysis of the fitness landscapes of the problems."""
+
+import json
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from opthub_problems import landscape
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+
+
+@pytest.mark.parametrize("sampler", landscape.SAMPLERS)
+def test_sample_chunks(sampler: str) -> None:
+    """Test the samples are drawn in chunks within the bounds."""
+    samples = list(landscape.sample_chunks(sampler, 3, 100, 32, (-2.0, 3.0), seed=0))
+    if [len(chunk) for chunk in samples] != [32, 32, 32, 4]:
+        msg = f"The chunks must have 32 samples but the last one, but got {[len(chunk) for chunk in samples]}."
+        raise ValueError(msg)
+    points = np.concatenate(samples)
+    if points.shape != (100, 3) or points.min() < -2.0 or points.max() > 3.0:  # noqa: PLR2004
+        msg = f"The samples must be of shape (100, 3) within the bounds, but got {points}."
+        raise ValueError(msg)
+
+
+def test_sample_chunks_walk_continuous() -> None:
+    """Test the random walk carries its position across the chunks."""
+    points = np.concatenate(list(landscape.sample_chunks("walk", 2, 1000, 10, (0.0, 1.0), step=0.001, seed=0)))
+    if np.abs(np.diff(points, axis=0)).max() > 0.01:  # noqa: PLR2004
+        msg = "The steps of the walk must be small, including between the chunks."
+        raise ValueError(msg)
+
+
+def test_local_optimum_mask() -> None:
+    """Test the local optima are the samples not worse than their neighbors."""
+    problem = RastriginProblem([[0.0, 0.0]])
+    points = np.array([[0.0, 0.0], [1.0, 1.0], [0.5, 0.0], [0.0, 0.3]])
+    values = problem.evaluate_batch(points).min(axis=1)
+    mask = landscape.local_optimum_mask(problem, points, values, 0.01)
+    if mask.tolist() != [True, False, False, False]:
+        msg = f"Only the global optimum must be a local optimum, but got {mask}."
+        raise ValueError(msg)
+
+
+def test_analyze_chunk_size() -> None:
+    """Test the metrics do not depend on the chunk size."""
+    problem = RastriginProblem([[0.0, 0.0, 0.0]])
+    small, large = (
+        landscape.analyze(problem, "walk", 2000, chunk_size=chunk_size, radius=0.05, seed=0)
+        for chunk_size in (2000, 64)
+    )
+    for key in ("fitness_distance_correlation", "local_optima_density", "autocorrelation", "information_content"):
+        if not np.allclose(small[key], large[key], rtol=1e-9):
+            msg = f"The {key} must not depend on the chunk size, but got {small[key]} and {large[key]}."
+            raise ValueError(msg)
+
+
+def test_analyze_sphere() -> None:
+    """Test the sphere function has a strong fitness-distance correlation and a single local optimum."""
+    metrics = landscape.analyze(SphereProblem([[0.0, 0.0]]), "sobol", 1024, seed=0)
+    if metrics["fitness_distance_correlation"] < 0.9 or metrics["local_optima_density"] > 0.01:  # noqa: PLR2004
+        msg = f"The sphere function must be correlated to the distance and have few local optima, but got {metrics}."
+        raise ValueError(msg)
+    if metrics["autocorrelation"] is not None:
+        msg = "The autocorrelation must only be estimated from a random walk."
+        raise ValueError(msg)
+
+
+def test_main() -> None:
+    """Test the command prints the metrics as JSON."""
+    args = ["--problem", "rosenbrock", "--optima", "[[1, 1, 1]]", "--sampler", "walk", "--samples", "500"]
+    result = CliRunner().invoke(landscape.main, [*args, "--chunk-size", "100", "--radius", "0", "--seed", "1"])
+    if result.exit_code != 0:
+        msg = f"The command must succeed, but got {result.output}."
+        raise ValueError(msg)
+    metrics = json.loads(result.output)
+    if metrics["samples"] != 500 or metrics["local_optima_density"] is not None:  # noqa: PLR2004
+        msg = f"The metrics must cover 500 samples without local optima, but got {metrics}."
+        raise ValueError(msg)
+    if len(metrics["autocorrelation"]) != 10:  # noqa: PLR2004
+        msg = f"The autocorrelation must be given up to lag 10, but got {metrics['autocorrelation']}."
+        raise ValueError(msg)
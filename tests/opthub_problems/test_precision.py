@@ -0,0 +1,96 @@
+"""Test for the float32 precision of the evaluators against float64.
+
+The relative errors are measured for each function across dimensions and checked
+against the bounds documented in `opthub_problems.utils.problem.Problem`.
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.problem import Problem
+
+UNIT_ROUNDOFF = 2.0**-24
+
+DIMENSIONS = [2, 10, 100, 1000, 10000, 100000]
+
+# Number of (row, dimension) elements evaluated for each dimension
+SAMPLE_SIZE = 200000
+
+
+def cancellation(var_arr: npt.NDArray[np.float64], opt_arr: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Calculate kappa = max_i (|x_i| + |o_i|) / |x_i - o_i| for each row and optimum."""
+    diff_arr = np.abs(var_arr[:, np.newaxis, :] - opt_arr)
+    with np.errstate(divide="ignore"):
+        ratio = (np.abs(var_arr[:, np.newaxis, :]) + np.abs(opt_arr)) / diff_arr
+    return np.asarray(np.max(ratio, axis=2))
+
+
+def scale(problem: Problem, var_arr: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Calculate the value the error is relative to."""
+    diff_arr = var_arr[:, np.newaxis, :] - problem.opt
+    if isinstance(problem, RastriginProblem):
+        terms = diff_arr**2 + 10 * np.abs(np.cos(2 * np.pi * diff_arr)) + 10
+        return np.asarray(np.sum(terms, axis=2))
+    if isinstance(problem, RosenbrockProblem):
+        shifted = var_arr[:, np.newaxis, :] - problem.diff
+        terms = 100 * (shifted[:, :, :-1] ** 2 + np.abs(shifted[:, :, 1:])) ** 2 + (np.abs(shifted[:, :, :-1]) + 1) ** 2
+        return np.asarray(np.sum(terms, axis=2))
+    return problem.evaluate_batch(var_arr)
+
+
+def bound(problem: Problem, var_arr: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Calculate the documented bound of the relative error."""
+    kappa = cancellation(var_arr, problem.opt)
+    log_dim = math.log2(problem.dim)
+    if isinstance(problem, SphereProblem):
+        factor = 2 * kappa + log_dim + 3
+    elif isinstance(problem, EllipticProblem):
+        factor = 2 * kappa + log_dim + 4
+    elif isinstance(problem, RastriginProblem):
+        max_diff = np.max(np.abs(var_arr[:, np.newaxis, :] - problem.opt), axis=2)
+        factor = 2 * kappa + log_dim + 3 + 4 * np.pi * max_diff
+    else:
+        factor = 4 * kappa + log_dim + 5
+    return np.asarray(factor * UNIT_ROUNDOFF)
+
+
+@pytest.mark.parametrize("problem_class", [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem])
+@pytest.mark.parametrize("dim", DIMENSIONS)
+def test_float32_error_within_bound(problem_class: Any, dim: int) -> None:  # noqa: ANN401
+    """Test the float32 evaluation is within the documented bound of the float64 one."""
+    rng = np.random.default_rng(dim)
+    optima = rng.uniform(-1, 1, (2, dim))
+    # The bounds hold for inputs representable in float32
+    optima = optima.astype(np.float32).astype(np.float64)
+    population = rng.uniform(-5, 5, (max(1, SAMPLE_SIZE // dim), dim)).astype(np.float32).astype(np.float64)
+
+    problem = problem_class(optima)
+    expected = problem.evaluate_batch(population)
+    result = problem_class(optima, precision="float32").evaluate_batch(population)
+
+    if result.dtype != np.float64:
+        msg = f"Expected float64 objective values, but got {result.dtype}"
+        raise TypeError(msg)
+    relative_error = np.abs(result - expected) / scale(problem, population)
+    excess = relative_error / bound(problem, population)
+    if np.max(excess) > 1:
+        msg = f"Expected the relative error within the bound, but got {np.max(excess)} times the bound for d={dim}"
+        raise ValueError(msg)
+
+
+def test_float32_kernel() -> None:
+    """Test the float32 problem keeps its constants in single precision."""
+    problem = EllipticProblem([[1.0, 2.0, 3.0]], precision="float32")
+    if problem.opt.dtype != np.float32 or problem.weights.dtype != np.float32:
+        msg = "Expected float32 constants"
+        raise TypeError(msg)
+    with pytest.raises(ValueError, match="precision"):
+        SphereProblem([[1.0]], precision="float16")
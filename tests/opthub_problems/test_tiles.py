@@ -0,0 +1,114 @@
+"""Test for the pyramids of tiles of the landscapes of the problems."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from opthub_problems import tiles
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+
+
+def test_tile_points() -> None:
+    """Test the children of a tile cover its pixels at twice the resolution with the other dimensions fixed."""
+    pyramid = tiles.TilePyramid(
+        RosenbrockProblem([[1.0, 1.0, 1.0]]),
+        Path(),
+        axes=(2, 0),
+        bounds=(-2.0, 2.0),
+        tile_size=4,
+        value_range=(0.0, 1.0),
+    )
+    points = pyramid.tile_points(1, 1, 0)
+    if points.shape != (16, 3) or not np.all(points[:, 1] == 1.0):
+        msg = f"The points must have shape (16, 3) with the origin on axis 1, but got {points}."
+        raise ValueError(msg)
+    # The tile of zoom level 1 at column 1 and row 0 covers [0, 2] horizontally and [0, 2] vertically from the top
+    horizontal, vertical = points[:4, 2], points[::4, 0]
+    if not np.allclose(horizontal, [0.25, 0.75, 1.25, 1.75]) or not np.allclose(vertical, [1.75, 1.25, 0.75, 0.25]):
+        msg = f"The points must be the centers of the pixels of the tile, but got {points}."
+        raise ValueError(msg)
+
+
+def test_evaluate_tile() -> None:
+    """Test the values of a tile are the best objective values over the optima at its pixels."""
+    problem = RastriginProblem([[0.0, 0.0], [1.0, -1.0]])
+    pyramid = tiles.TilePyramid(problem, Path(), tile_size=3, value_range=(0.0, 1.0))
+    values = pyramid.evaluate_tile(2, 1, 2)
+    expected = problem.evaluate_batch(pyramid.tile_points(2, 1, 2)).min(axis=1).reshape(3, 3)
+    if not np.array_equal(values, expected):
+        msg = f"The values of the tile must be {expected}, but got {values}."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    ("axes", "origin"),
+    [
+        ((0, 0), None),
+        ((0, 2), None),
+        ((0, 1), [0.0, 0.0, 0.0]),
+    ],
+)
+def test_invalid_slice(axes: tuple[int, int], origin: list[float] | None) -> None:
+    """Test the slice must match the decision dimensions of the problem."""
+    with pytest.raises(ValueError, match="must"):
+        tiles.TilePyramid(RastriginProblem([[0.0, 0.0]]), Path(), axes=axes, origin=origin)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_pyramid_incremental(tmp_path: Path, workers: int) -> None:
+    """Test the tiles are rendered once, and again only when their inputs change."""
+    pyramid = tiles.TilePyramid(RastriginProblem([[0.0, 0.0]]), tmp_path, tile_size=8)
+    rendered = tiles.render_pyramid(pyramid, 2, workers)
+    if len(rendered) != 1 + 4 + 16:
+        msg = f"All the 21 tiles must be rendered, but got {len(rendered)}."
+        raise ValueError(msg)
+    for zoom, x, y in rendered:
+        path = pyramid.tile_path(zoom, x, y)
+        if not path.with_suffix(".png").exists() or np.load(path.with_suffix(".npy")).shape != (8, 8):
+            msg = f"The tile {zoom}/{x}/{y} must be written."
+            raise ValueError(msg)
+
+    if tiles.render_pyramid(pyramid, 2, workers):
+        msg = "The unchanged tiles must not be rendered again."
+        raise ValueError(msg)
+
+
+def test_render_pyramid_changed(tmp_path: Path) -> None:
+    """Test the missing tiles, the new zoom levels and the tiles with changed inputs are rendered again."""
+    pyramid = tiles.TilePyramid(RastriginProblem([[0.0, 0.0]]), tmp_path, tile_size=8)
+    tiles.render_pyramid(pyramid, 1, 1)
+    pyramid.tile_path(1, 0, 1).with_suffix(".npy").unlink()
+    rendered = tiles.render_pyramid(pyramid, 2, 1)
+    if sorted(rendered) != [(1, 0, 1)] + [(2, x, y) for x in range(4) for y in range(4)]:
+        msg = f"The missing tile and the new zoom level must be rendered, but got {rendered}."
+        raise ValueError(msg)
+
+    pyramid.colormap = "viridis"
+    if len(tiles.render_pyramid(pyramid, 2, 1)) != 21:  # noqa: PLR2004
+        msg = "All the tiles must be rendered again after the colormap changes."
+        raise ValueError(msg)
+    manifest = json.loads((tmp_path / tiles.MANIFEST_NAME).read_text())
+    if manifest["colormap"] != "viridis" or len(manifest["tiles"]) != 21:  # noqa: PLR2004
+        msg = f"The manifest must describe the pyramid and its 21 tiles, but got {manifest}."
+        raise ValueError(msg)
+
+
+def test_main(tmp_path: Path) -> None:
+    """Test the command renders the tiles of a slice of a problem."""
+    args = ["--problem", "rosenbrock", "--optima", "[[1, 1, 1]]", "--axes", "1", "2", "--max-zoom", "1"]
+    args += ["--tile-size", "4", "--workers", "1", "--output-dir", str(tmp_path)]
+    result = CliRunner().invoke(tiles.main, args)
+    if result.exit_code != 0:
+        msg = f"The command must succeed, but got {result.output}."
+        raise ValueError(msg)
+    if len(list(tmp_path.glob("*/*/*.png"))) != 5:  # noqa: PLR2004
+        msg = "The 5 tiles must be rendered."
+        raise ValueError(msg)
+    result = CliRunner().invoke(tiles.main, [*args, "--origin", "[1, 1]"])
+    if result.exit_code == 0:
+        msg = "The command must fail for an origin of the wrong dimensions."
+        raise ValueError(msg)
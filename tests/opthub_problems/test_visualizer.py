@@ -0,0 +1,101 @@
+"""Test for the visualizer of the landscapes of the problems."""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from opthub_problems import visualizer
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+
+
+def test_compute_surface() -> None:
+    """Test the surface is the best objective value over the optima at each point of the mesh."""
+    problem = RosenbrockProblem([[1.0, 1.0], [-1.0, 2.0]])
+    x, y, z = visualizer.compute_surface(problem, (-2.0, 2.0), 7)
+    if x.shape != (7, 7) or y.shape != (7, 7) or z.shape != (7, 7):
+        msg = f"The surface must have shape (7, 7), but got {x.shape}, {y.shape} and {z.shape}."
+        raise ValueError(msg)
+    for i, j in np.ndindex(z.shape):
+        expected = problem.evaluate_array([float(x[i, j]), float(y[i, j])]).min()
+        if not np.isclose(z[i, j], expected):
+            msg = f"The surface at {(i, j)} must be {expected}, but got {z[i, j]}."
+            raise ValueError(msg)
+
+
+def test_load_surface_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the surface is evaluated once and then loaded from the cache."""
+    problem = SphereProblem([[0.0, 0.0]])
+    expected = visualizer.load_surface(problem, (-1.0, 1.0), 5, tmp_path)
+    cached = list(tmp_path.glob("*.npz"))
+    if len(cached) != 1:
+        msg = f"The surface must be cached in a single file, but got {cached}."
+        raise ValueError(msg)
+
+    def fail(*_: Any) -> None:  # noqa: ANN401
+        msg = "The cached surface must not be evaluated again."
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(visualizer, "compute_surface", fail)
+    surface = visualizer.load_surface(problem, (-1.0, 1.0), 5, tmp_path)
+    if not all(np.array_equal(a, b) for a, b in zip(surface, expected, strict=True)):
+        msg = "The cached surface must be equal to the evaluated one."
+        raise ValueError(msg)
+
+
+def test_surface_key() -> None:
+    """Test the key of the surface depends on the optima, the bounds and the resolution."""
+    problem = SphereProblem([[0.0, 0.0]])
+    keys = {
+        visualizer.surface_key(problem, (-5.0, 5.0), 10),
+        visualizer.surface_key(SphereProblem([[1.0, 0.0]]), (-5.0, 5.0), 10),
+        visualizer.surface_key(problem, (-4.0, 5.0), 10),
+        visualizer.surface_key(problem, (-5.0, 5.0), 11),
+    }
+    if len(keys) != 4:  # noqa: PLR2004
+        msg = f"The keys must differ, but got {keys}."
+        raise ValueError(msg)
+
+
+def test_main(tmp_path: Path) -> None:
+    """Test the command renders a figure of each problem."""
+    result = CliRunner().invoke(
+        visualizer.main,
+        [
+            "--problem",
+            "sphere",
+            "--problem",
+            "elliptic",
+            "--resolution",
+            "10",
+            "--dpi",
+            "10",
+            "--format",
+            "png",
+            "--output-dir",
+            str(tmp_path / "figures"),
+            "--cache-dir",
+            str(tmp_path / "cache"),
+        ],
+    )
+    if result.exit_code != 0:
+        msg = f"The command must succeed, but got {result.output}."
+        raise ValueError(msg)
+    for name in ("sphere", "elliptic"):
+        if not (tmp_path / "figures" / f"{name}.png").exists():
+            msg = f"The figure of {name} must be rendered."
+            raise ValueError(msg)
+
+
+def test_main_wrong_dim(tmp_path: Path) -> None:
+    """Test the command rejects optima of other than 2 decision dimensions."""
+    result = CliRunner().invoke(
+        visualizer.main,
+        ["--problem", "sphere", "--optima", "[[0, 0, 0]]", "--output-dir", str(tmp_path), "--no-cache"],
+    )
+    if result.exit_code == 0:
+        msg = "The command must fail for optima of 3 decision dimensions."
+        raise ValueError(msg)
@@ -0,0 +1,116 @@
+"""Test for the compute backends."""
+
+import pickle
+from typing import Any
+
+import numpy as np
+import pytest
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils import backend
+from opthub_problems.utils.backend import BACKEND_ENVVAR, Backend, NumbaBackend, backend_names, get_backend
+
+PROBLEM_CLASSES = [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem]
+
+# Relative tolerance of the backends against the NumPy backend in each precision
+RTOL = {"float64": 1e-12, "float32": 1e-5}
+
+
+def assert_conforms(problem_class: Any, backend_name: str, precision: str) -> None:  # noqa: ANN401
+    """Check a backend gives the objective values of the NumPy backend."""
+    rng = np.random.default_rng(0)
+    optima = rng.uniform(-5, 5, (3, 40))
+    population = rng.uniform(-5, 5, (20, 40))
+    expected = problem_class(optima, precision=precision, backend="numpy").evaluate_batch(population)
+
+    # A small block size splits the rows into column blocks
+    for block_size in [None, 30]:
+        problem = problem_class(optima, block_size=block_size, precision=precision, backend=backend_name)
+        obj_arr = problem.evaluate_batch(population)
+        if obj_arr.dtype != np.float64 or not np.allclose(obj_arr, expected, rtol=RTOL[precision], atol=0):
+            msg = f"Expected the objective values {expected} with the {backend_name} backend, but got {obj_arr}"
+            raise ValueError(msg)
+        evaluation = problem.evaluate(population[0])
+        if not np.allclose(evaluation["objective"], expected[0], rtol=RTOL[precision], atol=0):
+            msg = f"Expected the evaluation {expected[0]} with the {backend_name} backend, but got {evaluation}"
+            raise ValueError(msg)
+
+
+@pytest.mark.parametrize("precision", ["float64", "float32"])
+@pytest.mark.parametrize("problem_class", PROBLEM_CLASSES)
+@pytest.mark.parametrize("backend_name", backend_names())
+def test_conformance(backend_name: str, problem_class: Any, precision: str) -> None:  # noqa: ANN401
+    """Test every available backend gives the objective values of the NumPy backend."""
+    if not backend._backend_classes[backend_name].is_available():  # noqa: SLF001
+        pytest.skip(f"The {backend_name} backend is not installed")
+    assert_conforms(problem_class, backend_name, precision)
+
+
+@pytest.mark.parametrize("precision", ["float64", "float32"])
+@pytest.mark.parametrize("problem_class", PROBLEM_CLASSES)
+def test_loop_kernel(problem_class: Any, precision: str, monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: ANN401
+    """Test the Numba backend with its loop kernels run as plain Python."""
+    monkeypatch.setattr(NumbaBackend, "is_available", classmethod(lambda _: True))
+    monkeypatch.setattr(NumbaBackend, "_compile", lambda _, function: function)
+    monkeypatch.delitem(backend._backends, "numba", raising=False)  # noqa: SLF001
+    assert_conforms(problem_class, "numba", precision)
+
+
+def test_dask_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the Dask backend evaluates a batch larger than a chunk chunk by chunk."""
+    if not backend.DaskBackend.is_available():
+        pytest.skip("The dask backend is not installed")
+    monkeypatch.setattr(backend, "DASK_CHUNK_BYTES", 1000)
+    rng = np.random.default_rng(0)
+    optima = rng.uniform(-5, 5, (2, 10))
+    population = rng.uniform(-5, 5, (100, 10))
+    expected = RastriginProblem(optima, backend="numpy").evaluate_batch(population)
+    obj_arr = RastriginProblem(optima, backend="dask").evaluate_batch(population)
+    if not np.array_equal(obj_arr, expected):
+        msg = f"Expected the objective values {expected}, but got {obj_arr}"
+        raise ValueError(msg)
+
+
+def test_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an unavailable backend falls back to the NumPy backend."""
+
+    class UnavailableBackend(Backend):
+        name = "unavailable"
+
+        @classmethod
+        def is_available(cls) -> bool:
+            return False
+
+        def evaluate(self, problem: Any, var_arr: Any) -> Any:  # noqa: ANN401
+            raise NotImplementedError
+
+    monkeypatch.setitem(backend._backend_classes, "unavailable", UnavailableBackend)  # noqa: SLF001
+    problem = SphereProblem([[0.0, 0.0]], backend="unavailable")
+    if problem.backend != "numpy" or problem.evaluate([1.0, 2.0]) != {"objective": 5.0}:
+        msg = f"Expected to fall back to the numpy backend, but got {problem.backend}"
+        raise ValueError(msg)
+
+
+def test_envvar(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the backend is selected by the environment variable unless it is given."""
+    monkeypatch.setenv(BACKEND_ENVVAR, "dask")
+    expected = "dask" if get_backend("dask").name == "dask" else "numpy"
+    if SphereProblem([[0.0]]).backend != expected or SphereProblem([[0.0]], backend="numpy").backend != "numpy":
+        msg = f"Expected the {expected} backend from the environment variable"
+        raise ValueError(msg)
+
+    monkeypatch.setenv(BACKEND_ENVVAR, "fortran")
+    with pytest.raises(ValueError, match="backend must be one of"):
+        SphereProblem([[0.0]])
+
+
+def test_pickle() -> None:
+    """Test a problem is pickled with the name of its backend."""
+    problem = RosenbrockProblem([[1.0, 2.0, 3.0]], backend="numpy")
+    unpickled = pickle.loads(pickle.dumps(problem))  # noqa: S301
+    if unpickled.backend != "numpy" or unpickled.evaluate([1.0, 2.0, 3.0]) != problem.evaluate([1.0, 2.0, 3.0]):
+        msg = "Expected the unpickled problem to evaluate like the problem"
+        raise ValueError(msg)
@@ -0,0 +1,138 @@
+"""Test for the out-of-core batch evaluation."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem, evaluate_batch
+from opthub_problems.sphere.batch import main
+from opthub_problems.utils.batch import chunk_rows_for_memory, evaluate_npy, parse_size
+from opthub_problems.utils.population import ROW_INFINITE, ROW_NAN, ROW_VALID
+from opthub_problems.utils.problem import BLOCK_SIZE_CANDIDATES
+
+
+def test_parse_size() -> None:
+    """Test for the memory sizes."""
+    cases = {"1024": 1024, "512M": 512 * 1024**2, "2g": 2 * 1024**3, "64KiB": 64 * 1024}
+    for size, expected in cases.items():
+        if parse_size(size) != expected:
+            msg = f"Expected {expected} for {size}, but got {parse_size(size)}"
+            raise ValueError(msg)
+    with pytest.raises(ValueError, match="Invalid memory size"):
+        parse_size("many")
+
+
+@pytest.mark.parametrize(
+    ("max_memory", "block_rows", "block_bytes", "concurrency"),
+    [(64 * 1024**2, 1, 0, 1), (64 * 1024**2, 6, 2**20, 16), (10**6, 50, 2**18, 8), (3 * 10**5, 4, 10**5, 64)],
+)
+def test_chunk_rows_for_memory(max_memory: int, block_rows: int, block_bytes: int, concurrency: int) -> None:
+    """Test the chunk is the largest one whose rows and concurrent blocks fit in the memory budget."""
+
+    def chunk_bytes(rows: int) -> int:
+        return rows * 8 * (1000 + 10) + min(concurrency, -(-rows // block_rows)) * block_bytes
+
+    rows = chunk_rows_for_memory(max_memory, 1000, 10, block_rows, block_bytes, concurrency)
+    if chunk_bytes(rows) > max_memory or chunk_bytes(rows + 1) <= max_memory:
+        msg = f"Expected the largest chunk fitting in the budget, but got {rows} rows"
+        raise ValueError(msg)
+
+
+def test_chunk_rows_for_memory_too_small(caplog: pytest.LogCaptureFixture) -> None:
+    """Test a budget too small for a single row gives 1 row with a warning."""
+    if chunk_rows_for_memory(10**5, 1000, 10, 1, 10**5) != 1:
+        msg = "Expected at least 1 row"
+        raise ValueError(msg)
+    if "does not fit a row" not in caplog.text:
+        msg = f"Expected a warning, but got {caplog.text!r}"
+        raise ValueError(msg)
+
+
+def test_chunk_rows_for_memory_many_cpus() -> None:
+    """Test the default budget still holds many rows with a block per CPU of many CPUs."""
+    problem = RosenbrockProblem(np.zeros((1, 100)))
+    block_size = max(BLOCK_SIZE_CANDIDATES)
+    rows = chunk_rows_for_memory(
+        256 * 1024**2,
+        100,
+        1,
+        problem.block_rows(block_size),
+        problem.block_bytes(block_size),
+        concurrency=64,
+    )
+    if rows < 10**4:
+        msg = f"Expected a large chunk, but got {rows} rows"
+        raise ValueError(msg)
+
+
+def test_evaluate_npy_matches_evaluate_batch(tmp_path: Path) -> None:
+    """Test the chunked evaluation is identical to the evaluation of the whole population."""
+    rng = np.random.default_rng(0)
+    optima = rng.uniform(-2, 2, (2, 5)).tolist()
+    population = rng.uniform(-2, 2, (103, 5))
+    input_path = tmp_path / "population.npy"
+    output_path = tmp_path / "objectives.npy"
+    np.save(input_path, population)
+
+    evaluate_npy(RosenbrockProblem(optima), input_path, output_path, chunk_rows=10)
+
+    objectives = np.load(output_path)
+    if not np.array_equal(objectives, evaluate_batch(population, optima)):
+        msg = "Expected the chunked evaluation to match evaluate_batch"
+        raise ValueError(msg)
+
+
+def test_evaluate_npy_invalid_dimension(tmp_path: Path) -> None:
+    """Test a population not matching the optima is rejected."""
+    input_path = tmp_path / "population.npy"
+    np.save(input_path, np.zeros((3, 4)))
+    with pytest.raises(ValueError, match="Expected a population"):
+        evaluate_npy(RosenbrockProblem([[1.0, 1.0]]), input_path, tmp_path / "objectives.npy")
+
+
+def test_main(tmp_path: Path) -> None:
+    """Test the batch command of the sphere problem."""
+    input_path = tmp_path / "population.npy"
+    output_path = tmp_path / "objectives.npy"
+    np.save(input_path, np.array([[1.5, 2.5], [1.0, 1.0]]))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [str(input_path), str(output_path), "--optima", json.dumps([[1, 1]]), "--max-memory", "1K"],
+    )
+    if result.exit_code != 0:
+        msg = f"Expected exit code 0, but got {result.exit_code}: {result.output}"
+        raise ValueError(msg)
+    objectives = np.load(output_path)
+    if not np.array_equal(objectives, [[2.5], [0.0]]):
+        msg = f"Expected [[2.5], [0.0]], but got {objectives}"
+        raise ValueError(msg)
+
+
+def test_main_invalid_rows(tmp_path: Path) -> None:
+    """Test the invalid rows get NaN objectives and error codes while the valid ones are evaluated."""
+    input_path = tmp_path / "population.npy"
+    output_path = tmp_path / "objectives.npy"
+    errors_path = tmp_path / "errors.npy"
+    np.save(input_path, np.array([[1.5, 2.5], [np.nan, 1.0], [1.0, 1.0], [np.inf, 0.0]]))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [str(input_path), str(output_path), "--optima", "[[1, 1]]", "--errors-path", str(errors_path)],
+    )
+    if result.exit_code != 0:
+        msg = f"Expected exit code 0, but got {result.exit_code}: {result.output}"
+        raise ValueError(msg)
+    objectives = np.load(output_path)
+    if not np.array_equal(objectives, [[2.5], [np.nan], [0.0], [np.nan]], equal_nan=True):
+        msg = f"Expected NaN objectives for the invalid rows, but got {objectives}"
+        raise ValueError(msg)
+    errors = np.load(errors_path)
+    if errors.tolist() != [ROW_VALID, ROW_NAN, ROW_VALID, ROW_INFINITE]:
+        msg = f"Expected the error codes of the rows, but got {errors}"
+        raise ValueError(msg)
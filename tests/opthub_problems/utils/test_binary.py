@@ -0,0 +1,125 @@
+"""Test for the binary wire formats."""
+
+import io
+import json
+import struct
+
+import numpy as np
+from click.testing import CliRunner
+
+from opthub_problems.sphere.main import main
+from opthub_problems.utils.binary import (
+    read_npy_frame,
+    read_raw_frame,
+    serve_binary,
+    write_error_frame,
+    write_npy_frame,
+    write_raw_frame,
+)
+
+
+def test_npy_frames_round_trip() -> None:
+    """Test consecutive .npy frames are read back."""
+    stream = io.BytesIO()
+    write_npy_frame(stream, np.array([1.5, 2.5]))
+    write_npy_frame(stream, np.array([3], dtype=np.int32))
+    stream.seek(0)
+
+    first = read_npy_frame(stream)
+    second = read_npy_frame(stream)
+    if first is None or not np.array_equal(first, [1.5, 2.5]):
+        msg = f"Expected [1.5, 2.5], but got {first}"
+        raise ValueError(msg)
+    if second is None or second.dtype != np.int32 or not np.array_equal(second, [3]):
+        msg = f"Expected [3] of int32, but got {second}"
+        raise ValueError(msg)
+    if read_npy_frame(stream) is not None:
+        msg = "Expected EOF"
+        raise ValueError(msg)
+
+
+def test_raw_frames_round_trip() -> None:
+    """Test consecutive raw frames are read back."""
+    stream = io.BytesIO()
+    write_raw_frame(stream, np.array([1.5, 2.5]))
+    write_raw_frame(stream, np.array([]))
+    stream.seek(0)
+
+    first = read_raw_frame(stream)
+    second = read_raw_frame(stream)
+    if first is None or not np.array_equal(first, [1.5, 2.5]):
+        msg = f"Expected [1.5, 2.5], but got {first}"
+        raise ValueError(msg)
+    if second is None or second.size != 0:
+        msg = f"Expected an empty array, but got {second}"
+        raise ValueError(msg)
+    if read_raw_frame(stream) is not None:
+        msg = "Expected EOF"
+        raise ValueError(msg)
+
+
+def test_error_frames() -> None:
+    """Test the error frames carry the message."""
+    stream = io.BytesIO()
+    write_error_frame(stream, "npy", "invalid")
+    write_error_frame(stream, "raw", "invalid")
+    stream.seek(0)
+
+    npy_error = read_npy_frame(stream)
+    if npy_error is None or npy_error.dtype.kind != "U" or str(npy_error) != "invalid":
+        msg = f"Expected 'invalid', but got {npy_error}"
+        raise ValueError(msg)
+    (count,) = struct.unpack("<q", stream.read(8))
+    if stream.read(-count) != b"invalid":
+        msg = "Expected 'invalid' in the raw error frame"
+        raise ValueError(msg)
+
+
+def test_serve_binary_reports_errors_per_frame() -> None:
+    """Test an invalid frame does not stop the stream."""
+
+    def handle(variable: np.ndarray) -> np.ndarray:
+        if variable.size != 1:
+            msg = "invalid"
+            raise ValueError(msg)
+        return variable * 2
+
+    stdin = io.BytesIO()
+    for variable in ([1.0], [1.0, 2.0], [3.0]):
+        write_raw_frame(stdin, np.array(variable))
+    stdin.seek(0)
+    stdout = io.BytesIO()
+    serve_binary(handle, "raw", stream=True, stdin=stdin, stdout=stdout)
+    stdout.seek(0)
+
+    first = read_raw_frame(stdout)
+    (count,) = struct.unpack("<q", stdout.read(8))
+    stdout.read(-count)
+    third = read_raw_frame(stdout)
+    if first is None or third is None or first[0] != 2.0 or third[0] != 6.0:  # noqa: PLR2004
+        msg = f"Expected [2.0] and [6.0], but got {first} and {third}"
+        raise ValueError(msg)
+
+
+def test_main_npy() -> None:
+    """Test the sphere problem with the npy format."""
+    stdin = io.BytesIO()
+    write_npy_frame(stdin, np.array([1.5, 2.5]))
+    write_npy_frame(stdin, np.array([1.5]))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["--stream", "--format", "npy", "--optima", json.dumps([[1, 1], [2, 2]]), "--log-level", "ERROR"],
+        input=stdin.getvalue(),
+    )
+    stdout = io.BytesIO(result.stdout_bytes)
+
+    objective = read_npy_frame(stdout)
+    if objective is None or not np.array_equal(objective, [2.5, 0.5]):
+        msg = f"Expected [2.5, 0.5], but got {objective}"
+        raise ValueError(msg)
+    error = read_npy_frame(stdout)
+    if error is None or error.dtype.kind != "U":
+        msg = f"Expected an error, but got {error}"
+        raise ValueError(msg)
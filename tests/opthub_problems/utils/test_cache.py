@@ -0,0 +1,90 @@
+"""Test for the evaluation cache."""
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.sphere.evaluator import SphereProblem, evaluate
+from opthub_problems.sphere.main import evaluate_line
+from opthub_problems.utils.cache import ENTRY_OVERHEAD, EvaluationCache
+
+
+def test_evaluate_hits_cache() -> None:
+    """Test the second evaluation of a decision variable is found in the cache."""
+    cache = EvaluationCache()
+    first = evaluate([1.5, 2.5], [[1, 1], [0, 0]], cache=cache)
+    second = evaluate([1.5, 2.5], [[1, 1], [0, 0]], cache=cache)
+    if first != second or first != evaluate([1.5, 2.5], [[1, 1], [0, 0]]):
+        msg = f"Expected the cached evaluation to match, but got {first} and {second}"
+        raise ValueError(msg)
+    if cache.stats() != {"hits": 1, "misses": 1, "entries": 1, "size": cache.size}:
+        msg = f"Expected 1 hit and 1 miss, but got {cache.stats()}"
+        raise ValueError(msg)
+
+
+def test_key_depends_on_problem() -> None:
+    """Test the same decision variable of different problems has different keys."""
+    cache = EvaluationCache()
+    var_arr = np.array([1.0, 2.0])
+    problems = [
+        SphereProblem([[0.0, 0.0]]),
+        SphereProblem([[0.0, 1.0]]),
+        SphereProblem([[0.0, 0.0]], precision="float32"),
+        RastriginProblem([[0.0, 0.0]]),
+    ]
+    keys = {cache.key(problem, var_arr.astype(problem.dtype)) for problem in problems}
+    if len(keys) != len(problems):
+        msg = f"Expected {len(problems)} distinct keys, but got {len(keys)}"
+        raise ValueError(msg)
+
+
+def test_lru_eviction() -> None:
+    """Test the least recently used entries are evicted once the cache exceeds its size."""
+    entry_size = 32 + 8 + ENTRY_OVERHEAD
+    cache = EvaluationCache(max_size=2 * entry_size)
+    problem = SphereProblem([[0.0]], cache=cache)
+    problem.evaluate(1.0)
+    problem.evaluate(2.0)
+    problem.evaluate(1.0)
+    problem.evaluate(3.0)
+
+    if cache.stats()["entries"] != 2 or cache.size > cache.max_size:  # noqa: PLR2004
+        msg = f"Expected 2 entries within the size, but got {cache.stats()}"
+        raise ValueError(msg)
+    if cache.get(cache.key(problem, np.array([2.0]))) is not None:
+        msg = "Expected the least recently used entry to be evicted"
+        raise ValueError(msg)
+    if cache.get(cache.key(problem, np.array([1.0]))) is None:
+        msg = "Expected the recently used entry to be kept"
+        raise ValueError(msg)
+
+
+def test_sqlite_persistence(tmp_path: Path) -> None:
+    """Test the entries are shared through the database."""
+    path = tmp_path / "cache.sqlite"
+    with EvaluationCache(path=path) as cache:
+        SphereProblem([[1.0, 2.0]], cache=cache).evaluate([3.0, 4.0])
+
+    with EvaluationCache(max_size=0, path=path) as cache:
+        problem = SphereProblem([[1.0, 2.0]], cache=cache)
+        obj_arr = cache.get(cache.key(problem, np.array([3.0, 4.0])))
+        if obj_arr is None or obj_arr.tolist() != [8.0]:
+            msg = f"Expected [8.0] from the database, but got {obj_arr}"
+            raise ValueError(msg)
+
+    copied = pickle.loads(pickle.dumps(EvaluationCache(path=path)))  # noqa: S301
+    if copied.get(cache.key(problem, np.array([3.0, 4.0]))) is None:
+        msg = "Expected the unpickled cache to use the same database"
+        raise ValueError(msg)
+
+
+def test_evaluate_line_hits_cache() -> None:
+    """Test a decision variable of the same numbers written differently is found in the cache by the command."""
+    cache = EvaluationCache()
+    problem = SphereProblem([[0.0, 0.0]], cache=cache)
+    result = evaluate_line("[1, 2]", problem)
+    if evaluate_line("[1.0, 2.0]", problem) != result or cache.stats()["hits"] != 1:
+        msg = f"Expected the cached evaluation, but got {cache.stats()}"
+        raise ValueError(msg)
@@ -0,0 +1,106 @@
+"""Test for the chunked evaluation of a single decision variable."""
+
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from jsonschema import ValidationError
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.chunked import main
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.chunked import ChunkedEvaluator, evaluate_path, read_npy_chunks, read_raw_chunks
+from opthub_problems.utils.problem import Problem
+
+PROBLEM_CLASSES = [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem]
+
+
+def chunks(var: np.ndarray, size: int) -> list[np.ndarray]:
+    """Split a decision variable into chunks of a size."""
+    return [var[start : start + size] for start in range(0, len(var), size)]
+
+
+@pytest.mark.parametrize("problem_class", PROBLEM_CLASSES)
+@pytest.mark.parametrize(("chunk_size", "piece_size"), [(1, 100), (7, 100), (1001, 100), (1001, 3), (2000, 1)])
+def test_evaluate(problem_class: type[Problem], chunk_size: int, piece_size: int) -> None:
+    """Test the objective values of the chunks are the ones of the whole decision variable."""
+    rng = np.random.default_rng(0)
+    opt = rng.uniform(-2, 2, (3, 1001))
+    var = rng.uniform(-2, 2, 1001)
+    evaluator = ChunkedEvaluator(problem_class, opt)
+    evaluator.piece_size = piece_size
+    obj_arr = evaluator.evaluate(chunks(var, chunk_size))
+    expected = problem_class(opt).evaluate_batch(var[np.newaxis])[0]
+    if not np.allclose(obj_arr, expected, rtol=1e-12):
+        msg = f"The objective values must be {expected}, but got {obj_arr}."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    ("var_chunks", "match"),
+    [
+        ([np.zeros(3)], "must have 4 elements, but got 3"),
+        ([np.zeros(3), np.zeros(2)], "must have 4 elements, but got more"),
+        ([np.zeros(2), np.array([0.0, np.inf])], "non-finite value after index 2"),
+        ([np.zeros((2, 2))], "must have shape"),
+    ],
+)
+def test_evaluate_invalid(var_chunks: list[np.ndarray], match: str) -> None:
+    """Test the decision variables without d finite decision dimensions are rejected."""
+    with pytest.raises(ValidationError, match=match):
+        ChunkedEvaluator(SphereProblem, np.zeros((1, 4))).evaluate(var_chunks)
+
+
+def test_read_chunks(tmp_path: Path) -> None:
+    """Test the decision variable is read chunk by chunk from a .npy file and a raw stream."""
+    var = np.arange(10.0)
+    np.save(tmp_path / "var.npy", var)
+    for read in (
+        list(read_npy_chunks(str(tmp_path / "var.npy"), 4)),
+        list(read_raw_chunks(io.BytesIO(var.astype("<f8").tobytes()), 4)),
+    ):
+        if [len(chunk) for chunk in read] != [4, 4, 2] or not np.array_equal(np.concatenate(read), var):
+            msg = f"The chunks must be of 4 decision dimensions but the last one, but got {read}."
+            raise ValueError(msg)
+    with pytest.raises(ValidationError, match="whole number of float64"):
+        list(read_raw_chunks(io.BytesIO(b"\0" * 12), 4))
+
+
+def test_evaluate_path(tmp_path: Path) -> None:
+    """Test the decision variable is read from a file in the npy or raw format."""
+    opt = np.ones((2, 5))
+    var = np.arange(5.0)
+    np.save(tmp_path / "var.npy", var)
+    (tmp_path / "var.bin").write_bytes(var.astype("<f8").tobytes())
+    evaluator = ChunkedEvaluator(SphereProblem, opt)
+    expected = SphereProblem(opt).evaluate_batch(var[np.newaxis])[0]
+    for path, data_format in [(tmp_path / "var.npy", None), (tmp_path / "var.bin", "raw")]:
+        obj_arr = evaluate_path(evaluator, str(path), data_format, 2)
+        if not np.allclose(obj_arr, expected):
+            msg = f"The objective values of {path} must be {expected}, but got {obj_arr}."
+            raise ValueError(msg)
+    with pytest.raises(ValueError, match="needs a file"):
+        evaluate_path(evaluator, "-", "npy")
+
+
+def test_main(tmp_path: Path) -> None:
+    """Test the command evaluates a decision variable from stdin with memory-mapped optima."""
+    opt = np.random.default_rng(1).uniform(-1, 1, (2, 50))
+    var = np.random.default_rng(2).uniform(-1, 1, 50)
+    np.save(tmp_path / "optima.npy", opt)
+    args = ["--optima-file", str(tmp_path / "optima.npy"), "--chunk-size", "8"]
+    result = CliRunner().invoke(main, args, input=var.astype("<f8").tobytes())
+    expected = RosenbrockProblem(opt).evaluate_batch(var[np.newaxis])[0]
+    if result.exit_code != 0 or not np.allclose(json.loads(result.stdout)["objective"], expected):
+        msg = f"The objective values must be {expected}, but got {result.output}."
+        raise ValueError(msg)
+
+    result = CliRunner().invoke(main, args, input=var[:-1].astype("<f8").tobytes())
+    if json.loads(result.stdout)["error"] != "The variable must have 50 elements, but got 49.":
+        msg = f"The error must be reported as the result, but got {result.output}."
+        raise ValueError(msg)
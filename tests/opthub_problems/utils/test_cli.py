@@ -0,0 +1,36 @@
+"""Test for the commands shared by the problems."""
+
+import importlib
+
+import click
+import pytest
+from click.testing import CliRunner
+
+# Prefix of the env vars of each problem, kept as the problems have always named them
+ENVVAR_PREFIXES = {"sphere": "SPHERE", "rastrigin": "Rastrigin", "rosenbrock": "Rosenbrock", "elliptic": "ELLIPTIC"}
+
+
+@pytest.mark.parametrize("command", ["batch", "server", "chunked"])
+@pytest.mark.parametrize(("name", "prefix"), ENVVAR_PREFIXES.items())
+def test_command_envvars(name: str, prefix: str, command: str) -> None:
+    """Test the commands of each problem read the optima from the env vars of the problem."""
+    main = importlib.import_module(f"opthub_problems.{name}.{command}").main
+    if not isinstance(main, click.Command):
+        msg = f"Expected a click command, but got {type(main)}"
+        raise TypeError(msg)
+    envvars = {param.name: param.envvar for param in main.params}
+    if envvars["optima"] != f"{prefix}_OPTIMA" or envvars["optima_file"] != f"{prefix}_OPTIMA_FILE":
+        msg = f"Expected the env vars of {prefix}, but got {envvars}"
+        raise ValueError(msg)
+    if f"{name} function" not in (main.help or ""):
+        msg = f"Expected the help of the {name} function, but got {main.help}"
+        raise ValueError(msg)
+
+
+def test_optima_are_required() -> None:
+    """Test a command fails without optima."""
+    main = importlib.import_module("opthub_problems.sphere.server").main
+    result = CliRunner().invoke(main, ["--port", "0"], env={"SPHERE_OPTIMA": None, "SPHERE_OPTIMA_FILE": None})
+    if result.exit_code != 2 or "Either --optima or --optima-file is required." not in result.output:  # noqa: PLR2004
+        msg = f"Expected a usage error, but got {result.output}"
+        raise ValueError(msg)
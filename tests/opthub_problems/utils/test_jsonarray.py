@@ -0,0 +1,61 @@
+"""Test for the decoding of numeric JSON arrays."""
+
+import json
+
+import numpy as np
+import pytest
+
+from opthub_problems.utils import jsonarray
+from opthub_problems.utils.jsonarray import decode_array
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("[1, 2.5, -3e2]", [1.0, 2.5, -300.0]),
+        (b"[1, 2]\n", [1.0, 2.0]),
+        ("4", 4.0),
+        ("[[1, 2], [3, 4]]", [[1.0, 2.0], [3.0, 4.0]]),
+        ("[]", []),
+    ],
+)
+def test_decode_numeric(text: str | bytes, expected: object) -> None:
+    """Test the numbers and the rectangular arrays of numbers are decoded."""
+    arr = decode_array(text)
+    if arr is None or arr.dtype != np.float64 or arr.tolist() != expected:
+        msg = f"Expected {expected}, but got {arr}"
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[true, 1]",
+        "[false]",
+        '["1", 2]',
+        "[null]",
+        '{"x": 1}',
+        "[[1, 2], [3]]",
+        "[1, 2",
+        "",
+        "[" + "1" * 400 + "]",
+    ],
+)
+def test_decode_other(text: str) -> None:
+    """Test anything else is left to the validators."""
+    if decode_array(text) is not None:
+        msg = f"Expected {text!r} not to be decoded"
+        raise ValueError(msg)
+
+
+def test_decode_standard_library(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the standard library decodes the same arrays when no faster decoder is installed."""
+    monkeypatch.setattr(jsonarray, "HAS_SIMDJSON", False)
+    monkeypatch.setattr(jsonarray, "_loads", json.loads)
+    arr = decode_array(json.dumps(np.linspace(-1, 1, 101).tolist()))
+    if arr is None or not np.array_equal(arr, np.linspace(-1, 1, 101)):
+        msg = f"Expected the decoded floats to round-trip, but got {arr}"
+        raise ValueError(msg)
+    if decode_array("[true]") is not None:
+        msg = "Expected the booleans not to be decoded"
+        raise ValueError(msg)
@@ -0,0 +1,117 @@
+"""Test for the search of the best optimum."""
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.rosenbrock.main import evaluate_line
+from opthub_problems.sphere.evaluator import SphereProblem, evaluate
+
+
+@pytest.mark.parametrize("problem_class", [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem])
+@pytest.mark.parametrize("dim", [2, 7])
+def test_evaluate_min_batch_matches_evaluate_batch(problem_class: Any, dim: int) -> None:  # noqa: ANN401
+    """Test the best objective values and optima match the minimum over all the optima."""
+    rng = np.random.default_rng(dim)
+    optima = rng.uniform(-5, 5, (500, dim))
+    population = np.concatenate(
+        [rng.uniform(-5, 5, (20, dim)), optima[:10] + rng.normal(0, 0.01, (10, dim)), optima[10:15]],
+    )
+    problem = problem_class(optima)
+
+    obj_arr, index_arr = problem.evaluate_min_batch(population)
+
+    expected = problem.evaluate_batch(population)
+    if not np.array_equal(index_arr, np.argmin(expected, axis=1)):
+        msg = f"Expected the optima {np.argmin(expected, axis=1)}, but got {index_arr}"
+        raise ValueError(msg)
+    if not np.array_equal(obj_arr, np.min(expected, axis=1)):
+        msg = f"Expected the objective values {np.min(expected, axis=1)}, but got {obj_arr}"
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("problem_class", [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem])
+def test_evaluate_min_batch_is_exact_in_high_dimension(problem_class: Any) -> None:  # noqa: ANN401
+    """Test the best objective values are identical to the minimum when the rows are split into column blocks."""
+    rng = np.random.default_rng(3)
+    optima = rng.uniform(-2, 2, (20, 40000))
+    population = np.concatenate([rng.uniform(-2, 2, (2, 40000)), optima[[3, 11]] + rng.normal(0, 0.01, (2, 40000))])
+    problem = problem_class(optima)
+
+    obj_arr, index_arr = problem.evaluate_min_batch(population)
+
+    expected = problem.evaluate_batch(population)
+    if not np.array_equal(obj_arr, np.min(expected, axis=1)):
+        msg = f"Expected the objective values {np.min(expected, axis=1)}, but got {obj_arr}"
+        raise ValueError(msg)
+    if not np.array_equal(index_arr, np.argmin(expected, axis=1)):
+        msg = f"Expected the optima {np.argmin(expected, axis=1)}, but got {index_arr}"
+        raise ValueError(msg)
+
+
+@pytest.mark.filterwarnings("ignore:overflow encountered:RuntimeWarning")
+@pytest.mark.parametrize("problem_class", [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem])
+def test_evaluate_min_batch_overflow(problem_class: Any) -> None:  # noqa: ANN401
+    """Test a decision variable whose distance to the optima overflows is evaluated on all the optima."""
+    problem = problem_class([[0.0, 0.0], [1.0, 1.0]])
+    population = np.array([[1e200, 0.0], [0.5, 0.5], [-1e300, 1e300]])
+
+    obj_arr, index_arr = problem.evaluate_min_batch(population)
+
+    expected = problem.evaluate_batch(population)
+    if not np.array_equal(obj_arr, np.min(expected, axis=1)):
+        msg = f"Expected the objective values {np.min(expected, axis=1)}, but got {obj_arr}"
+        raise ValueError(msg)
+    if not np.array_equal(index_arr, np.argmin(expected, axis=1)):
+        msg = f"Expected the optima {np.argmin(expected, axis=1)}, but got {index_arr}"
+        raise ValueError(msg)
+    if evaluate([1e200, 0], [[0, 0], [1, 1]], reduce="min") != {"objective": np.inf, "optimum": 0}:
+        msg = "Expected an infinite objective value at the first optimum"
+        raise ValueError(msg)
+
+
+def test_evaluate_min_ties() -> None:
+    """Test the first of the optima achieving the best objective value is returned."""
+    problem = SphereProblem([[3.0, 3.0], [1.0, 1.0], [2.0, 2.0], [1.0, 1.0]])
+    result = problem.evaluate_min([1.0, 1.0])
+    if result != {"objective": 0.0, "optimum": 1}:
+        msg = f"Expected the optimum 1, but got {result}"
+        raise ValueError(msg)
+
+
+def test_subset() -> None:
+    """Test the problem restricted to some optima matches the columns of the whole problem."""
+    rng = np.random.default_rng(0)
+    problem = RosenbrockProblem(rng.uniform(-2, 2, (6, 3)))
+    population = rng.uniform(-2, 2, (4, 3))
+    indices = [4, 1, 1]
+
+    subset = problem.subset(indices)
+
+    if not isinstance(subset, RosenbrockProblem):
+        msg = f"Expected a RosenbrockProblem, but got {type(subset)}"
+        raise TypeError(msg)
+    if subset.n_optima != len(indices) or not np.array_equal(subset.diff, problem.diff[indices]):
+        msg = "Expected the constants of the optima to be restricted"
+        raise ValueError(msg)
+    if not np.array_equal(subset.evaluate_batch(population), problem.evaluate_batch(population)[:, indices]):
+        msg = "Expected the objective values of the optima"
+        raise ValueError(msg)
+
+
+def test_reduce() -> None:
+    """Test the reductions of the module function and the main command."""
+    if evaluate([1.5, 2.5], [[0, 0], [1, 2], [1, 1]], reduce="min") != {"objective": 0.5, "optimum": 1}:
+        msg = "Expected the best optimum 1"
+        raise ValueError(msg)
+    with pytest.raises(ValueError, match="reduction"):
+        evaluate([1.5, 2.5], [[0, 0]], reduce="max")
+
+    result = evaluate_line("[1, 1]", RosenbrockProblem([[0, 0], [1, 1]]), reduce="min")
+    if result != {"objective": 0.0, "optimum": 1}:
+        msg = f"Expected the best optimum 1, but got {result}"
+        raise ValueError(msg)
@@ -0,0 +1,87 @@
+"""Test for the online accumulators against the statistics over the whole streams."""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from opthub_problems.utils.online import OnlineAutocorrelation, OnlineCorrelation, OnlineInformationContent
+
+CHUNK_SIZES = [1, 7, 1000]
+
+
+def chunks(values: np.ndarray, size: int) -> list[np.ndarray]:
+    """Split values into chunks of a size."""
+    return [values[start : start + size] for start in range(0, len(values), size)]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_correlation(size: int) -> None:
+    """Test the correlation of chunks of pairs is the one of the whole streams."""
+    rng = np.random.default_rng(0)
+    x = rng.normal(1e6, 1.0, 500)
+    y = x + rng.normal(0.0, 2.0, 500)
+    correlation = OnlineCorrelation()
+    for x_chunk, y_chunk in zip(chunks(x, size), chunks(y, size), strict=True):
+        correlation.update(x_chunk, y_chunk)
+    expected = [np.corrcoef(x, y)[0, 1], x.mean(), x.std(), x.min(), x.max()]
+    actual = [correlation.correlation, correlation.mean_x, correlation.std_x, correlation.min_x, correlation.max_x]
+    if correlation.count != len(x) or not np.allclose(actual, expected, rtol=1e-9):
+        msg = f"The statistics must be {expected}, but got {actual}."
+        raise ValueError(msg)
+
+
+def test_correlation_constant() -> None:
+    """Test the correlation of a constant stream is NaN."""
+    correlation = OnlineCorrelation()
+    correlation.update(np.ones(3), np.arange(3.0))
+    if not math.isnan(correlation.correlation):
+        msg = f"The correlation must be NaN, but got {correlation.correlation}."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_autocorrelation(size: int) -> None:
+    """Test the autocorrelations of chunks are the correlations of the whole stream with its shifts."""
+    values = np.cumsum(np.random.default_rng(1).normal(size=300))
+    autocorrelation = OnlineAutocorrelation(5)
+    for chunk in chunks(values, size):
+        autocorrelation.update(chunk)
+    expected = [np.corrcoef(values[:-lag], values[lag:])[0, 1] for lag in range(1, 6)]
+    if not np.allclose(autocorrelation.autocorrelations, expected, rtol=1e-9):
+        msg = f"The autocorrelations must be {expected}, but got {autocorrelation.autocorrelations}."
+        raise ValueError(msg)
+    if not np.isclose(autocorrelation.correlation_length, -1 / math.log(abs(expected[0]))):
+        msg = f"The correlation length must follow r(1) = {expected[0]}."
+        raise ValueError(msg)
+
+
+def information_content(values: np.ndarray, epsilon: float) -> tuple[float, float]:
+    """Calculate the information content and the partial information content by their definitions."""
+    slopes = [0 if d < -epsilon else 2 if d > epsilon else 1 for d in np.diff(values)]
+    pairs = list(itertools.pairwise(slopes))
+    entropy = 0.0
+    for p in range(3):
+        for q in range(3):
+            share = pairs.count((p, q)) / len(pairs)
+            if p != q and share > 0:
+                entropy -= share * math.log(share, 6)
+    directed = [slope for slope in slopes if slope != 1]
+    changes = [slope for i, slope in enumerate(directed) if i == 0 or slope != directed[i - 1]]
+    return entropy, len(changes) / len(slopes)
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("epsilon", [0.0, 0.5])
+def test_information_content(size: int, epsilon: float) -> None:
+    """Test the information contents of chunks are the ones of the whole walk."""
+    values = np.round(np.random.default_rng(2).normal(size=400), 1)
+    information = OnlineInformationContent(epsilon)
+    for chunk in chunks(values, size):
+        information.update(chunk)
+    expected = information_content(values, epsilon)
+    actual = (information.information_content, information.partial_information_content)
+    if not np.allclose(actual, expected):
+        msg = f"The information contents must be {expected}, but got {actual}."
+        raise ValueError(msg)
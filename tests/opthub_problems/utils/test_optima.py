@@ -0,0 +1,130 @@
+"""Test for the optima stored in memory-mapped files."""
+
+import json
+import multiprocessing as mp
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from jsonschema import ValidationError
+
+from opthub_problems.elliptic.validator import validate_optima_file
+from opthub_problems.rastrigin.batch import main
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.utils import optima as optima_module
+from opthub_problems.utils.optima import digest_path, load_optima_file
+from opthub_problems.utils.parallel import ParallelEvaluator
+
+
+def test_load_optima_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the optima are validated once and shared by the problem."""
+    path = tmp_path / "optima.npy"
+    np.save(path, np.arange(6.0).reshape(2, 3))
+
+    optima = load_optima_file(path)
+    if not isinstance(optima, np.memmap) or not digest_path(path).exists():
+        msg = "Expected memory-mapped optima and a sidecar digest"
+        raise ValueError(msg)
+    if RastriginProblem(optima).opt is not optima:
+        msg = "Expected the problem to share the memory-mapped optima"
+        raise ValueError(msg)
+    if "blake2b" not in json.loads(digest_path(path).read_text()):
+        msg = "Expected the digest of the optima in the sidecar"
+        raise ValueError(msg)
+
+    def fail(*_: object) -> str:
+        msg = "validated again"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(optima_module, "validate_optima_array", fail)
+    load_optima_file(path)
+
+    np.save(path, np.arange(8.0).reshape(2, 4))
+    with pytest.raises(AssertionError, match="validated again"):
+        load_optima_file(path)
+
+
+@pytest.mark.parametrize(
+    "optima",
+    [
+        np.array([[1.0, np.nan]]),
+        np.array([1.0, 2.0]),
+        np.zeros((0, 2)),
+        np.array([[1.0]]),
+        np.array([[1.0, 2.0]], dtype=np.float32),
+        np.array([[1.0, 2.0], [3.0, 4.0]], order="F"),
+        np.array([["a", "b"]]),
+    ],
+)
+def test_invalid_optima_file(tmp_path: Path, optima: np.ndarray) -> None:
+    """Test the invalid optima are rejected without recording them."""
+    path = tmp_path / "optima.npy"
+    np.save(path, optima)
+    with pytest.raises(ValidationError):
+        validate_optima_file(str(path))
+    if digest_path(path).exists():
+        msg = "Expected no sidecar digest for invalid optima"
+        raise ValueError(msg)
+
+
+def test_validate_optima_array_long_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the rows longer than a chunk are validated and hashed piece by piece."""
+    optima = np.arange(30.0).reshape(3, 10)
+    expected = optima_module.validate_optima_array(optima)
+    monkeypatch.setattr(optima_module, "CHUNK_BYTES", 24)
+    if optima_module.validate_optima_array(optima) != expected:
+        msg = "Expected the digest not to depend on the chunks"
+        raise ValueError(msg)
+    optima[1, 7] = np.nan
+    with pytest.raises(ValidationError, match="rows 1 to 2"):
+        optima_module.validate_optima_array(optima)
+
+
+def test_pickle_maps_the_file(tmp_path: Path) -> None:
+    """Test the worker processes map the optima file instead of receiving a copy."""
+    path = tmp_path / "optima.npy"
+    rng = np.random.default_rng(0)
+    np.save(path, rng.uniform(-5, 5, (3, 4)))
+    problem = RastriginProblem(load_optima_file(path))
+
+    state = problem.__getstate__()
+    if not isinstance(problem.opt, np.memmap):
+        msg = f"Expected the optima to be memory-mapped, but got {type(problem.opt)}"
+        raise TypeError(msg)
+    if state["opt"] != (path, problem.opt.offset):
+        msg = f"Expected the file of the optima to be pickled, but got {state['opt']}"
+        raise ValueError(msg)
+    copied = pickle.loads(pickle.dumps(problem))  # noqa: S301
+    if not isinstance(copied.opt, np.memmap) or not np.array_equal(copied.opt, problem.opt):
+        msg = "Expected the unpickled problem to map the optima file"
+        raise ValueError(msg)
+
+    population = rng.uniform(-5, 5, (20, 4))
+    with ParallelEvaluator(problem, workers=2, context=mp.get_context("spawn")) as evaluator:
+        result = evaluator.evaluate_batch(population)
+    if not np.array_equal(result, problem.evaluate_batch(population)):
+        msg = "Expected the parallel evaluation to match evaluate_batch"
+        raise ValueError(msg)
+
+
+def test_batch_optima_file(tmp_path: Path) -> None:
+    """Test the batch command with the optima in a file."""
+    np.save(tmp_path / "optima.npy", np.array([[0.0, 0.0]]))
+    np.save(tmp_path / "population.npy", np.array([[0.0, 0.0], [1.0, 0.0]]))
+    runner = CliRunner()
+    args = [str(tmp_path / "population.npy"), str(tmp_path / "objectives.npy")]
+
+    result = runner.invoke(main, [*args, "--optima-file", str(tmp_path / "optima.npy")])
+    if result.exit_code != 0:
+        msg = f"Expected exit code 0, but got {result.exit_code}: {result.output}"
+        raise ValueError(msg)
+    if not np.allclose(np.load(tmp_path / "objectives.npy"), [[0.0], [1.0]]):
+        msg = f"Expected [[0.0], [1.0]], but got {np.load(tmp_path / 'objectives.npy')}"
+        raise ValueError(msg)
+
+    result = runner.invoke(main, args)
+    if result.exit_code == 0:
+        msg = "Expected an error without the optima"
+        raise ValueError(msg)
@@ -0,0 +1,89 @@
+"""Test for the process-parallel batch evaluation."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.utils import problem as problem_module
+from opthub_problems.utils.batch import evaluate_npy
+from opthub_problems.utils.parallel import ParallelEvaluator, default_context, evaluate_parallel
+
+
+def test_evaluate_parallel_matches_evaluate_batch() -> None:
+    """Test the parallel evaluation is identical to the sequential one and keeps the row order."""
+    rng = np.random.default_rng(0)
+    problem = RastriginProblem(rng.uniform(-5, 5, (3, 7)))
+    population = rng.uniform(-5, 5, (101, 7))
+
+    result = evaluate_parallel(problem, population, workers=2, chunk_rows=8)
+    if not np.array_equal(result, problem.evaluate_batch(population)):
+        msg = "Expected the parallel evaluation to match evaluate_batch"
+        raise ValueError(msg)
+
+
+def test_default_context_does_not_fork() -> None:
+    """Test the workers are not forked from a parent whose thread pool may be running."""
+    if default_context().get_start_method() == "fork":
+        msg = "Expected the workers to be started by a fork server or spawned"
+        raise ValueError(msg)
+
+
+def test_single_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the blocks of a worker are evaluated in its own thread with the same result."""
+    rng = np.random.default_rng(3)
+    problem = RastriginProblem(rng.uniform(-5, 5, (2, 7)), block_size=2 * 7)
+    population = rng.uniform(-5, 5, (20, 7))
+    expected = problem.evaluate_batch(population)
+    monkeypatch.setattr(problem_module, "_thread_pool", None)
+    monkeypatch.setattr(problem_module, "_single_threaded", False)
+
+    problem_module.use_single_thread()
+
+    if not np.array_equal(problem.evaluate_batch(population), expected):
+        msg = "Expected the single-threaded evaluation to match the threaded one"
+        raise ValueError(msg)
+    if problem_module._thread_pool is not None:  # noqa: SLF001
+        msg = "Expected no thread pool in a single-threaded process"
+        raise ValueError(msg)
+
+
+def test_integer_population() -> None:
+    """Test a population of integers is converted while copied to the workers."""
+    problem = RastriginProblem([[0.0, 1.0], [2.0, -1.0]])
+    population = np.arange(-10, 10).reshape(10, 2)
+    with ParallelEvaluator(problem, workers=2) as evaluator:
+        result = evaluator.evaluate_batch(population)
+    if not np.array_equal(result, problem.evaluate_batch(population)):
+        msg = "Expected the integers to be evaluated as float64"
+        raise ValueError(msg)
+
+
+def test_evaluator_is_reusable() -> None:
+    """Test a pool of workers evaluates several batches."""
+    rng = np.random.default_rng(1)
+    problem = RastriginProblem(rng.uniform(-5, 5, (2, 4)))
+    with ParallelEvaluator(problem, workers=2) as evaluator:
+        for n_rows in (1, 10, 0, 33):
+            population = rng.uniform(-5, 5, (n_rows, 4))
+            result = evaluator.evaluate_batch(population)
+            if not np.array_equal(result, problem.evaluate_batch(population)):
+                msg = f"Expected the parallel evaluation to match evaluate_batch for {n_rows} rows"
+                raise ValueError(msg)
+    with pytest.raises(RuntimeError):
+        evaluator.evaluate_batch(population)
+
+
+def test_evaluate_npy_with_workers(tmp_path: Path) -> None:
+    """Test the out-of-core evaluation on several workers."""
+    rng = np.random.default_rng(2)
+    problem = RastriginProblem(rng.uniform(-5, 5, (2, 3)))
+    population = rng.uniform(-5, 5, (50, 3))
+    np.save(tmp_path / "population.npy", population)
+
+    evaluate_npy(problem, tmp_path / "population.npy", tmp_path / "objectives.npy", chunk_rows=16, workers=2)
+
+    if not np.array_equal(np.load(tmp_path / "objectives.npy"), problem.evaluate_batch(population)):
+        msg = "Expected the parallel evaluation to match evaluate_batch"
+        raise ValueError(msg)
@@ -0,0 +1,66 @@
+"""Test for the vectorized validation of populations."""
+
+import numpy as np
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from opthub_problems.elliptic.validator import validate_population as validate_elliptic_population
+from opthub_problems.sphere.validator import validate_population
+from opthub_problems.utils.population import (
+    ROW_INFINITE,
+    ROW_NAN,
+    ROW_NOT_NUMERIC,
+    ROW_VALID,
+    ROW_WRONG_LENGTH,
+    row_error_message,
+)
+
+
+def test_array() -> None:
+    """Test the rows of an array get their error codes."""
+    population = np.array([[1.0, 2.0], [np.nan, 1.0], [1.0, -np.inf], [np.nan, np.inf]])
+    mask, codes = validate_population(population, 2)
+    if mask.tolist() != [True, False, False, False] or codes.tolist() != [ROW_VALID, ROW_NAN, ROW_INFINITE, ROW_NAN]:
+        msg = f"Expected the error codes of the rows, but got {mask} and {codes}"
+        raise ValueError(msg)
+
+    for population, code in (
+        (np.zeros((3, 4)), ROW_WRONG_LENGTH),
+        (np.zeros((3, 2), dtype=bool), ROW_NOT_NUMERIC),
+        (np.array([["A", "B"]]), ROW_NOT_NUMERIC),
+    ):
+        mask, codes = validate_population(population, 2)
+        if mask.any() or set(codes.tolist()) != {code}:
+            msg = f"Expected every row to get the code {code}, but got {codes}"
+            raise ValueError(msg)
+
+    mask, codes = validate_population(np.array([[1, 2]], dtype=np.int64), 2)
+    if not mask.all():
+        msg = f"Expected the integer rows to be valid, but got {codes}"
+        raise ValueError(msg)
+    with pytest.raises(ValidationError):
+        validate_population(np.zeros(3), 2)
+
+
+def test_list() -> None:
+    """Test the decoded JSON solution variables get their error codes."""
+    population = [[1, 2.0], [1, True], [1], "x", [1, float("nan")], [1, 10**400], [None, 1]]
+    mask, codes = validate_population(population, 2)
+    expected = [ROW_VALID, ROW_NOT_NUMERIC, ROW_WRONG_LENGTH, ROW_WRONG_LENGTH, ROW_NAN, ROW_INFINITE, ROW_NOT_NUMERIC]
+    if codes.tolist() != expected or mask.tolist() != [code == ROW_VALID for code in expected]:
+        msg = f"Expected {expected}, but got {codes}"
+        raise ValueError(msg)
+
+    mask, codes = validate_population([1, 2.5, [3], [float("inf")]], 1)
+    if codes.tolist() != [ROW_VALID, ROW_VALID, ROW_VALID, ROW_INFINITE]:
+        msg = f"Expected the numbers to be valid variables of 1 dimension, but got {codes}"
+        raise ValueError(msg)
+    with pytest.raises(ValidationError):
+        validate_elliptic_population([[1.0]], 1)
+
+
+def test_row_error_message() -> None:
+    """Test the error messages of the rows."""
+    if row_error_message(ROW_WRONG_LENGTH, 3) != "The variable must have 3 elements.":
+        msg = f"Expected the number of dimensions, but got {row_error_message(ROW_WRONG_LENGTH, 3)}"
+        raise ValueError(msg)
@@ -0,0 +1,137 @@
+"""Test for the problems built once from their optima."""
+
+import numpy as np
+import pytest
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.elliptic.evaluator import evaluate as evaluate_elliptic
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils import problem as problem_module
+from opthub_problems.utils.problem import BLOCK_SIZE_CANDIDATES, BLOCK_TEMPORARIES, COLUMN_BLOCK, Problem
+
+
+def test_constants_are_readonly() -> None:
+    """Test the cached constants are contiguous and read-only."""
+    problem = RosenbrockProblem([[1.0, 2.0, 3.0]])
+    for array in (problem.opt, problem.diff):
+        if array.flags.writeable or not array.flags.c_contiguous:
+            msg = "Expected a contiguous read-only array"
+            raise ValueError(msg)
+    with pytest.raises(ValueError, match="read-only"):
+        problem.opt[0, 0] = 0.0
+
+
+def test_optima_are_copied() -> None:
+    """Test the optima given by the caller stay writeable."""
+    optima = np.array([[1.0, 2.0]])
+    EllipticProblem(optima)
+    optima[0, 0] = 0.0
+
+
+def test_evaluate_matches_module_function() -> None:
+    """Test the problem evaluates as the module function."""
+    optima = [[1.0, 2.0, 3.0], [0.0, 0.0, 0.0]]
+    problem = EllipticProblem(optima)
+    for var in ([1.5, 2.5, 3.5], [0.0, 0.0, 0.0], [-1.0, 1.0, -1.0]):
+        if problem.evaluate(var) != evaluate_elliptic(var, optima):
+            msg = f"Expected {evaluate_elliptic(var, optima)}, but got {problem.evaluate(var)}"
+            raise ValueError(msg)
+
+
+def test_evaluate_batch_invalid_shape() -> None:
+    """Test the decision variables must match the optima."""
+    problem = EllipticProblem([[1.0, 2.0]])
+    with pytest.raises(ValueError, match="Expected decision variables"):
+        problem.evaluate_batch([[1.0, 2.0, 3.0]])
+    with pytest.raises(ValueError, match="Expected decision variables"):
+        problem.evaluate_batch([1.0, 2.0])
+
+
+def test_row_blocks_are_identical() -> None:
+    """Test splitting the rows into blocks does not change the result."""
+    rng = np.random.default_rng(0)
+    optima = rng.uniform(-2, 2, (3, 8))
+    population = rng.uniform(-2, 2, (50, 8))
+    expected = RosenbrockProblem(optima, block_size=10**6).evaluate_batch(population)
+    result = RosenbrockProblem(optima, block_size=3 * 8 * 4).evaluate_batch(population)
+    if not np.array_equal(result, expected):
+        msg = "Expected the row blocks to give identical results"
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("problem_class", [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem])
+def test_block_size_does_not_change_result(problem_class: type[Problem]) -> None:
+    """Test the objective values are identical whatever the block size and the number of optima."""
+    rng = np.random.default_rng(1)
+    optima = rng.uniform(-2, 2, (3, 12345))
+    population = rng.uniform(-2, 2, (5, 12345))
+    expected = problem_class(optima, block_size=10**9).evaluate_batch(population)
+    for block_size in (1, 7, *BLOCK_SIZE_CANDIDATES):
+        result = problem_class(optima, block_size=block_size).evaluate_batch(population)
+        if not np.array_equal(result, expected):
+            msg = f"Expected {expected}, but got {result} with block size {block_size}"
+            raise ValueError(msg)
+    for index in range(3):
+        result = problem_class(optima[index : index + 1]).evaluate_batch(population)
+        if not np.array_equal(result[:, 0], expected[:, index]):
+            msg = f"Expected the optimum {index} alone to give {expected[:, index]}, but got {result[:, 0]}"
+            raise ValueError(msg)
+
+
+@pytest.mark.parametrize("candidate", BLOCK_SIZE_CANDIDATES)
+def test_calibration_does_not_change_result(candidate: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a decision variable gets the same objective values before, during and after the calibration."""
+    monkeypatch.setattr(problem_module, "BLOCK_SIZE_CANDIDATES", (candidate,))
+    monkeypatch.setattr(problem_module, "_calibrated_block_sizes", {})
+    rng = np.random.default_rng(2)
+    optima = rng.uniform(-2, 2, (8, 12345))
+    problem = SphereProblem(optima[:3])
+    # More rows than a block of the default block size, so the batch is calibrated
+    population = rng.uniform(-2, 2, (32, 12345))
+    before = problem.evaluate_array(population[0])
+    during = problem.evaluate_batch(population)[0]
+    after = problem.evaluate_array(population[0])
+    if problem_module._calibrated_block_sizes != {"sphere": candidate}:  # noqa: SLF001
+        msg = "Expected the block size to be calibrated"
+        raise ValueError(msg)
+    if not np.array_equal(before, during) or not np.array_equal(before, after):
+        msg = f"Expected identical objective values, but got {before}, {during} and {after}"
+        raise ValueError(msg)
+    # With the calibrated block size, the number of optima does not change the objective values either
+    expected = SphereProblem(optima).evaluate_batch(population)[:, :3]
+    if not np.array_equal(problem.evaluate_batch(population), expected):
+        msg = f"Expected {expected} whatever the number of optima"
+        raise ValueError(msg)
+
+
+def test_block_bytes() -> None:
+    """Test a block holds the rows fitting in the block size, and at least one row of a column block."""
+    problem = SphereProblem(np.zeros((2, 100)), precision="float32")
+    if problem.block_rows(4096) != 20 or problem.block_bytes(4096) != BLOCK_TEMPORARIES * 20 * 2 * 100 * 4:  # noqa: PLR2004
+        msg = f"Expected 20 rows of float32, but got {problem.block_rows(4096)} and {problem.block_bytes(4096)}"
+        raise ValueError(msg)
+    problem = SphereProblem(np.zeros((100, 5000)))
+    if problem.block_rows(4096) != 1 or problem.block_bytes(4096) != BLOCK_TEMPORARIES * 100 * COLUMN_BLOCK * 8:
+        msg = f"Expected a row of a column block, but got {problem.block_bytes(4096)}"
+        raise ValueError(msg)
+
+
+def test_single_block_is_not_calibrated(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the block size is not calibrated for an input evaluated in a single block anyway."""
+    monkeypatch.setattr(problem_module, "_calibrated_block_sizes", {})
+    problem = RastriginProblem(np.zeros((1, 10**5)))
+    problem.evaluate_array(np.ones(10**5))
+    problem.evaluate_batch(np.ones((problem.block_rows(problem_module.DEFAULT_BLOCK_SIZE), 10**5)))
+    if problem_module._calibrated_block_sizes:  # noqa: SLF001
+        msg = f"Expected no calibration, but got {problem_module._calibrated_block_sizes}"  # noqa: SLF001
+        raise ValueError(msg)
+
+
+def test_calibrate_block_size() -> None:
+    """Test the calibrated block size is one of the candidates."""
+    block_size = EllipticProblem(np.zeros((2, 100))).calibrate_block_size()
+    if block_size not in BLOCK_SIZE_CANDIDATES:
+        msg = f"Expected one of {BLOCK_SIZE_CANDIDATES}, but got {block_size}"
+        raise ValueError(msg)
@@ -0,0 +1,102 @@
+"""Test for the rotated problems."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from opthub_problems.elliptic.evaluator import EllipticProblem
+from opthub_problems.rastrigin.evaluator import RastriginProblem
+from opthub_problems.rosenbrock.evaluator import RosenbrockProblem
+from opthub_problems.rosenbrock.evaluator import evaluate as rosenbrock_evaluate
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.utils.rotation import ROTATION_DIR_ENVVAR, rotation_matrix
+
+
+@pytest.fixture(autouse=True)
+def rotation_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Cache the rotation matrices in a temporary directory."""
+    monkeypatch.setenv(ROTATION_DIR_ENVVAR, str(tmp_path))
+    return tmp_path
+
+
+def test_rotation_matrix(rotation_dir: Path) -> None:
+    """Test the rotation matrix is orthogonal and cached per seed and dimension."""
+    rotation = rotation_matrix(3, 50)
+    if not np.allclose(rotation @ rotation.T, np.eye(50)):
+        msg = "Expected an orthogonal matrix"
+        raise ValueError(msg)
+    if not (rotation_dir / "rotation-3-50.npy").exists():
+        msg = "Expected the matrix to be cached"
+        raise ValueError(msg)
+    if not np.array_equal(rotation_matrix(3, 50), rotation) or np.allclose(rotation_matrix(4, 50), rotation):
+        msg = "Expected the same matrix for the same seed only"
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("problem_class", [SphereProblem, EllipticProblem, RastriginProblem, RosenbrockProblem])
+def test_rotated_problem(problem_class: type[SphereProblem]) -> None:
+    """Test the rotated problem is the problem at the origin applied to R (x - o)."""
+    rng = np.random.default_rng(0)
+    optima = rng.uniform(-5, 5, (3, 6))
+    population = rng.uniform(-5, 5, (10, 6))
+    rotation = rotation_matrix(7, 6)
+
+    problem = problem_class(optima, rotation_seed=7)
+    expected = np.stack(
+        [problem_class(np.zeros((1, 6))).evaluate_batch((population - opt) @ rotation.T)[:, 0] for opt in optima],
+        axis=1,
+    )
+    if not np.allclose(problem.evaluate_batch(population), expected):
+        msg = "Expected the problem at the origin applied to R (x - o)"
+        raise ValueError(msg)
+    if not np.allclose(problem.evaluate_batch(optima).diagonal(), 0, atol=1e-9):
+        msg = "Expected the rotated problem to vanish at its optima"
+        raise ValueError(msg)
+    if not np.array_equal(problem.evaluate_batch(population[:1])[0], problem.evaluate_array(population[0])):
+        msg = "Expected the single evaluation to match the batch"
+        raise ValueError(msg)
+
+
+def test_rotated_derivatives() -> None:
+    """Test the gradients and the Hessian-vector products of a rotated problem."""
+    rng = np.random.default_rng(1)
+    problem = RosenbrockProblem(rng.uniform(-2, 2, (2, 4)), rotation_seed=1)
+    population = rng.uniform(-2, 2, (3, 4))
+    vectors = rng.normal(size=(3, 4))
+    step = 1e-6
+
+    gradients = problem.gradient_batch(population)
+    derivatives = (
+        problem.evaluate_batch(population + step * vectors) - problem.evaluate_batch(population - step * vectors)
+    ) / (2 * step)
+    if not np.allclose(np.einsum("nmd,nd->nm", gradients, vectors), derivatives, rtol=1e-5, atol=1e-3):
+        msg = "Expected the directional derivatives to match the gradients"
+        raise ValueError(msg)
+    expected = (
+        problem.gradient_batch(population + step * vectors) - problem.gradient_batch(population - step * vectors)
+    ) / (2 * step)
+    if not np.allclose(problem.hvp_batch(population, vectors), expected, rtol=1e-5, atol=1e-3):
+        msg = "Expected the Hessian-vector products to match the differences of the gradients"
+        raise ValueError(msg)
+
+
+def test_rotated_reductions() -> None:
+    """Test the min mode and the digest of a rotated problem."""
+    rng = np.random.default_rng(2)
+    optima = rng.uniform(-5, 5, (50, 3))
+    population = rng.uniform(-5, 5, (20, 3))
+    problem = RastriginProblem(optima, rotation_seed=5)
+
+    obj_arr, index_arr = problem.evaluate_min_batch(population)
+    expected = problem.evaluate_batch(population)
+    if not np.array_equal(index_arr, np.argmin(expected, axis=1)) or not np.allclose(obj_arr, np.min(expected, axis=1)):
+        msg = "Expected the best optima of the rotated problem"
+        raise ValueError(msg)
+    if RastriginProblem(np.zeros((1, 3)), rotation_seed=5).digest == RastriginProblem(np.zeros((1, 3))).digest:
+        msg = "Expected the digest to depend on the rotation"
+        raise ValueError(msg)
+    result = rosenbrock_evaluate([1.0, 2.0], [[1.0, 2.0]], rotation_seed=5)
+    if not np.isclose(result["objective"], 0.0, atol=1e-20):
+        msg = "Expected the rotated rosenbrock function to vanish at its optimum"
+        raise ValueError(msg)
@@ -0,0 +1,178 @@
+"""Test for the micro-batching evaluation server."""
+
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from opthub_problems.sphere.evaluator import SphereProblem
+from opthub_problems.sphere.validator import parse_variable, validate_variable_array
+from opthub_problems.utils.binary import RAW_DTYPE, RAW_PREFIX
+from opthub_problems.utils.server import EvaluationServer, MicroBatcher
+
+# Seconds to wait for the server to listen
+STARTUP_TIMEOUT = 30.0
+
+
+async def send_lines(path: Path, lines: list[bytes]) -> list[dict[str, object]]:
+    """Send JSON lines over a connection and read a response per line.
+
+    Args:
+        path (Path): Unix socket of the server
+        lines (list[bytes]): JSON lines
+
+    Returns:
+        list[dict[str, object]]: responses
+    """
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    writer.write(b"".join(lines))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in lines]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+async def serve_clients(
+    server: EvaluationServer,
+    path: Path,
+    requests: list[list[bytes]],
+) -> list[list[dict[str, object]]]:
+    """Serve concurrent connections of JSON lines.
+
+    Args:
+        server (EvaluationServer): server to run
+        path (Path): Unix socket to listen on
+        requests (list[list[bytes]]): JSON lines of each connection
+
+    Returns:
+        list[list[dict[str, object]]]: responses of each connection
+    """
+    unix_server = await asyncio.start_unix_server(server.handle_connection, str(path))
+    async with unix_server:
+        return list(await asyncio.gather(*(send_lines(path, lines) for lines in requests)))
+
+
+def test_micro_batcher() -> None:
+    """Test concurrent decision variables are evaluated by a single call, each caller getting its row."""
+    calls = []
+
+    def evaluate_batch(var_batch: np.ndarray) -> np.ndarray:
+        calls.append(len(var_batch))
+        return var_batch * 2
+
+    async def evaluate_all() -> list[np.ndarray]:
+        batcher = MicroBatcher(evaluate_batch, window=0.05, max_batch=4)
+        return list(await asyncio.gather(*(batcher.evaluate(np.array([float(x)])) for x in range(10))))
+
+    results = asyncio.run(evaluate_all())
+    if calls != [4, 4, 2]:
+        msg = f"Expected batches of at most 4 decision variables, but got {calls}"
+        raise ValueError(msg)
+    for x, result in enumerate(results):
+        if result.tolist() != [2.0 * x]:
+            msg = f"Expected the row of {x}, but got {result}"
+            raise ValueError(msg)
+
+
+def test_micro_batcher_error() -> None:
+    """Test an error of the batch is raised to each caller."""
+
+    def evaluate_batch(var_batch: np.ndarray) -> np.ndarray:  # noqa: ARG001
+        msg = "Failed"
+        raise RuntimeError(msg)
+
+    async def evaluate_all() -> list[object]:
+        batcher = MicroBatcher(evaluate_batch, window=0.01)
+        return list(
+            await asyncio.gather(*(batcher.evaluate(np.zeros(1)) for _ in range(3)), return_exceptions=True),
+        )
+
+    for result in asyncio.run(evaluate_all()):
+        if not isinstance(result, RuntimeError):
+            msg = f"Expected the error of the batch, but got {result}"
+            raise TypeError(msg)
+
+
+def test_json_connections(tmp_path: Path) -> None:
+    """Test concurrent connections get their own results in order and are batched together."""
+    problem = SphereProblem([[0, 0], [1, 1]])
+    server = EvaluationServer(problem, parse_variable, validate_variable_array, window=0.05)
+    requests = [[f"[{x}, {y}]\n".encode() for y in range(4)] for x in range(8)]
+    requests[3][1] = b"[1, 2, 3]\n"
+    responses = asyncio.run(serve_clients(server, tmp_path / "sphere.sock", requests))
+
+    for x, lines in enumerate(responses):
+        for y, response in enumerate(lines):
+            if (x, y) == (3, 1):
+                if response["objective"] is not None or "too long" not in str(response["error"]):
+                    msg = f"Expected a validation error, but got {response}"
+                    raise ValueError(msg)
+                continue
+            expected = {"objective": [float(x**2 + y**2), float((x - 1) ** 2 + (y - 1) ** 2)]}
+            if response != expected:
+                msg = f"Expected {expected} for [{x}, {y}], but got {response}"
+                raise ValueError(msg)
+    stats = server.batcher.stats()
+    if stats["rows"] != len(requests) * 4 - 1 or stats["batches"] >= stats["rows"]:
+        msg = f"Expected the valid solution variables to be batched, but got {stats}"
+        raise ValueError(msg)
+
+
+def test_min_reduction(tmp_path: Path) -> None:
+    """Test the best objective value and the index of its optimum are sent back."""
+    problem = SphereProblem([[0, 0], [1, 1]])
+    server = EvaluationServer(problem, parse_variable, validate_variable_array, reduce="min")
+    responses = asyncio.run(serve_clients(server, tmp_path / "sphere.sock", [[b"[1, 2]\n"], [b"[0, 0]\n"]]))
+    if responses != [[{"objective": 1.0, "optimum": 1}], [{"objective": 0.0, "optimum": 0}]]:
+        msg = f"Expected the best objective values, but got {responses}"
+        raise ValueError(msg)
+
+
+def test_raw_command(tmp_path: Path) -> None:
+    """Test the command serves raw frames on a Unix socket and removes it on SIGTERM."""
+    path = tmp_path / "sphere.sock"
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "opthub_problems.sphere.server", "--socket", str(path), "--format", "raw"],
+        env={**os.environ, "SPHERE_OPTIMA": "[[0, 0], [1, 1]]"},
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while not path.exists():
+            if process.poll() is not None or time.monotonic() > deadline:
+                msg = "The server did not start"
+                raise RuntimeError(msg)
+            time.sleep(0.05)
+
+        async def send_frames() -> list[list[float]]:
+            reader, writer = await asyncio.open_unix_connection(str(path))
+            for variable in ([1.0, 2.0], [3.0, 4.0]):
+                writer.write(RAW_PREFIX.pack(len(variable)) + np.array(variable, dtype=RAW_DTYPE).tobytes())
+            await writer.drain()
+            results = []
+            for _ in range(2):
+                (count,) = RAW_PREFIX.unpack(await reader.readexactly(RAW_PREFIX.size))
+                results.append(np.frombuffer(await reader.readexactly(count * RAW_DTYPE.itemsize), RAW_DTYPE).tolist())
+            writer.close()
+            await writer.wait_closed()
+            return results
+
+        results = asyncio.run(send_frames())
+        if results != [[5.0, 1.0], [25.0, 13.0]]:
+            msg = f"Expected the objective values, but got {results}"
+            raise ValueError(msg)
+
+        process.send_signal(signal.SIGTERM)
+        if process.wait(timeout=10) != 0 or path.exists():
+            msg = "Expected the server to stop and remove its socket"
+            raise ValueError(msg)
+    finally:
+        process.kill()
+        process.wait()
@@ -0,0 +1,54 @@
+"""Test for the streaming of evaluations."""
+
+import io
+import json
+
+from click.testing import CliRunner
+
+from opthub_problems.sphere.main import main
+from opthub_problems.utils.stream import serve_stream
+
+
+def test_serve_stream_reports_errors_per_line() -> None:
+    """Test an invalid line does not stop the stream."""
+
+    def handle(line: str) -> dict[str, float]:
+        return {"objective": float(json.loads(line)) * 2}
+
+    stdin = io.StringIO('1\n"A"\n\n2.5\n')
+    stdout = io.StringIO()
+    serve_stream(handle, stdin, stdout)
+
+    results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    expected_length = 3
+    if len(results) != expected_length:
+        msg = f"Expected 3 results, but got {results}"
+        raise ValueError(msg)
+    if results[0] != {"objective": 2.0} or results[2] != {"objective": 5.0}:
+        msg = f"Expected objectives 2.0 and 5.0, but got {results}"
+        raise ValueError(msg)
+    if results[1]["objective"] is not None or "error" not in results[1]:
+        msg = f"Expected an error, but got {results[1]}"
+        raise ValueError(msg)
+
+
+def test_main_stream() -> None:
+    """Test the stream mode of the sphere problem."""
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["--stream", "--optima", json.dumps([[1, 1]]), "--log-level", "ERROR"],
+        input="[1.5, 2.5]\n[1.5]\n[1, 1]\n",
+    )
+
+    results = [json.loads(line) for line in result.output.splitlines()]
+    expected_length = 3
+    if len(results) != expected_length:
+        msg = f"Expected 3 results, but got {results}"
+        raise ValueError(msg)
+    if results[0] != {"objective": 2.5} or results[2] != {"objective": 0.0}:
+        msg = f"Expected objectives 2.5 and 0.0, but got {results}"
+        raise ValueError(msg)
+    if results[1]["objective"] is not None:
+        msg = f"Expected an error, but got {results[1]}"
+        raise ValueError(msg)